@@ -0,0 +1,259 @@
+"""
+Benchmark harness for pydnacode.
+
+Sweeps the public functions over standard generator matrices (the [8,4] example of the README,
+Reed-Muller codes, an extended BCH code and the extended Golay code) and a grid of constraints
+and GC weights. Every case records the wall time (best of --repeat runs), the peak memory traced
+by tracemalloc in a separate run, and the number of codewords processed per second.
+
+Usage:
+    python benchmarks/bench_pydnacode.py --output results.json
+    python benchmarks/bench_pydnacode.py --save-baseline baseline.json
+    python benchmarks/bench_pydnacode.py --baseline baseline.json --threshold 0.25
+
+Baselines are machine specific, so they are not kept in the repository; save one on the machine
+that runs the comparison. The comparison exits with status 1 when a case is slower than the
+baseline by more than the threshold.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from itertools import combinations
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pydnacode
+
+# Generator matrix of the usage example in the README
+README_8_4 = [[1, 0, 0, 0, 0, 1, 1, 1],
+              [0, 1, 0, 0, 1, 0, 1, 1],
+              [0, 0, 1, 0, 1, 1, 0, 1],
+              [0, 0, 0, 1, 1, 1, 1, 0]]
+
+def reed_muller(order: int, m: int) -> List[List[int]]:
+    """
+    Build the generator matrix of the Reed-Muller code RM(order, m) of length 2^m.
+    The rows are the evaluations of all monomials of degree at most order on F_2^m.
+
+    :param order: The maximum degree of the monomials
+    :param m: The number of variables
+    :return: Generator matrix as a 2D list
+    """
+
+    points = range(2 ** m)
+    rows = []
+    for degree in range(order + 1):
+        for variables in combinations(range(m), degree):
+            rows.append([int(all((x >> v) & 1 for v in variables)) for x in points])
+    return rows
+
+def extended_cyclic(polynomial: int, length: int) -> List[List[int]]:
+    """
+    Build the generator matrix of a cyclic code from its generator polynomial, extended by an
+    overall parity bit.
+
+    :param polynomial: Generator polynomial, bit i is the coefficient of x^i
+    :param length: The length of the cyclic code (the extended code is one longer)
+    :return: Generator matrix as a 2D list
+    """
+
+    degree = polynomial.bit_length() - 1
+    rows = []
+    for shift in range(length - degree):
+        row = [(polynomial >> (i - shift)) & 1 if i >= shift else 0 for i in range(length)]
+        rows.append(row + [sum(row) % 2])
+    return rows
+
+def extended_golay() -> List[List[int]]:
+    """
+    Build the generator matrix of the extended binary Golay code [24, 12, 8] from the
+    Golay polynomial x^11 + x^10 + x^6 + x^5 + x^4 + x^2 + 1.
+
+    :return: Generator matrix as a 2D list
+    """
+
+    return extended_cyclic(0b110001110101, 23)
+
+# name -> generator matrix; all lengths are even so that every DNA function applies
+GENERATORS: Dict[str, Callable[[], List[List[int]]]] = {
+    'readme[8,4]': lambda: README_8_4,
+    'RM(1,4)[16,5]': lambda: reed_muller(1, 4),
+    'eBCH[16,7]': lambda: extended_cyclic(0b111010001, 15),
+    'RM(2,4)[16,11]': lambda: reed_muller(2, 4),
+    'eGolay[24,12]': extended_golay,
+    'RM(1,5)[32,6]': lambda: reed_muller(1, 5),
+}
+
+CONSTRAINT_SETS = [
+    ['reverse'],
+    ['reverse_complement'],
+    ['gc_content'],
+    ['reverse', 'reverse_complement', 'gc_content'],
+]
+
+def _cases(generator_names: List[str], max_dimension: int, max_pairs_dimension: int):
+    # Yield (generator name, function name, params, call, codeword count) for every benchmark case;
+    # the codewords are computed once per generator outside the timed calls
+    for generator_name in generator_names:
+        generator = GENERATORS[generator_name]()
+        k, n = len(generator), len(generator[0])
+        if k > max_dimension:
+            continue
+        size = 2 ** k
+        messages = pydnacode.message(k)
+        code = pydnacode.codewords(messages, generator)
+        params = {'n': n, 'k': k}
+
+        yield generator_name, 'message', params, lambda: pydnacode.message(k), size
+        yield generator_name, 'codewords', params, lambda: pydnacode.codewords(messages, generator), size
+        yield generator_name, 'reverse_code', params, lambda: pydnacode.reverse_code(code), size
+        yield generator_name, 'complement_code', params, lambda: pydnacode.complement_code(code), size
+        yield generator_name, 'weight_gc_enumerator', params, lambda: pydnacode.weight_gc_enumerator(code), size
+        if k <= max_pairs_dimension:
+            yield (generator_name, 'minimum_hamming_distance', params,
+                   lambda: pydnacode.minimum_hamming_distance(code), size)
+
+        for constraints in CONSTRAINT_SETS:
+            gc_weights = [n // 4, n // 2] if 'gc_content' in constraints else [None]
+            for gc_weight in gc_weights:
+                case_params = dict(params, constraints=constraints, gc_weight=gc_weight)
+                yield (generator_name, 'dna_code', case_params,
+                       lambda c=constraints, w=gc_weight: pydnacode.dna_code(generator, c, w), size)
+
+def _measure(call: Callable, repeat: int, memory: bool, min_time: float) -> Dict[str, Optional[float]]:
+    # Best time per call of repeat runs, then one traced call for the peak memory; like timeit,
+    # a run repeats the call until it takes at least min_time so fast cases are not noise
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            call()
+        if time.perf_counter() - start >= min_time:
+            break
+        loops *= 2
+
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        for _ in range(loops):
+            call()
+        best = min(best, (time.perf_counter() - start) / loops)
+
+    peak = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        call()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {'seconds': best, 'peak_bytes': peak}
+
+def run(generator_names: List[str], repeat: int, memory: bool, max_dimension: int,
+        max_pairs_dimension: int, min_time: float = 0.05) -> dict:
+    """
+    Run every benchmark case and collect the results.
+
+    :return: Dictionary with the environment and a list of case results
+    """
+
+    results = []
+    for name, function, params, call, size in _cases(generator_names, max_dimension, max_pairs_dimension):
+        measurement = _measure(call, repeat, memory, min_time)
+        seconds = measurement['seconds']
+        results.append({
+            'id': _case_id(name, function, params),
+            'generator': name,
+            'function': function,
+            'params': params,
+            'codewords': size,
+            'seconds': seconds,
+            'codewords_per_second': size / seconds if seconds > 0 else None,
+            'peak_bytes': measurement['peak_bytes'],
+        })
+        print(f"{results[-1]['id']:<90} {seconds * 1e3:10.2f} ms", flush=True)
+
+    return {
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'numpy': getattr(pydnacode.np, '__version__', None),
+        'repeat': repeat,
+        'min_time': min_time,
+        'results': results,
+    }
+
+def _case_id(name: str, function: str, params: dict) -> str:
+    # Stable identifier used to match cases against a baseline
+    extra = ""
+    if 'constraints' in params:
+        extra = f" constraints={'+'.join(params['constraints'])} gc_weight={params['gc_weight']}"
+    return f"{function} {name}{extra}"
+
+def compare(results: dict, baseline: dict, threshold: float) -> List[str]:
+    """
+    Compare the wall times against a baseline.
+
+    :param threshold: Allowed relative slowdown, e.g. 0.25 for 25%
+    :return: Descriptions of the regressed cases
+    """
+
+    baseline_times = {case['id']: case['seconds'] for case in baseline['results']}
+    regressions = []
+    for case in results['results']:
+        before = baseline_times.get(case['id'])
+        if before is None or before <= 0:
+            continue
+        ratio = case['seconds'] / before
+        if ratio > 1 + threshold:
+            regressions.append(f"{case['id']}: {before * 1e3:.2f} ms -> {case['seconds'] * 1e3:.2f} ms "
+                               f"({ratio:.2f}x)")
+    return regressions
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--generators', nargs='+', choices=list(GENERATORS), default=list(GENERATORS),
+                        help="Generator matrices to benchmark (default: all)")
+    parser.add_argument('--repeat', type=int, default=3, help="Timed runs per case, the best is kept")
+    parser.add_argument('--min-time', type=float, default=0.05,
+                        help="Minimum duration of a timed run in seconds, fast calls are looped")
+    parser.add_argument('--max-dimension', type=int, default=12,
+                        help="Skip generators with more rows than this")
+    parser.add_argument('--max-pairs-dimension', type=int, default=11,
+                        help="Skip the quadratic minimum_hamming_distance above this dimension")
+    parser.add_argument('--no-memory', action='store_true', help="Skip the tracemalloc peak memory run")
+    parser.add_argument('--output', help="Write the results as JSON to this path")
+    parser.add_argument('--save-baseline', help="Write the results as a baseline to this path")
+    parser.add_argument('--baseline', help="Compare the results against this baseline")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="Allowed relative slowdown against the baseline (default 0.25)")
+    args = parser.parse_args(argv)
+
+    results = run(args.generators, args.repeat, not args.no_memory, args.max_dimension,
+                  args.max_pairs_dimension, args.min_time)
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, 'w') as file:
+                json.dump(results, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(results, json.load(file), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+        print("No regressions against the baseline")
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
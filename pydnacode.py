@@ -1,4 +1,25 @@
-from typing import List, Dict, Optional
+import hashlib
+import json
+import mmap
+import numbers
+import operator
+import os
+import random
+import struct
+import time
+import tracemalloc
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import chain, combinations, islice
+from math import comb, sqrt
+from statistics import NormalDist
+from typing import List, Dict, Optional, Iterable, Iterator, Callable, NamedTuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure-Python paths are always available
+    np = None
 
 def message(length: int) -> list:
     # Check if 'length' is of type 'int'
@@ -40,188 +61,457 @@ def message(length: int) -> list:
     # Return the resulting list of binary vectors
     return binary_vectors
 
-def codewords(message: List[List[int]], generator_matrix: List[List[int]]) -> List[List[int]]:
+def codewords(message: Iterable[List[int]], generator_matrix: List[List[int]],
+              backend: str = 'auto', chunk_size: int = 65536) -> List[List[int]]:
     """
     Compute codewords from the given message matrix and generator matrix.
     
-    :param message: 2D list (message matrix) where each row is a binary vector
+    :param message: 2D list (message matrix) where each row is a binary vector, or an iterable
+                    of message rows such as iter_messages(k), which is consumed chunk by chunk
     :param generator_matrix: 2D list (generator matrix) where elements are binary (0 or 1)
+    :param backend: 'python' (XOR of packed generator rows through byte lookup tables),
+                    'numpy' (batched uint8 matrix product mod 2) or 'auto' (NumPy when installed)
+    :param chunk_size: Number of messages validated and encoded per batch
     :return: 2D list (Codeword matrix) where each row is a binary vector
     :raises TypeError: If input are not of the correct types or contain non-integer element
-    :raises ValueError: If input are not binary of dimensions are incompatible
+    :raises ValueError: If input are not binary of dimensions are incompatible, or backend is unknown
     """
     
-    # Check if message and generator_matrix are 2D list 
-    if not all(isinstance(row, list) for row in message) or not all(isinstance(elem, int) for row in message for elem in row):
-        raise TypeError("Message must be a 2D list of integers")
-    
-    if not all(isinstance(row, list) for row in generator_matrix) or not all(isinstance(elem, int) for row in generator_matrix for elem in row):
-        raise TypeError("Generator matrix must be a 2D list of integers")
-    
-    # Check if all elements in message and generator_matrix are binary (0 or 1)
-    if not all(elem in (0, 1) for row in message for elem in row):
-        raise ValueError("Message must be binary (contain only 0s and 1s)")
-    
-    if not all(elem in (0, 1) for row in generator_matrix for elem in row):
-        raise ValueError("Generator matrix must be binary (contain only 0s and 1s)")
-    
-    num_rows_message = len(message)
-    num_cols_message = len(message[0])
+    # Check if generator_matrix is a binary 2D list of integers
+    _validate_binary_matrix(generator_matrix, "Generator matrix")
+
     num_rows_generator = len(generator_matrix)
     num_cols_generator = len(generator_matrix[0])
 
-    # Validate dimensions
-    if not all(len(row) == num_cols_message for row in message):
-        raise ValueError("All rows in the message matrix must have the same number of columns")
-    
-    if num_cols_message != num_rows_generator:
-        raise ValueError("Number of rows in generator matrix mush be equal to number of columns in message")
-    
     if not all(len(row) == num_cols_generator for row in generator_matrix):
         raise ValueError("All rows in generator matrix must have the same number of columns")
-    
-    # Initialize the codeword matrix with zeros
-    codeword_matrix = [[0]*num_cols_generator for _ in range(num_rows_message)]
-
-    # Compute the codeword matrix using matrix multiplication (mod 2)
-    for i in range(num_rows_message):
-        for j in range(num_cols_generator):
-            for k in range(num_rows_generator):
-                codeword_matrix[i][j] += message[i][k] * generator_matrix[k][j]
-            codeword_matrix[i][j] %= 2
+
+    backend = _resolve_backend(backend)
+    if backend == 'numpy':
+        generator_ = np.array(generator_matrix, dtype=np.uint8)
+    else:
+        tables = _encoder_tables(_pack_rows(generator_matrix))
+
+    # A message list is checked as a whole, a message stream one chunk at a time
+    chunks = [message] if isinstance(message, list) else _chunked(message, chunk_size)
+    num_cols_message = None
+    codeword_matrix = []
+
+    for chunk in chunks:
+        # Check if the message rows are binary 2D lists of integers
+        _validate_binary_matrix(chunk, "Message")
+        if not chunk:
+            continue
+
+        # Validate dimensions
+        if num_cols_message is None:
+            num_cols_message = len(chunk[0])
+        if not all(len(row) == num_cols_message for row in chunk):
+            raise ValueError("All rows in the message matrix must have the same number of columns")
+
+        if num_cols_message != num_rows_generator:
+            raise ValueError("Number of rows in generator matrix mush be equal to number of columns in message")
+
+        # Compute the codeword matrix as a batched matrix product (mod 2)
+        if backend == 'numpy':
+            for i in range(0, len(chunk), chunk_size):
+                # uint8 arithmetic wraps modulo 256, which keeps the parity of every sum
+                batch = np.array(chunk[i:i + chunk_size], dtype=np.uint8)
+                codeword_matrix.extend(((batch @ generator_) & 1).tolist())
+            continue
+
+        # Compute the codeword matrix by XOR-accumulating packed generator rows
+        for row in chunk:
+            codeword = _encode_index(_pack_bits(row), tables)
+            codeword_matrix.append(_unpack_bits(codeword, num_cols_generator))
             
     return codeword_matrix
 
-def hamming_distance(codeword1: List[int], codeword2: List[int]) -> int:
+def iter_messages(length: int, order: str = 'gray') -> Iterator[List[int]]:
+    """
+    Generate all binary messages of the given length one at a time.
+    In 'gray' order consecutive messages differ in exactly one bit (the t-th message
+    has index t ^ (t >> 1)); in 'natural' order they come in the same order as message().
+
+    :param length: The length of the messages
+    :param order: 'gray' or 'natural'
+    :return: Iterator over the 2^length messages, each a new 1D list of binary integers
+    :raise TypeError: If 'length' is not an integer
+    :raise ValueError: If order is unknown
+    """
+
+    # Check if 'length' is of type 'int'
+    if not isinstance(length, int):
+        raise TypeError("Argument 'length must be of type 'int'")
+
+    if order not in ('gray', 'natural'):
+        raise ValueError("Order must be either 'gray' or 'natural'")
+
+    if order == 'natural':
+        for index in range(1 << length):
+            yield _unpack_bits(index, length)
+        return
+
+    current_vector = [0] * length
+    yield current_vector.copy()
+
+    # Step t flips the bit whose position (from the right) is the number of trailing zeros of t
+    for t in range(1, 1 << length):
+        current_vector[length - (t & -t).bit_length()] ^= 1
+        yield current_vector.copy()
+
+def iter_codewords(generator_matrix: List[List[int]], order: str = 'gray',
+                   packed: bool = False) -> Iterator:
+    """
+    Generate the codewords of a generator matrix one at a time, without building the message list.
+    In 'gray' order every codeword is the previous one XOR a single generator row.
+    In 'natural' order (the order of codewords(message(k), generator_matrix)) it is the
+    previous one XOR a precomputed suffix sum of generator rows. Either way each step is a single
+    XOR of packed words and memory stays constant.
+
+    :param generator_matrix: 2D list (generator matrix) where elements are binary (0 or 1)
+    :param order: 'gray' or 'natural'
+    :param packed: Yield packed integer codewords instead of lists
+    :return: Iterator over the 2^k codewords
+    :raises TypeError: If the generator matrix is not a 2D list of integers
+    :raises ValueError: If the generator matrix is not binary or rectangular, or order is unknown
+    """
+
+    rows, length = _check_generator(generator_matrix)
+    num_rows = len(rows)
+
+    if order not in ('gray', 'natural'):
+        raise ValueError("Order must be either 'gray' or 'natural'")
+
+    # rows[t] is XORed in when the step number has t trailing zeros
+    rows = rows[::-1]
+    if order == 'natural':
+        # Going from index i-1 to i flips bits 0..t, i.e. the last t+1 generator rows
+        for t in range(1, num_rows):
+            rows[t] ^= rows[t - 1]
+
+    codeword = 0
+    yield codeword if packed else [0] * length
+    for t in range(1, 1 << num_rows):
+        codeword ^= rows[(t & -t).bit_length() - 1]
+        yield codeword if packed else _unpack_bits(codeword, length)
+
+def hamming_distance(codeword1: List[int], codeword2: List[int], validate: bool = True) -> int:
     """
     Compute the Hamming distance between two binary codeword.
 
     :param codeword1: First 1D list (binary vector) where each element is binary (0 or 1)
     :param codeword2: Second 1D list (binary vector) where each element is binary (0 or 1)
+    :param validate: Check the inputs; pass False for codewords that are already known to be valid
     :return: The Hamming distance between codeword1 and codeword2
     :raise TypeError: If input are not 1D lists or containe non-integer elements
     :raise ValueError: If elements are not binary or codewords have different lengths
     """
 
-    # Check if both inputs are 1D lists
-    if not (isinstance(codeword1, list) and isinstance(codeword2, list)):
-        raise TypeError("Both arguments must be 1D lists")
-    
-    # Check if all elements in codeword1 and codeword2 are integers
-    if not all(elem in (0, 1) for elem in codeword1) or not all(elem in (0, 1) for elem in codeword2):
-        raise ValueError("Codewords must be binary (contain only 0s and 1s)")
-    
-    # Check if codeword1 and codeword2 have the same length
-    if len(codeword1) != len(codeword2):
-        raise ValueError("Codeword must be of the same length")
+    if validate:
+        # Check if both inputs are 1D lists
+        if not (isinstance(codeword1, list) and isinstance(codeword2, list)):
+            raise TypeError("Both arguments must be 1D lists")
+        
+        # Check if all elements in codeword1 and codeword2 are binary numbers; the element types
+        # are checked first, since the values of non-numbers (such as nested lists) may not be hashable
+        for codeword in (codeword1, codeword2):
+            if (not all(issubclass(elem_type, numbers.Number) for elem_type in set(map(type, codeword)))
+                    or not set(codeword) <= {0, 1}):
+                raise ValueError("Codewords must be binary (contain only 0s and 1s)")
+        
+        # Check if codeword1 and codeword2 have the same length
+        if len(codeword1) != len(codeword2):
+            raise ValueError("Codeword must be of the same length")
     
     # Compute the Hamming distance
-    hamming_distance = 0
-    length = len(codeword1)
-    for i in range(length):
-        if codeword1[i] != codeword2[i]:
-            hamming_distance += 1
-
-    return hamming_distance
+    return sum(map(operator.ne, codeword1, codeword2))
 
 
-def minimum_hamming_distance(code: List[List[int]]) -> int:
+def minimum_hamming_distance(code: List[List[int]], workers: Optional[int] = None,
+                             validate: bool = True) -> int:
     """
     Determine the minimum Hamming distance of a binary code (a collection of binary codewords).
+    The codewords are packed once and compared tile by tile (see packed_minimum_distance).
 
     :param code: 2D list (matrix of binary codewords) where each row is a binary vector
+    :param workers: Number of worker processes for the pairwise comparison; None compares in this process
+    :param validate: Check the input; pass False for a code that is already known to be valid
     :return: Minimum Hamming distance among all pairs of codewords
     :raise TypeError: If code is not a 2D list or contains non-integer elements
     :raise ValueError: If elements are not binary or rows are of different lengths
     """
 
-    # Check if code is a 2D list and contains only binary elements
-    if not all(isinstance(row, list) for row in code) or not all(isinstance(elem, int) for row in code for elem in row):
-        raise TypeError("Code must be a 2D list of integers")
-    
-    if not all(elem in (0, 1) for row in code for elem in row):
-        raise ValueError("Code must be binary (contain only 0s and 1s)")
-    
-    # Validate that all rows have the same length
-    num_cols = len(code[0])
-    if not all(len(row) == num_cols for row in code):
-        raise ValueError("All codeword must have the same length")
+    if validate:
+        # Check if code is a 2D list and contains only binary elements
+        _validate_binary_matrix(code, "Code")
+        
+        # Validate that all rows have the same length
+        num_cols = len(code[0])
+        if not all(len(row) == num_cols for row in code):
+            raise ValueError("All codeword must have the same length")
+
+    # Compute the minimum Hamming distance on the packed codewords
+    return packed_minimum_distance([_pack_bits(row) for row in code], workers=workers)
+
+def minimum_distance(generator_matrix: List[List[int]]) -> int:
+    """
+    Determine the minimum Hamming distance of the linear code spanned by a generator matrix.
+    For a linear code the minimum distance equals the minimum weight of a nonzero codeword,
+    so no pairs are compared. The search follows Brouwer-Zimmermann: the generator is brought
+    into systematic form on several (as far as possible disjoint) information sets and the
+    combinations of w rows are enumerated for w = 1, 2, ... in each form. Every codeword not seen
+    yet has information weight above w in every form, which gives a lower bound that grows with w;
+    the search stops as soon as it meets the lightest codeword found so far.
+
+    :param generator_matrix: 2D list (generator matrix) where elements are binary (0 or 1)
+    :return: The minimum distance, or float('inf') if the rows only span the zero codeword.
+             If the rows are linearly dependent, codewords() repeats every codeword and
+             minimum_hamming_distance of that list is 0; this function returns the distance
+             of the code itself.
+    :raise TypeError: If the generator matrix is not a 2D list of integers
+    :raise ValueError: If the generator matrix is not binary or rows have different lengths
+    """
+
+    # Check if generator_matrix is a binary 2D list of integers
+    rows, length = _check_generator(generator_matrix)
+
+    basis, pivots, _ = _row_reduce(rows, length, range(length))
+    rank = len(basis)
+    if rank == 0:
+        return float('inf')
+
+    # Systematic forms on successive information sets, preferring columns not used before
+    forms = []
+    used = set()
+    while True:
+        order = [c for c in range(length) if c not in used] + sorted(used)
+        rows, pivots, _ = _row_reduce(basis, length, order)
+        fresh = sum(1 for c in pivots if c not in used)
+        if fresh == 0:
+            break
+        forms.append((rows, rank - fresh))
+        used.update(pivots)
+
+    upper = min(row.bit_count() for row in basis)
+
+    for w in range(1, rank + 1):
+        for j, (rows, overlap) in enumerate(forms):
+            upper = min(upper, _min_combination_weight(rows, w, upper))
+
+            # Forms up to j are done for weight w, the others for weight w - 1
+            lower = sum(max(0, w + 1 - overlap_) for rows_, overlap_ in forms[:j + 1])
+            lower += sum(max(0, w - overlap_) for rows_, overlap_ in forms[j + 1:])
+            if upper <= lower:
+                return upper
+
+    return upper
+
+def packed_minimum_distance(code: Iterable[int], workers: Optional[int] = None,
+                            tile_size: int = 1024) -> int:
+    """
+    Determine the minimum Hamming distance of a packed code by comparing all pairs.
+    This is needed for codes that are not linear, such as the output of dna_code.
+    The pair matrix is cut into square tiles of tile_size codewords that can run on a process pool.
+
+    :param code: PackedCode, MappedCode or iterable of packed codewords
+    :param workers: Number of worker processes; None compares all tiles in this process
+    :param tile_size: Number of codewords per tile side
+    :return: Minimum Hamming distance among all pairs of codewords (float('inf') for fewer than two)
+    """
+
+    tiles = _run_distance_tiles(_tile_source(code), 'min', None, workers, tile_size)
+    return min(tiles, default=float('inf'))
+
+def has_minimum_distance(code: Iterable[int], distance: int, workers: Optional[int] = None,
+                         tile_size: int = 1024) -> bool:
+    """
+    Check whether every pair of codewords of a packed code is at least distance apart.
+    The check stops at the first violating pair, and pending tiles are cancelled.
+
+    :param code: PackedCode or iterable of packed codewords
+    :param distance: The required minimum distance
+    :param workers: Number of worker processes; None compares all tiles in this process
+    :param tile_size: Number of codewords per tile side
+    :return: True if the minimum distance of the code is at least distance
+    """
+
+    violations = _run_distance_tiles(_tile_source(code), 'below', distance, workers, tile_size)
+    return not any(violations)
+
+def distance_distribution(code: Iterable[int], workers: Optional[int] = None,
+                          tile_size: int = 1024) -> Dict[int, int]:
+    """
+    Count the pairs of codewords of a packed code at each Hamming distance.
+
+    :param code: PackedCode, MappedCode or iterable of packed codewords
+    :param workers: Number of worker processes; None compares all tiles in this process
+    :param tile_size: Number of codewords per tile side
+    :return: Dictionary mapping each distance to its number of unordered pairs, sorted by distance
+    """
+
+    term_counts: Dict[int, int] = {}
+    for tile in _run_distance_tiles(_tile_source(code), 'histogram', None, workers, tile_size):
+        for distance, count in tile.items():
+            term_counts[distance] = term_counts.get(distance, 0) + count
+
+    return dict(sorted(term_counts.items()))
+
+class DnaDistances(NamedTuple):
+    """
+    Minimum distances of a code under the DNA constraints, returned by dna_distances.
+    """
+
+    hamming: float
+    reverse: float
+    reverse_complement: float
+
+def _dna_tile_source(code, length: Optional[int]) -> "_DnaTileWords":
+    # Collect the packed words together with their reverses, both in one bulk reversal
+    if isinstance(code, (PackedCode, MappedCode)):
+        length = code.length
+    elif length is None:
+        raise ValueError("Argument 'length' is required for a plain iterable of packed codewords")
+    words = list(code)
+    for word in words:
+        _check_packed(word, length, even=True)
+    return _DnaTileWords(words, _reverse_words(words, length), length)
+
+def dna_distances(code: Iterable[int], length: Optional[int] = None, workers: Optional[int] = None,
+                  tile_size: int = 1024) -> DnaDistances:
+    """
+    Determine the minimum distances of a packed code that matter for DNA codes in one pass over all pairs:
+    min d(x, y) over x != y, and min d(x, R(y)) and min d(x, RC(y)) over all x, y including x = y,
+    where R and RC are the reverse and reverse-complement of reverse_code and complement_code.
+    Because RC(y) is R(y) with every bit flipped, d(x, RC(y)) = length - d(x, R(y)), so both reverse
+    terms come out of the same popcounts. Both terms are symmetric in x and y, which means that
+    only the upper triangle of the pair matrix is compared, as in packed_minimum_distance.
+
+    :param code: PackedCode, MappedCode or iterable of packed codewords
+    :param length: The length of the codewords in bits; only needed for a plain iterable
+    :param workers: Number of worker processes; None compares all tiles in this process
+    :param tile_size: Number of codewords per tile side
+    :return: DnaDistances(hamming, reverse, reverse_complement), float('inf') where there are no pairs
+    :raise ValueError: If length is missing or odd, or a codeword does not fit in length bits
+    """
 
-    min_distance = float('inf')
-    num_codewords = len(code)
+    # An empty code has no tiles, so the minimum of each term is taken separately
+    tiles = _run_distance_tiles(_dna_tile_source(code, length), 'dna', None, workers, tile_size)
+    return DnaDistances(*(min((tile[term] for tile in tiles), default=float('inf')) for term in range(3)))
 
-    # Compute the minimum Hamming distance
-    for i in range(num_codewords):
-        for j in range(i+1, num_codewords):
-            distance = hamming_distance(code[i], code[j])
-            if distance < min_distance:
-                min_distance = distance
+def has_dna_distance(code: Iterable[int], distance: int, reverse: bool = True,
+                     reverse_complement: bool = True, length: Optional[int] = None,
+                     workers: Optional[int] = None, tile_size: int = 1024) -> bool:
+    """
+    Check whether a packed code satisfies the DNA distance constraints for distance:
+    d(x, y) >= distance for x != y and, when enabled, d(x, R(y)) >= distance and
+    d(x, RC(y)) >= distance for all x and y, including x = y.
+    The check stops at the first violating pair, and pending tiles are cancelled.
+
+    :param code: PackedCode, MappedCode or iterable of packed codewords
+    :param distance: The required minimum distance
+    :param reverse: Check the reverse constraint
+    :param reverse_complement: Check the reverse-complement constraint
+    :param length: The length of the codewords in bits; only needed for a plain iterable
+    :param workers: Number of worker processes; None compares all tiles in this process
+    :param tile_size: Number of codewords per tile side
+    :return: True if all enabled constraints hold
+    :raise ValueError: If length is missing or odd, or a codeword does not fit in length bits
+    """
 
-    return min_distance
+    # A threshold of 0 disables a constraint, no distance is below it
+    thresholds = (distance, distance if reverse else 0, distance if reverse_complement else 0)
+    violations = _run_distance_tiles(_dna_tile_source(code, length), 'dna_below', thresholds,
+                                     workers, tile_size)
+    return not any(violations)
 
-def weight_codeword(codeword: List[int]) -> int:
+def weight_codeword(codeword: List[int], validate: bool = True) -> int:
     """
     Calculate the weight of a binary vector.
     The weight is the number of non-zero elements in the codeword.
 
     :param codeword: 1D list (binary vector) where each element is binary (0 or 1)
+    :param validate: Check the input; pass False for a codeword that is already known to be valid
     :return: The weight of the codeword, which is the number of 1s in the codeword
     :raise TypeError: If the input is not a 1D list or contains non-integer elements
     :raise ValueError: If elements are not binary
     """
 
-    # Check if input is a 1D list
-    if not isinstance(codeword, list):
-        raise TypeError("Input must be a 1D list")
-    
-    # Check if all element in the codeword are integers
-    if not all(isinstance(elem, int) for elem in codeword):
-        raise TypeError("All elements in the codeword must be integers")
-    
-    # Check if all element in the codeword are binary (0 or 1)
-    if not all(elem in (0, 1) for elem in codeword):
-        raise ValueError("Codeword must be binary (contain only 0s and 1s)")
+    if validate:
+        _validate_binary_vector(codeword)
     
     # Compute the weigth of the codeword
-    weight = sum(1 for i in codeword if i != 0)
-
-    return weight
+    return codeword.count(1)
 
-def weight_code(code: List[List[int]]) -> List[int]:
+def weight_code(code: List[List[int]], validate: bool = True) -> List[int]:
     """
     Calculate the weight of each binary codeword in a code (a collection of binary codeword).
     The weight of a codeword is the number of non-zero elements (1s) in the codeword.
 
     :param code: 2D list (a collection of binary codewords) where each row is a binary vectors
+    :param validate: Check the input once; pass False for a code that is already known to be valid
     :return: A list of weight, where each weight corresponds to the weight of a codewords
     :raise TypeError: If the input is not a 2D list or contains non-integers elements
     :raise ValueError: If elements are not binary or rows have different lengths
     """
 
-    # Check if input is a 2D list
-    if not all(isinstance(row, list) for row in code):
-        raise TypeError("Input must be a 2D list of binary codewords")
-    
-    # Check if all elements in the 2D list are integers
-    if not all(isinstance(elem, int) for row in code for elem in row):
-        raise TypeError("All elements in the codeword must be integers")
-    
-    # Check if all elements in the 2D list are binary (0 or 1)
-    if not all(elem in (0, 1) for row in code for elem in row):
-        raise ValueError("Codewords must be binary (contain only 0s and 1s)")
-    
-    # Validate that all rows have the same length
-    num_cols = len(code[0])
-    if not all(len(row) == num_cols for row in code):
-        raise ValueError("All codewords must have the same length")
+    if validate:
+        _validate_binary_code(code, "Input must be a 2D list of binary codewords", "Codewords")
     
     # Calculate the weight of each codeword
-    list_wt = [sum(1 for elem in codeword if elem != 0) for codeword in code]
+    list_wt = [codeword.count(1) for codeword in code]
 
     return list_wt
 
 
-def reverse_codeword(codeword: List[int]) -> List[int]:
+def weight_enumerator(generator_matrix: List[List[int]], backend: str = 'auto') -> Dict[int, int]:
+    """
+    Compute the Hamming weight distribution of codewords(message(k), generator_matrix)
+    without storing any codeword. The code is walked in Gray-code order, so each codeword is the
+    previous one XOR a single generator row and its weight a popcount (or, with NumPy, chunks of
+    the code are encoded as word arrays and histogrammed). When n - k < k the dual code is
+    enumerated instead and transformed with the MacWilliams identities.
+    For a linear code this is also the distance distribution: every codeword has the same
+    number of codewords at each distance.
+
+    :param generator_matrix: 2D list (generator matrix) where elements are binary (0 or 1)
+    :param backend: 'python', 'numpy' or 'auto' (see codewords)
+    :return: Dictionary mapping each weight to its number of codewords, sorted by weight
+    :raise TypeError: If the generator matrix is not a 2D list of integers
+    :raise ValueError: If the generator matrix is not binary or rectangular, or backend is unknown
+    """
+
+    rows, length = _check_generator(generator_matrix)
+    backend = _resolve_backend(backend)
+
+    basis, pivots, kernel = _row_reduce(rows, length, range(length))
+    distribution = _weight_distribution(basis, pivots, length, backend)
+
+    # Dependent generator rows repeat every codeword the same number of times
+    multiplicity = 1 << len(kernel)
+
+    return {weight: count * multiplicity for weight, count in distribution.items()}
+
+def format_weight_enumerator(distribution: Dict[int, int], length: int) -> str:
+    """
+    Format a Hamming weight distribution as the polynomial sum of A_w x^(n-w) y^w,
+    in the style of weight_gc_enumerator.
+
+    :param distribution: Dictionary mapping each weight to its number of codewords
+    :param length: The length of the codewords
+    :return: A string representation of the weight enumerator
+    """
+
+    terms = []
+    for weight, count in sorted(distribution.items(), reverse=True):
+        if count == 0:
+            continue
+        coefficient = "" if count == 1 else str(count)
+        terms.append(f"{coefficient}x^{length - weight} y^{weight}")
+
+    return " + ".join(terms)
+
+def reverse_codeword(codeword: List[int], validate: bool = True) -> List[int]:
     """
     Reverse the given binary codeword according to a specific pattern:
     - For even indices (1-based), reverse the position by subtracting the current index minus 2 from the length of the codeword
@@ -229,208 +519,153 @@ def reverse_codeword(codeword: List[int]) -> List[int]:
     Ensures that the codeword has an even length and is binary
 
     :param codeword: A 1D list of binary integers (0 or 1)
+    :param validate: Check the input; pass False for a codeword that is already known to be valid
     :return: The reversed codeword as a new list of binary integers
     :raise TypeError: If the input is not a 1D list or contains non-integer elements
     :raise ValueError: If elements are not binary or if the length of the codeword is not even
     """
 
-    # Check if input is a 1D list
-    if not isinstance(codeword, list):
-        raise TypeError("Input must be a 1D list")
-    
-    # Check if all elements in the list are integers
-    if not all(isinstance(elem, int) for elem in codeword):
-        raise TypeError("All elements in the codeword must be integers")
-    
-    # Check if all elements in the list are binary (0 or 1)
-    if not all(elem in (0, 1) for elem in codeword):
-        raise ValueError("Codeword must be binary (contain only 0s and 1s)")
-    
-    # Ensure that the length of the codeword is even
-    if len(codeword) % 2 != 0:
-        raise ValueError("The length of the codeword must be even")
+    if validate:
+        _validate_binary_vector(codeword, even=True)
     
     length = len(codeword)
-    reverse_codeword_ = []
+    if length < 2:
+        return []
 
-    # Reverse the codeword according to the specified pattern
-    for i in range(1, length + 1):
-        if i%2 == 0:
-            idx_reverse = length - (i - 2)
-        else:
-            idx_reverse = length - i
-        reverse_codeword_.append(codeword[idx_reverse - 1])
+    # Reverse the codeword according to the specified pattern, i.e. reverse the order of the
+    # bit pairs; the index permutation is computed once per length
+    reverse_codeword_ = list(_reverse_permutation(length)(codeword))
 
     return reverse_codeword_
 
-def reverse_code(code: List[List[int]]) -> List[List[int]]:
+def reverse_code(code: List[List[int]], validate: bool = True) -> List[List[int]]:
     """
     Reverse each codeword in the binary code using the reverse_codeword function
     Ensures that each codeword is binary, has the same length, and that length is even
 
     :param code: A 2D list where each row is a binary codeword
+    :param validate: Check the input once; pass False for a code that is already known to be valid
     :return: A new 2D list where each codeword has been reversed
     :raise TypeError: If the input is not a 2D list or contains con-integers elements
     :raise ValueError: If elements are not binary, rows have different lengths, or codeword length is not even
     """
 
-    # Check if input is a 2D list
-    if not all(isinstance(row, list) for row in code):
-        raise TypeError("Input must be a 2D list of binary codeword")
-    
-    # Check if all elements in the 2D list are integers
-    if not all(isinstance(elem, int) for row in code for elem in row):
-        raise TypeError("All elements in the codewords must be integers")
-    
-    # Check if all elements in the 2D list are binary (0 or 1)
-    if not all(elem in (0, 1) for row in code for elem in row):
-        raise ValueError("Codewords must be binary (containt only 0s and 1s)")
-    
-    # Validate that all rows have the same length
-    num_cols = len(code[0])
-    if not all(len(row) == num_cols for row in code):
-        raise ValueError("All codewords must have the same length")
-    
-    # Ensure that the length of each codeword is even
-    if num_cols % 2 != 0:
-        raise ValueError("The length of each codeword must be even")
+    if validate:
+        _validate_binary_code(code, "Input must be a 2D list of binary codeword", "Codewords", even=True)
     
-    reverse_code_ = []
-
-    # Apply reverse_codeword function to each row (codeword) in the code
-    for row in code:
-        reverse_row = reverse_codeword(row)
-        reverse_code_.append(reverse_row)
+    # Apply reverse_codeword function to each row (codeword) in the code, validated once above
+    reverse_code_ = [reverse_codeword(row, validate=False) for row in code]
 
     return reverse_code_
 
-def complement_codeword(codeword: List[int]) -> List[int]:
+def complement_codeword(codeword: List[int], validate: bool = True) -> List[int]:
     """
     Calculate the complement of the given binary codeword.
     Ensures that the codeword is a 1D list of binary integers with an even length
 
     :param codeword: A 1D list of binary integers (0 or 1)
+    :param validate: Check the input; pass False for a codeword that is already known to be valid
     :return: A new list representing the complement of the input codeword
     :raise TypeError: If the input is not a 1D list or contains non-integer elements
     :raise ValueError: If elements are not binary of if the length of the codeword is not even
     """
 
-    # Check if input is a 1D list
-    if not isinstance(codeword, list):
-        raise TypeError("Input must be a 1D list")
-    
-    # Check if all elements in the list are integers
-    if not all(isinstance(elem, int) for elem in codeword):
-        raise TypeError("All elements in the codeword must be integers")
-    
-    # Check if all elements is the list are binary (0 or 1)
-    if not all(elem in (0, 1) for elem in codeword):
-        raise ValueError("Codeword must be binary (contain only 0s and 1s)")
-    
-    # Ensure that the length of the codeword is even
-    if len(codeword) % 2 != 0:
-        raise ValueError("The length of the codeword must be even")
-    
-    length = len(codeword)
+    if validate:
+        _validate_binary_vector(codeword, even=True)
 
     # Calculate the complement by flipping each bit
     complement = [(elem + 1)%2 for elem in codeword]
 
     return complement
 
-def complement_code(code: List[List[int]]) -> List[List[int]]:
+def complement_code(code: List[List[int]], validate: bool = True) -> List[List[int]]:
     """
     Calculate the complement of each codeword in the code.
     Ensure that the code is a 2D list of binary integers with each codeword having an even length.
 
     :param code: A 2D list where each row is a binary codeword
+    :param validate: Check the input once; pass False for a code that is already known to be valid
     :return: A new 2D list where each codeword is complemented
     :raise TypeError: If the input is not a 2D list or contains non-integers elements
     :raise ValueError: If elements are not binary, rows have different lengths, or codeword length is not even
     """
 
-    # Check if input is a 2D list
-    if not all(isinstance(row, list) for row in code):
-        raise TypeError("Input must be a 2D list of binary codewords")
-    
-    # Check if all elmeent in the 2D list are integers
-    if not all(isinstance(elem, int) for row in code for elem in row):
-        raise TypeError("All elements in the codewords must be integers")
-    
-    # Check if all elements in the 2d list are binary (0 or 1)
-    if not all(elem in (0, 1) for row in code for elem in row):
-        raise ValueError("Codeword must be binary (contain only 0s and 1s)")
-    
-    # Validate that all codeword have the same length
-    num_cols = len(code[0])
-    if not all(len(row) == num_cols for row in code):
-        raise ValueError("All codewords must have the same length")
-    
-    # Ensure that the length of each codeword is even
-    if num_cols % 2 != 0:
-        raise ValueError("The length of each codeword must be even")
+    if validate:
+        _validate_binary_code(code, "Input must be a 2D list of binary codewords", "Codeword", even=True)
     
-    # Apply complement_codeword function to each row (codeword) in the code
-    complement = [complement_codeword(row) for row in code]
+    # Apply complement_codeword function to each row (codeword) in the code, validated once above
+    complement = [complement_codeword(row, validate=False) for row in code]
 
     return complement
 
-def weight_gc_codeword(codeword: List[int]) -> int:
+def weight_gc_codeword(codeword: List[int], validate: bool = True) -> int:
     """
     Calculate the GC-content weight of the given binary codeword.
     The weight is defined as the number of 'GC' (01) or 'CG' (10) pairs in the codeword.
 
     :param codeword: A 1D list representing a binary codeword
+    :param validate: Check the input; pass False for a codeword that is already known to be valid
     :return: The GC-content weight of the codeword
     :raises ValueError: If the codeword's length is not even or contains non-binary values
     """
-    # Ensure the length of the codeword is even
-    if len(codeword) % 2 != 0:
-        raise ValueError("The length of the codeword must be even")
-    
-    # Check if all elements in the codeword are binary (0 or 1)
-    if not all(bit in (0, 1) for bit in codeword):
-        raise ValueError("Codeword must be binary (contain only 0s and 1s)")
-    
-    weight_gc = 0
+
+    if validate:
+        # Ensure the length of the codeword is even
+        if len(codeword) % 2 != 0:
+            raise ValueError("The length of the codeword must be even")
+        
+        # Check if all elements in the codeword are binary (0 or 1); the element types are checked
+        # first, since the values of non-numbers (such as nested lists) may not be hashable
+        if (not all(issubclass(elem_type, numbers.Number) for elem_type in set(map(type, codeword)))
+                or not set(codeword) <= {0, 1}):
+            raise ValueError("Codeword must be binary (contain only 0s and 1s)")
     
-    # Calculate the GC-content weight
-    for i in range(0, len(codeword), 2):
-        if [codeword[i], codeword[i + 1]] in ([0, 1], [1, 0]):
-            weight_gc += 1
+    # Calculate the GC-content weight: a pair counts when its two bits differ
+    weight_gc = sum(map(operator.ne, codeword[0::2], codeword[1::2]))
     
     return weight_gc
 
-def weight_gc_code(codewords: List[List[int]]) -> List[int]:
+def weight_gc_code(codewords: List[List[int]], validate: bool = True) -> List[int]:
     """
     Calculate the GC-content weight for each codeword in a list of binary codewords.
     The weight is defined as the number of 'GC' (01) or 'CG' (10) pairs in each codeword.
 
     :param codewords: A 2D list where each row is a binary codeword
+    :param validate: Check the input once; pass False for codewords that are already known to be valid
     :return: A list of GC-content weights corresponding to each codeword
     :raises ValueError: If any codeword has an odd length or contains non-binary values
     """
+
+    if validate:
+        # Ensure the length of every codeword is even
+        if any(len(codeword) % 2 != 0 for codeword in codewords):
+            raise ValueError("The length of the codeword must be even")
+
+        # Check if all elements in the codewords are binary (0 or 1), element types first as above
+        elem_types = set(map(type, chain.from_iterable(codewords)))
+        if (not all(issubclass(elem_type, numbers.Number) for elem_type in elem_types)
+                or not set().union(*codewords) <= {0, 1}):
+            raise ValueError("Codeword must be binary (contain only 0s and 1s)")
     
-    # Calculate the GC-content weight for each codeword in the list
-    weight_gc_list = []
-    for codeword in codewords:
-        weight_gc_list.append(weight_gc_codeword(codeword))
+    # Calculate the GC-content weight for each codeword in the list, validated once above
+    weight_gc_list = [weight_gc_codeword(codeword, validate=False) for codeword in codewords]
     
     return weight_gc_list
 
-def weight_gc_enumerator(codewords: List[List[int]]) -> str:
+def weight_gc_enumerator(codewords: List[List[int]], validate: bool = True) -> str:
     """
     Calculate the GC-content weight enumerator for a set of binary codewords.
     The enumerator is expressed as a polynomial where the exponents represent 
     the GC-content and the coefficients represent the number of codewords with that GC-content.
 
     :param codewords: A 2D list where each row is a binary codeword
+    :param validate: Check the input once; pass False for codewords that are already known to be valid
     :return: A string representation of the GC-content weight enumerator
     :raises ValueError: If any codeword has an odd length or contains non-binary values
     """
 
     term_counts: Dict[int, int] = {}
-    weights = weight_gc_code(codewords)
+    weights = weight_gc_code(codewords, validate=validate)
     length = len(codewords[0])
 
     # Count occurrences of each GC-content weight
@@ -440,10 +675,24 @@ def weight_gc_enumerator(codewords: List[List[int]]) -> str:
         else:
             term_counts[weight_gc] = 1
 
+    return format_gc_enumerator(term_counts, length)
+
+def format_gc_enumerator(distribution: Dict[int, int], length: int) -> str:
+    """
+    Format a GC-content weight distribution as the polynomial string of weight_gc_enumerator.
+
+    :param distribution: Dictionary mapping each GC-content weight to its number of codewords
+    :param length: The length of the codewords
+    :return: A string representation of the GC-content weight enumerator
+    """
+
     GCW = []
 
     # Sort the terms and format the polynomial
-    for weight_gc, count in sorted(term_counts.items(), key=lambda item: (-item[0], item[1])):
+    for weight_gc, count in sorted(distribution.items(), key=lambda item: (-item[0], item[1])):
+        if count == 0:
+            continue
+
         a = (length / 2) - weight_gc
         b = weight_gc
 
@@ -454,109 +703,2866 @@ def weight_gc_enumerator(codewords: List[List[int]]) -> str:
 
     return " + ".join(GCW)
 
-def dna_code(generator_matrix: List[List[int]],
-             constraints: List[str] = ['reverse', 'reverse_complement', 'gc_content'],
-             gc_weight: Optional[int] = None) -> List[List[int]]:
+def gc_weight_distribution(generator_matrix: List[List[int]]) -> Dict[int, int]:
     """
-    Generates a DNA code based on the provided generator matrix and constraints.
+    Compute the GC-content weight distribution of codewords(message(k), generator_matrix)
+    from the generator matrix alone, without materializing any codeword.
+    In the GC-indicator domain (one bit per pair, set for 'GC'/'CG') the GC-content weight is a
+    Hamming weight, so the distribution is the weight distribution of the indicator code, times
+    the number of messages sharing each indicator. That distribution is enumerated directly when
+    the indicator code has small dimension, and otherwise obtained from its dual code with the
+    MacWilliams identities.
 
-    :param generator_matrix: A 2D list representing the generator matrix
-    :param constraints: A list of constraints that must be applied; can include 'reverse', 
-                        'reverse complement', 'gc-content'
-    :param gc_weight: Optional parameter required if 'gc-content' is one of the constraints.
-    :return: A list of codewords satisfying the given constraints.
-    :raises ValueError: If 'gc-content' is selected without specifying gc_weight, or if an invalid constraint is provided.
+    :param generator_matrix: 2D list (generator matrix) where elements are binary (0 or 1)
+    :return: Dictionary mapping each GC-content weight to its number of codewords, sorted by weight
+    :raises TypeError: If the generator matrix is not a 2D list of integers
+    :raises ValueError: If the generator matrix is not binary or rectangular, or its length is not even
     """
 
-    # Validate the constraints
-    valid_constraints = {'reverse', 'reverse_complement', 'gc_content'}
-    if not set(constraints).issubset(valid_constraints):
-        raise ValueError(f"Constraints must be a subset of {valid_constraints}")
-    
-    # Check if 'gc-content' constraint is selected but gc_weight is not provided
-    if 'gc_content' in constraints and gc_weight is None:
-        raise ValueError("The 'gc_content' constraint requires a gc_weight parameter.")
-    
-    length = len(generator_matrix)
-    message_ = message(length=length)
-    code_ = codewords(message=message_, generator_matrix=generator_matrix)
-
-    def reverse_constraint(code = code_):
-        reverse_code_ = reverse_code(code)
-        counts = len(code)
-        code_no_sr = []
-        
-        for i in range(counts):
-            if code[i] != reverse_code_[i]:
-                if reverse_code_[i] not in code_no_sr:
-                    code_no_sr.append(code[i])
-            
+    rows, length = _check_generator(generator_matrix)
 
-        return code_no_sr
-            
+    # Ensure that the length of each codeword is even
+    if length % 2 != 0:
+        raise ValueError("The length of each codeword must be even")
 
-    def reverse_complement_constraint(code=code_):
-        complement_code_ = complement_code(code)
-        reverse_complement_code_ = reverse_code(complement_code_)
-        counts = len(code)
-        code_no_src = []
+    indicators = [_gc_indicator(row, length) for row in rows]
+    basis, pivots, kernel = _row_reduce(indicators, length // 2, range(length // 2))
 
-        for i in range(counts):
-            if code[i] != reverse_complement_code_[i]:
-                if reverse_complement_code_[i] not in code_no_src:
-                    code_no_src.append(code[i])
+    distribution = _weight_distribution(basis, pivots, length // 2)
+    multiplicity = 1 << len(kernel)
 
-        return code_no_src
-    
-    def gc_content_constraint(code=code_, gc_weight=gc_weight):
-        code_gc = []
-        counts = len(code)
-
-        for i in range(counts):
-            gc_weight_codeword_ = weight_gc_codeword(code[i])
-            if gc_weight_codeword_ == gc_weight:
-                code_gc.append(code[i])
-        
-        return code_gc
+    return {weight: count * multiplicity for weight, count in distribution.items()}
 
-    # With reverse constraint
-    if 'reverse' in constraints and 'reverse_complement' not in constraints and 'gc_content' not in constraints:
-        code_dna_ = reverse_constraint(code=code_)
-        return code_dna_
+def weight_gc_enumerator_from_generator(generator_matrix: List[List[int]]) -> str:
+    """
+    Calculate the GC-content weight enumerator of codewords(message(k), generator_matrix)
+    from the generator matrix (see gc_weight_distribution).
 
-    # With reverse complement constraint
-    elif 'reverse' not in constraints and 'reverse_complement' in constraints and 'gc_content' not in constraints:
-        code_dna_ = reverse_complement_constraint(code=code_)
-        return code_dna_
-    
-    # With gc content constraint
-    elif 'reverse' not in constraints and 'reverse_complement' not in constraints and 'gc_content' in constraints:
-        code_dna_ = gc_content_constraint(code=code_)
-        return code_dna_
-    
-    # With reverse constraint and reverse complement constraint
-    elif 'reverse' in constraints and 'reverse_complement' in constraints and 'gc_content' not in constraints:
-        code_dna_ = reverse_constraint(code=code_)
-        code_dna_ = reverse_complement_constraint(code=code_dna_)
-        return code_dna_
-    
-    # with reverse constraint and gc content constraint
-    elif 'reverse' in constraints and 'reverse_complement' not in constraints and 'gc_content' in constraints:
-        code_dna_ = reverse_constraint(code=code_)
-        code_dna_ = gc_content_constraint(code=code_dna_)
-        return code_dna_
-    
-    # with reverse complement constraint and gc content constraint
-    elif 'reverse' not in constraints and 'reverse_complement' in constraints and 'gc_content' in constraints:
-        code_dna_ = reverse_complement_constraint(code=code_)
-        code_dna_ = gc_content_constraint(code=code_dna_)
-        return code_dna_
-    
-    # with reverse contraint, reverse complement constraint, and gc content constraint
-    elif 'reverse' in constraints and 'reverse_complement' in constraints and 'gc_content' in constraints:
-        code_dna_ = reverse_constraint(code=code_)
-        code_dna_ = reverse_complement_constraint(code=code_dna_)
-        code_dna_ = gc_content_constraint(code=code_dna_)
-        return code_dna_
-
-    
\ No newline at end of file
+    :param generator_matrix: 2D list (generator matrix) where elements are binary (0 or 1)
+    :return: A string representation of the GC-content weight enumerator, as in weight_gc_enumerator
+    :raises ValueError: If the generator matrix is not binary or rectangular, or its length is not even
+    """
+
+    return format_gc_enumerator(gc_weight_distribution(generator_matrix), len(generator_matrix[0]))
+
+def gc_weight_codewords(generator_matrix: List[List[int]], gc_weight: int,
+                        packed: bool = False) -> list:
+    """
+    Enumerate only the codewords with a given GC-content weight, without encoding the whole code.
+    The generator is mapped into the GC-indicator domain (one bit per pair, set for 'GC'/'CG'),
+    where the GC-content weight is an ordinary Hamming weight; the subsets of a reduced basis are
+    searched with weight bounds that prune branches that cannot reach gc_weight.
+
+    :param generator_matrix: 2D list (generator matrix) where elements are binary (0 or 1)
+    :param gc_weight: The GC-content weight of the codewords to enumerate
+    :param packed: Return packed integer codewords instead of lists
+    :return: The codewords with GC-content weight gc_weight, in the order of codewords(message(k), generator_matrix)
+    :raises TypeError: If the generator matrix is not a 2D list of integers or gc_weight is not a number
+    :raises ValueError: If the generator matrix is not binary or rectangular, or its length is not even
+    """
+
+    rows, length = _check_generator(generator_matrix)
+
+    gc_weight = _integral_gc_weight(gc_weight)
+
+    # Ensure that the length of each codeword is even
+    if length % 2 != 0:
+        raise ValueError("The length of each codeword must be even")
+
+    # No codeword has a non-integral GC weight
+    if gc_weight is None:
+        return []
+
+    num_rows = len(rows)
+    basis, kernel_span, shift = _gc_domain(rows, length)
+    found = []
+
+    def visit(word: int) -> None:
+        # Every kernel combination keeps the GC pattern of the word
+        found.extend(word ^ kernel for kernel in kernel_span)
+
+    _gc_weight_search(basis, shift, length // 2, gc_weight, visit)
+
+    # Sort by message index to restore the message order
+    code_mask = (1 << length) - 1
+    message_mask = (1 << num_rows) - 1
+    found.sort(key=lambda word: word & message_mask)
+    words = [(word >> num_rows) & code_mask for word in found]
+
+    return words if packed else [_unpack_bits(word, length) for word in words]
+
+def count_gc_weight_codewords(generator_matrix: List[List[int]], gc_weight: int) -> int:
+    """
+    Count the codewords of codewords(message(k), generator_matrix) with a given GC-content weight
+    without enumerating them (see gc_weight_codewords).
+
+    :param generator_matrix: 2D list (generator matrix) where elements are binary (0 or 1)
+    :param gc_weight: The GC-content weight to count
+    :return: Number of codewords with GC-content weight gc_weight
+    :raises TypeError: If the generator matrix is not a 2D list of integers or gc_weight is not a number
+    :raises ValueError: If the generator matrix is not binary or rectangular, or its length is not even
+    """
+
+    rows, length = _check_generator(generator_matrix)
+
+    gc_weight = _integral_gc_weight(gc_weight)
+
+    # Ensure that the length of each codeword is even
+    if length % 2 != 0:
+        raise ValueError("The length of each codeword must be even")
+
+    # No codeword has a non-integral GC weight
+    if gc_weight is None:
+        return 0
+
+    basis, kernel_span, shift = _gc_domain(rows, length)
+    count = 0
+
+    def visit(word: int) -> None:
+        nonlocal count
+        count += 1
+
+    _gc_weight_search(basis, shift, length // 2, gc_weight, visit)
+
+    return count * len(kernel_span)
+
+def _reverse_constraint(length: int, gc_weight: Optional[int]) -> Callable[[int], bool]:
+    # Drop self-reverse codewords and codewords whose reverse was already kept
+    kept = set()
+
+    def check(word: int) -> bool:
+        reverse_word = _reverse_word(word, length)
+        if word == reverse_word or reverse_word in kept:
+            return False
+        kept.add(word)
+        return True
+
+    return check
+
+def _reverse_complement_constraint(length: int, gc_weight: Optional[int]) -> Callable[[int], bool]:
+    # Drop self-reverse-complement codewords and codewords whose reverse complement was already kept
+    mask = (1 << length) - 1
+    kept = set()
+
+    def check(word: int) -> bool:
+        reverse_complement_word = _reverse_word(word ^ mask, length)
+        if word == reverse_complement_word or reverse_complement_word in kept:
+            return False
+        kept.add(word)
+        return True
+
+    return check
+
+def _gc_content_constraint(length: int, gc_weight: Optional[int]) -> Callable[[int], bool]:
+    # Keep codewords with exactly gc_weight GC pairs
+    pair_mask = _pair_mask(length)
+
+    def check(word: int) -> bool:
+        return ((word ^ (word >> 1)) & pair_mask).bit_count() == gc_weight
+
+    return check
+
+# Constraints available to dna_code: name -> (cost, factory), see register_constraint
+_CONSTRAINTS: Dict[str, tuple] = {
+    'gc_content': (0, _gc_content_constraint),
+    'reverse': (10, _reverse_constraint),
+    'reverse_complement': (20, _reverse_complement_constraint),
+}
+
+def register_constraint(name: str, factory: Callable[[int, Optional[int]], Callable[[int], bool]],
+                        cost: int = 100) -> None:
+    """
+    Register a custom constraint that can be named in the constraints of dna_code.
+    For every dna_code call, factory(length, gc_weight) is called once and must return a predicate
+    that takes a packed codeword (see pack_codeword) and returns True to keep it. Codewords are
+    streamed in message order through the predicates by increasing cost, and a predicate only sees
+    codewords accepted by all cheaper ones, so a predicate may keep state such as the codewords
+    accepted so far. The built-in costs are 0 for 'gc_content', 10 for 'reverse' and
+    20 for 'reverse_complement'.
+
+    :param name: The constraint name
+    :param factory: Callable building the predicate for a codeword length and GC weight
+    :param cost: Position in the pipeline; cheap and selective checks should have a low cost
+    :raise TypeError: If factory is not callable or cost is not an integer
+    :raise ValueError: If name is already a registered constraint
+    """
+
+    if not callable(factory) or not isinstance(cost, int):
+        raise TypeError("Factory must be callable and cost must be of type 'int'")
+
+    if name in _CONSTRAINTS:
+        raise ValueError(f"Constraint '{name}' is already registered")
+
+    _CONSTRAINTS[name] = (cost, factory)
+
+def constraint_pipeline(constraints: Iterable[str], length: int,
+                        gc_weight: Optional[int] = None) -> List[Callable[[int], bool]]:
+    """
+    Build the predicates of the given constraints in pipeline order (by increasing cost).
+    GC-content weight is invariant under reversal and complement, so checking it before the
+    reverse filters gives the same code as checking it after them.
+
+    :param constraints: Names of registered constraints
+    :param length: Codeword length
+    :param gc_weight: GC-content weight passed to the constraint factories
+    :return: List of predicates on packed codewords
+    :raises ValueError: If a constraint is not registered
+    """
+
+    return [_CONSTRAINTS[name][1](length, gc_weight) for name in _pipeline_order(constraints)]
+
+def _pipeline_order(constraints: Iterable[str]) -> List[str]:
+    # Constraint names by increasing cost; registration order breaks ties
+    constraints = set(constraints)
+    if not constraints.issubset(_CONSTRAINTS):
+        raise ValueError(f"Constraints must be a subset of {set(_CONSTRAINTS)}")
+
+    registered = list(_CONSTRAINTS)
+    return sorted(constraints, key=lambda name: (_CONSTRAINTS[name][0], registered.index(name)))
+
+class DnaCodeProfiler:
+    """
+    Opt-in instrumentation of iter_dna_code and dna_code, passed as their profiler argument.
+    Every stage of the pipeline records its time, the codewords entering it and the codewords it
+    keeps: the enumeration ('encode', or 'gc_content' when only the codewords of one GC weight are
+    enumerated), each constraint by name, and 'unpack' for list output. With workers the shards
+    are encoded and GC-filtered in the 'encode' stage and the remaining constraints run in 'merge';
+    with use_cache the built-in constraints are resolved in 'dna_code_indices'. A profiler can be
+    reused, its statistics accumulate over the runs.
+    Without a profiler none of this code runs.
+    """
+
+    def __init__(self, memory: bool = False, progress: Optional[Callable[[int, Optional[int]], None]] = None,
+                 progress_interval: int = 65536):
+        """
+        :param memory: Trace the peak memory of the runs with tracemalloc, which slows them down
+        :param progress: Callable progress(done, total) called every progress_interval enumerated
+                         codewords and at the end of the enumeration, where total is the number of
+                         codewords to enumerate, or None when it is not known in advance
+        :param progress_interval: Number of codewords between progress calls
+        """
+
+        self.memory = memory
+        self.progress = progress
+        self.progress_interval = max(1, progress_interval)
+        self.stages: Dict[str, Dict[str, Optional[float]]] = {}
+        self.total_seconds = 0.0
+        self.peak_memory: Optional[int] = None
+
+    def _stage(self, name: str, entered: Optional[int] = 0) -> Dict[str, Optional[float]]:
+        return self.stages.setdefault(name, {'seconds': 0.0, 'entered': entered, 'kept': 0})
+
+    def _profile(self, words: Iterator) -> Iterator:
+        # Time a whole run and trace its peak memory
+        started_tracing = False
+        if self.memory:
+            started_tracing = not tracemalloc.is_tracing()
+            if started_tracing:
+                tracemalloc.start()
+            else:
+                tracemalloc.reset_peak()
+
+        start = time.perf_counter()
+        try:
+            yield from words
+        finally:
+            self.total_seconds += time.perf_counter() - start
+            if self.memory:
+                peak = tracemalloc.get_traced_memory()[1]
+                self.peak_memory = max(self.peak_memory or 0, peak)
+                if started_tracing:
+                    tracemalloc.stop()
+
+    def _source(self, name: str, words: Iterable[int], total: Optional[int]) -> Iterator[int]:
+        # Time the enumeration of the codewords, which has no input count; the stage is created
+        # here so that the stages are listed in pipeline order
+        return self._timed_source(self._stage(name, None), words, total)
+
+    def _timed_source(self, stage: dict, words: Iterable[int], total: Optional[int]) -> Iterator[int]:
+        perf_counter, progress, interval = time.perf_counter, self.progress, self.progress_interval
+        iterator = iter(words)
+        count = 0
+
+        while True:
+            start = perf_counter()
+            word = next(iterator, None)
+            stage['seconds'] += perf_counter() - start
+            if word is None:
+                break
+            count += 1
+            stage['kept'] += 1
+            if progress is not None and count % interval == 0:
+                progress(count, total)
+            yield word
+
+        # A last call for the codewords after the last multiple of the interval
+        if progress is not None and count % interval != 0:
+            progress(count, total)
+
+    def _check(self, name: str, check: Callable, keeps_all: bool = False) -> Callable:
+        # Wrap a constraint predicate to count and time its calls; with keeps_all the wrapped
+        # callable is a conversion such as the unpacking, which keeps every codeword
+        stage = self._stage(name)
+        perf_counter = time.perf_counter
+
+        def timed(*args):
+            start = perf_counter()
+            result = check(*args)
+            stage['seconds'] += perf_counter() - start
+            stage['entered'] += 1
+            if keeps_all or result:
+                stage['kept'] += 1
+            return result
+
+        return timed
+
+    def _unpacker(self) -> Callable:
+        return self._check('unpack', _unpack_bits, keeps_all=True)
+
+    def report(self) -> str:
+        """
+        Format the statistics as a table with one line per stage.
+
+        :return: The table, followed by the total time and the peak memory if traced
+        """
+
+        lines = [f"{'stage':<24}{'seconds':>12}{'entered':>12}{'kept':>12}"]
+        for name, stage in self.stages.items():
+            entered = '-' if stage['entered'] is None else stage['entered']
+            lines.append(f"{name:<24}{stage['seconds']:>12.4f}{entered:>12}{stage['kept']:>12}")
+        lines.append(f"{'total':<24}{self.total_seconds:>12.4f}")
+        if self.peak_memory is not None:
+            lines.append(f"peak memory: {self.peak_memory} bytes")
+        return "\n".join(lines)
+
+def _dna_code_shard(rows: List[int], length: int, start: int, stop: int,
+                    gc_weight: Optional[int], reverse: bool, reverse_complement: bool):
+    """
+    Worker task of iter_dna_code with workers: encode the messages start..stop-1, keep those of
+    GC weight gc_weight (all if None) and compute their reverses and reverse complements,
+    which leaves only the order-dependent set lookups to the merge.
+
+    :return: (words, reverse words or None, reverse complement words or None)
+    """
+
+    pair_mask = _pair_mask(length)
+    words = []
+    for chunk in _encode_rows(rows, length, start, stop, 'python'):
+        if gc_weight is not None:
+            chunk = [word for word in chunk if ((word ^ (word >> 1)) & pair_mask).bit_count() == gc_weight]
+        words.extend(chunk)
+
+    mask = (1 << length) - 1
+    reverse_words = _reverse_words(words, length) if reverse else None
+    reverse_complement_words = _reverse_words([word ^ mask for word in words], length) if reverse_complement else None
+
+    return words, reverse_words, reverse_complement_words
+
+def _iter_dna_code_sharded(rows: List[int], length: int, constraints: List[str],
+                           gc_weight: Optional[int], workers: int,
+                           profiler: Optional[DnaCodeProfiler] = None) -> Iterator[int]:
+    # Encode and GC-filter shards of the message range on a process pool, then run the
+    # order-dependent constraints over the shards in message order
+    names = _pipeline_order(constraints)
+    checks = {name: _CONSTRAINTS[name][1](length, gc_weight)
+              for name in names if name not in ('gc_content', 'reverse', 'reverse_complement')}
+
+    num_messages = 1 << len(rows)
+    shard_size = max(1, -(-num_messages // (workers * 4)))
+    shards = [(start, min(start + shard_size, num_messages)) for start in range(0, num_messages, shard_size)]
+
+    kept = {'reverse': set(), 'reverse_complement': set()}
+    shard_gc_weight = gc_weight if 'gc_content' in names else None
+
+    def merge_shard(start: int, stop: int, future) -> List[int]:
+        # Run the order-dependent constraints over the words of one shard
+        if profiler is not None:
+            wait = time.perf_counter()
+        words, reverse_words, reverse_complement_words = future.result()
+        partners = {'reverse': reverse_words, 'reverse_complement': reverse_complement_words}
+        if profiler is not None:
+            merge = time.perf_counter()
+            profiler.stages['encode']['seconds'] += merge - wait
+            profiler.stages['encode']['kept'] += len(words)
+
+        merged = []
+        for i, word in enumerate(words):
+            for name in names:
+                if name == 'gc_content':
+                    continue
+                if name in kept:
+                    partner = partners[name][i]
+                    if word == partner or partner in kept[name]:
+                        break
+                    kept[name].add(word)
+                elif not checks[name](word):
+                    break
+            else:
+                merged.append(word)
+
+        if profiler is not None:
+            stage = profiler.stages['merge']
+            stage['seconds'] += time.perf_counter() - merge
+            stage['entered'] += len(words)
+            stage['kept'] += len(merged)
+            # Progress counts messages here; report when a shard crosses a multiple of the
+            # interval and after the last shard
+            interval = profiler.progress_interval
+            if profiler.progress is not None and (stop == num_messages or stop // interval > start // interval):
+                profiler.progress(stop, num_messages)
+
+        return merged
+
+    # Keep a bounded window of shards in flight, so that finished shards waiting for the merge do
+    # not pile up in memory, and merge them in submission order to match the sequential pipeline
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for start, stop in shards:
+            future = executor.submit(_dna_code_shard, rows, length, start, stop, shard_gc_weight,
+                                     'reverse' in names, 'reverse_complement' in names)
+            pending.append((start, stop, future))
+
+            while len(pending) > 2 * workers:
+                yield from merge_shard(*pending.popleft())
+
+        while pending:
+            yield from merge_shard(*pending.popleft())
+
+def iter_dna_code(generator_matrix: List[List[int]],
+                  constraints: List[str] = ['reverse', 'reverse_complement', 'gc_content'],
+                  gc_weight: Optional[int] = None, packed: bool = False,
+                  use_cache: bool = False, workers: Optional[int] = None,
+                  profiler: Optional[DnaCodeProfiler] = None) -> Iterator:
+    """
+    Stream the codewords of the DNA code defined by a generator matrix and constraints.
+    Each codeword is encoded and passed through the whole constraint pipeline in one pass,
+    in message order, so nothing but the constraint state is kept in memory. With 'gc_content',
+    only the codewords of GC weight gc_weight are enumerated (see gc_weight_codewords) and
+    those are held in memory.
+
+    :param generator_matrix: A 2D list representing the generator matrix
+    :param constraints: Names of registered constraints (see dna_code and register_constraint)
+    :param gc_weight: GC-content weight, required if 'gc_content' is one of the constraints
+    :param packed: Yield packed integer codewords instead of lists
+    :param use_cache: Take the encoded code and its indexes from the generator_analysis cache
+    :param workers: Number of worker processes; the message index range is split into shards that
+                    are encoded and GC-filtered in parallel, and the reverse and reverse-complement
+                    filters are merged in message order. Ignored with use_cache.
+    :param profiler: DnaCodeProfiler recording the stage timings, counts and progress of the run
+    :return: Iterator over the codewords satisfying the constraints
+    :raises ValueError: If 'gc_content' is selected without gc_weight, a constraint is invalid,
+                        or the codeword length is not even
+    """
+
+    words = _iter_dna_code(generator_matrix, constraints, gc_weight, packed, use_cache, workers, profiler)
+    if profiler is not None:
+        words = profiler._profile(words)
+    yield from words
+
+def _iter_dna_code(generator_matrix: List[List[int]], constraints: List[str], gc_weight: Optional[int],
+                   packed: bool, use_cache: bool, workers: Optional[int],
+                   profiler: Optional[DnaCodeProfiler]) -> Iterator:
+    # Body of iter_dna_code; the profiler only wraps the stages when it is given
+
+    # Validate the constraints
+    if not set(constraints).issubset(_CONSTRAINTS):
+        raise ValueError(f"Constraints must be a subset of {set(_CONSTRAINTS)}")
+    
+    # Check if 'gc-content' constraint is selected but gc_weight is not provided
+    if 'gc_content' in constraints and gc_weight is None:
+        raise ValueError("The 'gc_content' constraint requires a gc_weight parameter.")
+
+    # Every path compares the same integer GC weight; no codeword has a non-integral one
+    if 'gc_content' in constraints:
+        gc_weight = _integral_gc_weight(gc_weight)
+        if gc_weight is None:
+            _check_generator(generator_matrix)
+            return
+    
+    # Stream the packed codewords in message order instead of building the message list first
+    code_ = iter_codewords(generator_matrix, order='natural', packed=True)
+    length = len(generator_matrix[0])
+
+    # Reversal and GC-content weight work on nucleotide pairs
+    if length % 2 != 0:
+        raise ValueError("The length of each codeword must be even")
+
+    if use_cache:
+        analysis = generator_analysis(generator_matrix)
+        words = analysis.code.words
+
+        # Built-in constraints on a full-rank generator are lookups in the cached partner maps
+        if analysis.full_rank and set(constraints) <= {'reverse', 'reverse_complement', 'gc_content'}:
+            if profiler is not None:
+                start = time.perf_counter()
+            indices = analysis.dna_code_indices(constraints, gc_weight)
+            if profiler is not None:
+                stage = profiler._stage('dna_code_indices')
+                stage['seconds'] += time.perf_counter() - start
+                stage['entered'] += len(words)
+                stage['kept'] += len(indices)
+                if profiler.progress is not None:
+                    profiler.progress(len(words), len(words))
+
+            unpack = _unpack_bits if profiler is None else profiler._unpacker()
+            for index in indices:
+                yield words[index] if packed else unpack(words[index], length)
+            return
+
+        if 'gc_content' in constraints:
+            source = 'gc_content'
+            code_ = [words[index] for index in analysis.gc_bucket(gc_weight)]
+            constraints = [name for name in constraints if name != 'gc_content']
+        else:
+            source = 'encode'
+            code_ = words
+        total = len(code_)
+
+    elif workers is not None and workers > 1:
+        rows, _ = _check_generator(generator_matrix)
+        unpack = _unpack_bits
+        if profiler is not None:
+            profiler._stage('encode', None)
+            profiler._stage('merge')
+            unpack = profiler._unpacker()
+        for word in _iter_dna_code_sharded(rows, length, constraints, gc_weight, workers, profiler):
+            yield word if packed else unpack(word, length)
+        return
+
+    # With a GC-content constraint only the codewords of that GC weight are enumerated
+    elif 'gc_content' in constraints:
+        source, total = 'gc_content', None
+        code_ = gc_weight_codewords(generator_matrix, gc_weight, packed=True)
+        constraints = [name for name in constraints if name != 'gc_content']
+
+    else:
+        source, total = 'encode', 1 << len(generator_matrix)
+
+    checks = constraint_pipeline(constraints, length, gc_weight)
+    unpack = _unpack_bits
+
+    if profiler is not None:
+        code_ = profiler._source(source, code_, total)
+        checks = [profiler._check(name, check) for name, check in zip(_pipeline_order(constraints), checks)]
+        unpack = profiler._unpacker()
+
+    for word in code_:
+        if all(check(word) for check in checks):
+            yield word if packed else unpack(word, length)
+
+def dna_code(generator_matrix: List[List[int]],
+             constraints: List[str] = ['reverse', 'reverse_complement', 'gc_content'],
+             gc_weight: Optional[int] = None, use_cache: bool = False,
+             workers: Optional[int] = None, profiler: Optional[DnaCodeProfiler] = None) -> List[List[int]]:
+    """
+    Generates a DNA code based on the provided generator matrix and constraints.
+    Codewords are kept in message order; the constraints act as the successive filters
+    'reverse', 'reverse_complement' and 'gc_content', fused into a single pass (see iter_dna_code).
+
+    :param generator_matrix: A 2D list representing the generator matrix
+    :param constraints: A list of constraints that must be applied; can include 'reverse', 
+                        'reverse_complement', 'gc_content' and constraints added with register_constraint
+    :param gc_weight: Optional parameter required if 'gc_content' is one of the constraints.
+    :param profiler: Optional DnaCodeProfiler recording per-stage timings and counts (see iter_dna_code)
+    :return: A list of codewords satisfying the given constraints (the whole code if there are none).
+    :raises ValueError: If 'gc-content' is selected without specifying gc_weight, or if an invalid constraint is provided.
+    """
+
+    return list(iter_dna_code(generator_matrix, constraints, gc_weight, use_cache=use_cache, workers=workers,
+                              profiler=profiler))
+
+class DnaCodeSizeEstimate(NamedTuple):
+    """
+    Randomized estimate of a DNA code size returned by count_dna_code(..., estimate=True).
+    """
+
+    estimate: float
+    lower: float
+    upper: float
+    samples: int
+    confidence: float
+
+class _CodeMembership:
+    """
+    Membership and first message index of words in the code of a generator matrix, without the
+    code in memory. A word is decoded with one lookup per byte in tables of reduced generator rows
+    (augmented with their message bits); its first message index is the smallest message of the
+    coset that encodes it.
+    """
+
+    def __init__(self, rows: List[int], length: int):
+        num_rows = len(rows)
+        augmented = [(row << num_rows) | (1 << (num_rows - 1 - i)) for i, row in enumerate(rows)]
+        basis, pivots, kernel = _row_reduce(augmented, length + num_rows, range(length))
+
+        self.length = length
+        self.num_rows = num_rows
+        self.basis = [row >> num_rows for row in basis]
+
+        # Messages encoding the zero word, reduced on their leading bits
+        self.kernel, self.kernel_pivots, _ = _row_reduce(kernel, num_rows, range(num_rows))
+
+        # tables[b][byte]: XOR of the reduced rows whose pivot lies in byte b (from the right)
+        num_bytes = (length + 7) // 8
+        self.tables = [[0] * 256 for _ in range(num_bytes)]
+        for row, pivot in zip(basis, pivots):
+            position = length - 1 - pivot
+            table = self.tables[position // 8]
+            bit = 1 << (position % 8)
+            for byte in range(256):
+                if byte & bit:
+                    table[byte] ^= row
+
+    def index(self, word: int) -> int:
+        """
+        :return: The first message index encoding word, or -1 if word is not a codeword
+        """
+
+        acc = 0
+        remaining = word
+        for table in self.tables:
+            acc ^= table[remaining & 255]
+            remaining >>= 8
+
+        # The reduced rows picked by the pivot bits must add up to the word itself
+        num_rows = self.num_rows
+        if remaining or acc >> num_rows != word:
+            return -1
+
+        message_index = acc & ((1 << num_rows) - 1)
+        for row, pivot in zip(self.kernel, self.kernel_pivots):
+            if message_index >> (num_rows - 1 - pivot) & 1:
+                message_index ^= row
+        return message_index
+
+    def kept(self, word: int, index: int, reverse: bool, reverse_complement: bool) -> bool:
+        """
+        Whether the codeword with first message index index survives the reverse and/or
+        reverse-complement filters of dna_code (see GeneratorAnalysis.dna_code_indices).
+        """
+
+        length = self.length
+        if reverse:
+            reverse_word = _reverse_word(word, length)
+            if reverse_word == word or 0 <= self.index(reverse_word) < index:
+                return False
+
+        if reverse_complement:
+            mask = (1 << length) - 1
+            partner = _reverse_word(word ^ mask, length)
+            if partner == word:
+                return False
+            partner_index = self.index(partner)
+            if 0 <= partner_index < index:
+                if not reverse:
+                    return False
+                # The partner is dropped first only if the reverse filter removed it; its
+                # reverse is the complement of word
+                partner_reverse = word ^ mask
+                if partner_reverse != partner and not 0 <= self.index(partner_reverse) < partner_index:
+                    return False
+
+        return True
+
+def count_dna_code(generator_matrix: List[List[int]],
+                   constraints: List[str] = ['reverse', 'reverse_complement', 'gc_content'],
+                   gc_weight: Optional[int] = None, estimate: bool = False, samples: int = 10000,
+                   confidence: float = 0.95, seed: Optional[int] = None):
+    """
+    Compute the size of dna_code(generator_matrix, constraints, gc_weight) without materializing it.
+    Each distinct codeword is decided on its own: whether its reverse or reverse complement is a
+    codeword, and at which first message index, is found by decoding against the generator matrix,
+    so memory stays constant. With 'gc_content' only the codewords of that GC weight are visited.
+    With estimate=True, uniformly sampled messages give an estimate of the size and a Wilson
+    confidence interval instead, for codes too large to count.
+
+    :param generator_matrix: A 2D list representing the generator matrix
+    :param constraints: Constraints as in dna_code; custom constraints are counted by streaming
+                        iter_dna_code and cannot be estimated
+    :param gc_weight: Optional parameter required if 'gc_content' is one of the constraints
+    :param estimate: Return a DnaCodeSizeEstimate instead of the exact size
+    :param samples: Number of sampled messages for the estimate
+    :param confidence: Confidence level of the interval
+    :param seed: Seed of the random sampler, for reproducible estimates
+    :return: The exact number of codewords, or a DnaCodeSizeEstimate
+    :raises ValueError: If the constraints are invalid, 'gc_content' is selected without gc_weight,
+                        the codeword length is not even, or a custom constraint is estimated
+    """
+
+    # Validate the constraints
+    if not set(constraints).issubset(_CONSTRAINTS):
+        raise ValueError(f"Constraints must be a subset of {set(_CONSTRAINTS)}")
+
+    # Check if 'gc-content' constraint is selected but gc_weight is not provided
+    if 'gc_content' in constraints and gc_weight is None:
+        raise ValueError("The 'gc_content' constraint requires a gc_weight parameter.")
+
+    rows, length = _check_generator(generator_matrix)
+
+    # Ensure that the length of each codeword is even
+    if length % 2 != 0:
+        raise ValueError("The length of each codeword must be even")
+
+    reverse = 'reverse' in constraints
+    reverse_complement = 'reverse_complement' in constraints
+    gc_content = 'gc_content' in constraints
+    builtin = set(constraints) <= {'reverse', 'reverse_complement', 'gc_content'}
+
+    # No codeword has a non-integral GC weight
+    if gc_content:
+        gc_weight = _integral_gc_weight(gc_weight)
+        if gc_weight is None:
+            return DnaCodeSizeEstimate(0.0, 0.0, 0.0, samples, confidence) if estimate else 0
+
+    if estimate:
+        if not builtin:
+            raise ValueError("Only the built-in constraints can be estimated")
+        return _estimate_dna_code(rows, length, reverse, reverse_complement,
+                                  gc_weight if gc_content else None, samples, confidence, seed)
+
+    # Custom constraints may depend on the whole stream, so they are counted by streaming
+    if not builtin:
+        return sum(1 for _ in iter_dna_code(generator_matrix, constraints, gc_weight, packed=True))
+
+    if not reverse and not reverse_complement:
+        return count_gc_weight_codewords(generator_matrix, gc_weight) if gc_content else 1 << len(rows)
+
+    membership = _CodeMembership(rows, length)
+    distinct = membership.basis
+    count = 0
+
+    def visit(word: int) -> None:
+        nonlocal count
+        if membership.kept(word, membership.index(word), reverse, reverse_complement):
+            count += 1
+
+    if gc_content:
+        # Search the GC-weight codewords of the reduced basis, where every codeword is distinct
+        basis, kernel_span, shift = _gc_domain(distinct, length)
+        code_mask = (1 << length) - 1
+        num_distinct = len(distinct)
+
+        def visit_gc(word: int) -> None:
+            for kernel in kernel_span:
+                visit(((word ^ kernel) >> num_distinct) & code_mask)
+
+        _gc_weight_search(basis, shift, length // 2, gc_weight, visit_gc)
+    else:
+        for word in iter_codewords([_unpack_bits(row, length) for row in distinct],
+                                   order='gray', packed=True) if distinct else [0]:
+            visit(word)
+
+    # Dependent generator rows repeat every codeword the same number of times
+    return count << (len(rows) - len(distinct))
+
+def _estimate_dna_code(rows: List[int], length: int, reverse: bool, reverse_complement: bool,
+                       gc_weight: Optional[int], samples: int, confidence: float,
+                       seed: Optional[int]) -> DnaCodeSizeEstimate:
+    # Sample messages uniformly and scale the fraction of kept codewords by 2^k
+    if samples < 1 or not 0 < confidence < 1:
+        raise ValueError("Samples must be positive and confidence must lie between 0 and 1")
+
+    membership = _CodeMembership(rows, length)
+    tables = _encoder_tables(rows)
+    pair_mask = _pair_mask(length)
+    generator = random.Random(seed)
+    num_messages = 1 << len(rows)
+
+    hits = 0
+    for _ in range(samples):
+        word = _encode_index(generator.randrange(num_messages), tables)
+        if gc_weight is not None and ((word ^ (word >> 1)) & pair_mask).bit_count() != gc_weight:
+            continue
+        if membership.kept(word, membership.index(word), reverse, reverse_complement):
+            hits += 1
+
+    # Wilson score interval of the kept fraction
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    fraction = hits / samples
+    denominator = 1 + z * z / samples
+    centre = (fraction + z * z / (2 * samples)) / denominator
+    margin = z * sqrt(fraction * (1 - fraction) / samples + z * z / (4 * samples * samples)) / denominator
+
+    return DnaCodeSizeEstimate(fraction * num_messages, max(0.0, centre - margin) * num_messages,
+                               min(1.0, centre + margin) * num_messages, samples, confidence)
+
+class ScreeningResult(NamedTuple):
+    """
+    Metrics of one generator matrix yielded by screen_generators.
+    Metrics that were not computed (not requested, or skipped after pruning) are None.
+    """
+
+    index: int
+    generator_hash: str
+    size: Optional[int]
+    linear_minimum_distance: Optional[float]
+    minimum_distance: Optional[float]
+    gc_distribution: Optional[Dict[int, int]]
+    pruned: Optional[str]
+
+def _screen_generator(index: int, generator_matrix: List[List[int]], constraints: List[str],
+                      gc_weight: Optional[int], target_distance: Optional[int],
+                      target_size: Optional[int], metrics: frozenset) -> ScreeningResult:
+    # Evaluate one candidate, cheapest metrics first, stopping as soon as it is pruned; the linear
+    # metrics are memoized in the generator_analysis cache
+    analysis = generator_analysis(generator_matrix)
+    key = analysis.key
+    size = linear_distance = distance = gc_distribution = None
+
+    def result(pruned: Optional[str] = None) -> ScreeningResult:
+        return ScreeningResult(index, key, size, linear_distance, distance, gc_distribution, pruned)
+
+    if 'size' in metrics or target_size is not None:
+        size = count_dna_code(generator_matrix, constraints, gc_weight)
+        if target_size is not None and size < target_size:
+            return result('size')
+
+    if 'gc_distribution' in metrics:
+        gc_distribution = analysis.gc_weight_distribution()
+
+    if 'minimum_distance' in metrics or target_distance is not None:
+        # The DNA code is a subset of the linear code, so its distance is at least the linear one
+        # (when it has no repeated codewords)
+        linear_distance = analysis.minimum_distance()
+
+        # Without the exact distance requested, only the target has to be checked. The linear
+        # bound only holds for linearly independent rows: dependent rows repeat every codeword
+        # in the DNA code, which then has distance 0
+        if 'minimum_distance' not in metrics:
+            if not analysis.full_rank or linear_distance < target_distance:
+                words = list(iter_dna_code(generator_matrix, constraints, gc_weight, packed=True))
+                if not has_minimum_distance(words, target_distance):
+                    return result('distance')
+            return result()
+
+        words = list(iter_dna_code(generator_matrix, constraints, gc_weight, packed=True))
+        distance = packed_minimum_distance(words)
+        if target_distance is not None and distance < target_distance:
+            return result('distance')
+
+    return result()
+
+# Number of distinct generator matrices whose screening result is kept for duplicates
+_SCREEN_DEDUP_SIZE = 1024
+
+def screen_generators(generator_matrices: Iterable[List[List[int]]],
+                      constraints: List[str] = ['reverse', 'reverse_complement', 'gc_content'],
+                      gc_weight: Optional[int] = None, target_distance: Optional[int] = None,
+                      target_size: Optional[int] = None,
+                      metrics: Iterable[str] = ('size', 'minimum_distance', 'gc_distribution'),
+                      workers: Optional[int] = None) -> Iterator[ScreeningResult]:
+    """
+    Screen many generator matrices and stream back the metrics of their DNA codes.
+    For each matrix the size of dna_code(matrix, constraints, gc_weight) is counted without
+    building the code (count_dna_code), the GC-content weight distribution is computed from
+    the matrix (gc_weight_distribution) and the minimum distance of the DNA code is computed
+    pairwise. Candidates are pruned as soon as they cannot reach target_size or target_distance;
+    the distance target is first checked against the minimum distance of the linear code, which
+    bounds that of the DNA code from below when the rows are linearly independent, and otherwise
+    with an early-exit pairwise check.
+    Repeated matrices are evaluated once while they are among the last 1024 distinct matrices
+    seen, and the linear minimum distance and GC-content distribution are memoized in the
+    generator_analysis cache.
+
+    :param generator_matrices: Iterable of generator matrices, consumed lazily
+    :param constraints: Constraints as in dna_code (custom constraints need workers=None
+                        unless their factories can be pickled)
+    :param gc_weight: GC-content weight, required if 'gc_content' is one of the constraints
+    :param target_distance: Prune candidates whose DNA code has a smaller minimum distance
+    :param target_size: Prune candidates whose DNA code has fewer codewords
+    :param metrics: Metrics to report: any of 'size', 'minimum_distance' and 'gc_distribution'
+    :param workers: Number of worker processes; None screens in this process
+    :return: Iterator over ScreeningResult, in input order
+    :raises ValueError: If a metric is unknown
+    """
+
+    metrics = frozenset(metrics)
+    if not metrics <= {'size', 'minimum_distance', 'gc_distribution'}:
+        raise ValueError("Metrics must be a subset of {'size', 'minimum_distance', 'gc_distribution'}")
+
+    options = (constraints, gc_weight, target_distance, target_size, metrics)
+
+    # Results (or futures) of the recently seen matrices by generator hash, least recently used first
+    seen: "OrderedDict[str, object]" = OrderedDict()
+
+    def lookup(key: str, evaluate: Callable):
+        if key in seen:
+            seen.move_to_end(key)
+        else:
+            seen[key] = evaluate()
+            if len(seen) > _SCREEN_DEDUP_SIZE:
+                seen.popitem(last=False)
+        return seen[key]
+
+    if workers is None or workers <= 1:
+        for index, generator_matrix in enumerate(generator_matrices):
+            result = lookup(generator_hash(generator_matrix),
+                            lambda: _screen_generator(index, generator_matrix, *options))
+            yield result._replace(index=index)
+        return
+
+    # Keep a bounded window of candidates in flight and yield them in input order
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for index, generator_matrix in enumerate(generator_matrices):
+            future = lookup(generator_hash(generator_matrix),
+                            lambda: executor.submit(_screen_generator, index, generator_matrix, *options))
+            pending.append((index, future))
+
+            while len(pending) > 2 * workers:
+                done_index, future = pending.popleft()
+                yield future.result()._replace(index=done_index)
+
+        while pending:
+            done_index, future = pending.popleft()
+            yield future.result()._replace(index=done_index)
+
+def pack_codeword(codeword: List[int]) -> int:
+    """
+    Pack a binary codeword into a single Python integer.
+    The first element of the codeword becomes the most significant bit, so packed
+    codewords compare in the same order as the lists they were built from.
+
+    :param codeword: A 1D list of binary integers (0 or 1)
+    :return: The packed codeword as a non-negative integer
+    :raise TypeError: If the input is not a 1D list or contains non-integer elements
+    :raise ValueError: If elements are not binary
+    """
+
+    # Check if input is a 1D list
+    if not isinstance(codeword, list):
+        raise TypeError("Input must be a 1D list")
+
+    # Check if all elements in the codeword are integers
+    if not all(isinstance(elem, int) for elem in codeword):
+        raise TypeError("All elements in the codeword must be integers")
+
+    # Check if all elements in the codeword are binary (0 or 1)
+    if not all(elem in (0, 1) for elem in codeword):
+        raise ValueError("Codeword must be binary (contain only 0s and 1s)")
+
+    # Read the bits as a base-2 number, most significant bit first; bools pack as their integer values
+    return _pack_bits(codeword)
+
+def unpack_codeword(word: int, length: int) -> List[int]:
+    """
+    Unpack a packed codeword back into a list of binary integers.
+
+    :param word: The packed codeword (most significant bit first)
+    :param length: The length of the codeword in bits
+    :return: A 1D list of binary integers (0 or 1)
+    :raise TypeError: If word or length is not an integer
+    :raise ValueError: If length is negative or word does not fit in length bits
+    """
+
+    # Check if word and length are integers
+    if not isinstance(word, int) or not isinstance(length, int):
+        raise TypeError("Word and length must be of type 'int'")
+
+    # Check if the word fits in the given number of bits
+    if length < 0 or word < 0 or word >> length:
+        raise ValueError("Word must be a non-negative integer of at most 'length' bits")
+
+    # Format the word as a fixed-width bit string and split it into bits
+    return [int(bit) for bit in format(word, f"0{length}b")] if length else []
+
+@lru_cache(maxsize=None)
+def _pair_mask(length: int) -> int:
+    # Mask selecting the second bit of every (nucleotide) pair of a packed codeword
+    return int("01" * (length // 2) or "0", 2)
+
+def _reverse_pairs_in_byte(byte: int) -> int:
+    # Reverse the order of the four bit pairs of a byte
+    return ((byte & 3) << 6) | ((byte & 12) << 2) | ((byte & 48) >> 2) | (byte >> 6)
+
+# Byte translation table reversing the pairs inside every byte
+_REVERSE_PAIRS_TABLE = bytes(_reverse_pairs_in_byte(byte) for byte in range(256))
+
+@lru_cache(maxsize=None)
+def _reverse_permutation(length: int):
+    # Index permutation of reverse_codeword for a given length, as an itemgetter
+    return operator.itemgetter(*[index for i in range(length - 2, -1, -2) for index in (i, i + 1)])
+
+def _check_packed(word: int, length: int, even: bool = False) -> None:
+    # Shared validation for the packed-codeword functions
+    if not isinstance(word, int) or not isinstance(length, int):
+        raise TypeError("Word and length must be of type 'int'")
+    if length < 0 or word < 0 or word >> length:
+        raise ValueError("Word must be a non-negative integer of at most 'length' bits")
+    if even and length % 2 != 0:
+        raise ValueError("The length of the codeword must be even")
+
+def hamming_distance_packed(word1: int, word2: int) -> int:
+    """
+    Compute the Hamming distance between two packed codewords.
+    The distance is the popcount of the bitwise XOR of the two words.
+
+    :param word1: First packed codeword
+    :param word2: Second packed codeword
+    :return: The Hamming distance between word1 and word2
+    :raise TypeError: If the inputs are not integers
+    :raise ValueError: If the inputs are negative
+    """
+
+    # Check if both inputs are non-negative integers
+    if not (isinstance(word1, int) and isinstance(word2, int)):
+        raise TypeError("Both arguments must be of type 'int'")
+    if word1 < 0 or word2 < 0:
+        raise ValueError("Packed codewords must be non-negative")
+
+    return (word1 ^ word2).bit_count()
+
+def weight_packed(word: int) -> int:
+    """
+    Calculate the weight of a packed codeword, i.e. its popcount.
+
+    :param word: The packed codeword
+    :return: The number of 1s in the codeword
+    :raise TypeError: If the input is not an integer
+    :raise ValueError: If the input is negative
+    """
+
+    # Check if input is a non-negative integer
+    if not isinstance(word, int):
+        raise TypeError("Input must be of type 'int'")
+    if word < 0:
+        raise ValueError("Packed codewords must be non-negative")
+
+    return word.bit_count()
+
+def complement_packed(word: int, length: int) -> int:
+    """
+    Calculate the complement of a packed codeword by XOR with the all-ones mask.
+
+    :param word: The packed codeword
+    :param length: The length of the codeword in bits, which must be even
+    :return: The packed complement of the codeword
+    :raise TypeError: If word or length is not an integer
+    :raise ValueError: If word does not fit in length bits or length is not even
+    """
+
+    _check_packed(word, length, even=True)
+
+    return word ^ ((1 << length) - 1)
+
+def reverse_packed(word: int, length: int) -> int:
+    """
+    Reverse a packed codeword with the same pattern as reverse_codeword:
+    the order of the bit pairs is reversed while the bits inside each pair are kept.
+
+    :param word: The packed codeword
+    :param length: The length of the codeword in bits, which must be even
+    :return: The packed reversed codeword
+    :raise TypeError: If word or length is not an integer
+    :raise ValueError: If word does not fit in length bits or length is not even
+    """
+
+    _check_packed(word, length, even=True)
+
+    return _reverse_word(word, length)
+
+def _reverse_word(word: int, length: int) -> int:
+    # Reverse the byte order and translate every byte through the pair-reversal table;
+    # the word is first padded on the right to whole bytes, and the padding ends up on the left
+    num_bytes = (length + 7) // 8
+    data = (word << (num_bytes * 8 - length)).to_bytes(num_bytes, "big")
+    return int.from_bytes(data[::-1].translate(_REVERSE_PAIRS_TABLE), "big")
+
+def _reverse_words(words: List[int], length: int) -> List[int]:
+    # Reverse a whole list of packed codewords with a single byte reversal and translation:
+    # reversing the concatenated rows reverses every row and the order of the rows
+    num_bytes = (length + 7) // 8
+    pad = num_bytes * 8 - length
+    data = b"".join((word << pad).to_bytes(num_bytes, "big") for word in words)
+    data = data[::-1].translate(_REVERSE_PAIRS_TABLE)
+    reverse_words = [int.from_bytes(data[i:i + num_bytes], "big") for i in range(0, len(data), num_bytes)]
+    return reverse_words[::-1]
+
+def weight_gc_packed(word: int, length: int) -> int:
+    """
+    Calculate the GC-content weight of a packed codeword.
+    A pair contributes when its two bits differ ('01' or '10'), which is the
+    popcount of the word XORed with itself shifted by one, masked to one bit per pair.
+
+    :param word: The packed codeword
+    :param length: The length of the codeword in bits, which must be even
+    :return: The GC-content weight of the codeword
+    :raise TypeError: If word or length is not an integer
+    :raise ValueError: If word does not fit in length bits or length is not even
+    """
+
+    _check_packed(word, length, even=True)
+
+    return ((word ^ (word >> 1)) & _pair_mask(length)).bit_count()
+
+# Nucleotide of each bit pair: A and T are the pairs without GC content and complements of each
+# other, as are G and C, so complement_codeword complements the bases and reverse_codeword
+# reverses the sequence
+_DNA_BASES = "AGCT"
+_DNA_FROM_BYTE = [''.join(_DNA_BASES[(byte >> shift) & 3] for shift in (6, 4, 2, 0)) for byte in range(256)]
+_DIGITS_FROM_DNA = str.maketrans("AGCTagct", "01230123")
+
+def packed_to_dna(word: int, length: int) -> str:
+    """
+    Convert a packed codeword to its DNA sequence, two bits per base:
+    00 = A, 01 = G, 10 = C and 11 = T, from the most significant pair.
+    The GC-content weight (weight_gc_packed) is the number of G and C bases, complement_packed gives
+    the complementary bases and reverse_packed the reversed sequence.
+
+    :param word: The packed codeword
+    :param length: The length of the codeword in bits, which must be even
+    :return: The DNA sequence of length / 2 bases
+    :raise TypeError: If word or length is not an integer
+    :raise ValueError: If word does not fit in length bits or length is not even
+    """
+
+    _check_packed(word, length, even=True)
+
+    return _dna_from_word(word, length)
+
+def _dna_from_word(word: int, length: int) -> str:
+    # One table lookup per byte; the word is padded on the left to whole bytes, which adds
+    # leading 'A' bases that are cut off
+    num_bytes = (length + 7) // 8
+    sequence = ''.join([_DNA_FROM_BYTE[byte] for byte in word.to_bytes(num_bytes, "big")])
+    return sequence[(num_bytes * 8 - length) // 2:]
+
+def dna_to_packed(sequence: str) -> int:
+    """
+    Convert a DNA sequence to its packed codeword (see packed_to_dna).
+    Lowercase bases are accepted.
+
+    :param sequence: String of the bases A, C, G and T
+    :return: The packed codeword of 2 * len(sequence) bits
+    :raise TypeError: If sequence is not a string
+    :raise ValueError: If sequence contains other characters than the four bases
+    """
+
+    if not isinstance(sequence, str):
+        raise TypeError("Sequence must be of type 'str'")
+    _check_dna(sequence)
+
+    return _word_from_dna(sequence)
+
+def _check_dna(sequence: str) -> None:
+    if not sequence.isascii() or sequence.encode().translate(None, b"ACGTacgt"):
+        raise ValueError("Sequence must only contain the bases A, C, G and T")
+
+def _word_from_dna(sequence: str) -> int:
+    # The bases translate to the base-4 digits of the packed word
+    return int(sequence.translate(_DIGITS_FROM_DNA), 4) if sequence else 0
+
+def codeword_to_dna(codeword: List[int], validate: bool = True) -> str:
+    """
+    Convert a binary codeword to its DNA sequence (see packed_to_dna).
+    codeword_to_dna(reverse_codeword(c)) is the reversed sequence of c, and
+    codeword_to_dna(complement_codeword(c)) its complementary bases.
+
+    :param codeword: A 1D list of binary integers (0 or 1) of even length
+    :param validate: Check the input; pass False for a codeword that is already known to be valid
+    :return: The DNA sequence
+    :raise TypeError: If the input is not a 1D list or contains non-integer elements
+    :raise ValueError: If elements are not binary or if the length of the codeword is not even
+    """
+
+    if validate:
+        _validate_binary_vector(codeword, even=True)
+
+    return _dna_from_word(_pack_bits(codeword), len(codeword))
+
+def dna_to_codeword(sequence: str) -> List[int]:
+    """
+    Convert a DNA sequence to its binary codeword (see packed_to_dna).
+
+    :param sequence: String of the bases A, C, G and T
+    :return: The binary codeword of 2 * len(sequence) bits
+    :raise TypeError: If sequence is not a string
+    :raise ValueError: If sequence contains other characters than the four bases
+    """
+
+    return _unpack_bits(dna_to_packed(sequence), 2 * len(sequence))
+
+def write_dna_file(path: str, code: Iterable[int], length: Optional[int] = None, fasta: bool = False,
+                   name: str = "codeword", chunk_size: int = 65536) -> int:
+    """
+    Stream packed codewords to a text file of DNA sequences, one sequence per line or as FASTA
+    records named '<name>_<index>'. Codewords are converted and written chunk by chunk, so
+    an iterator such as iter_dna_code(..., packed=True) or a MappedCode of any size is written
+    in bounded memory.
+
+    :param path: The output file
+    :param code: PackedCode, MappedCode or iterable of packed codewords
+    :param length: The length of the codewords in bits; only needed for a plain iterable
+    :param fasta: Write FASTA records instead of plain lines
+    :param name: Prefix of the FASTA record names
+    :param chunk_size: Number of codewords converted per write
+    :return: The number of sequences written
+    :raise ValueError: If length is missing or odd, or a codeword does not fit in length bits
+    """
+
+    if isinstance(code, (PackedCode, MappedCode)):
+        length = code.length
+    elif length is None:
+        raise ValueError("Argument 'length' is required for a plain iterable of packed codewords")
+
+    count = 0
+    with open(path, "w") as file:
+        for chunk in _chunked(code, chunk_size):
+            for word in chunk:
+                _check_packed(word, length, even=True)
+            sequences = [_dna_from_word(word, length) for word in chunk]
+            if fasta:
+                file.write(''.join(f">{name}_{count + i}\n{sequence}\n" for i, sequence in enumerate(sequences)))
+            else:
+                file.write('\n'.join(sequences) + '\n')
+            count += len(chunk)
+
+    return count
+
+def read_dna_file(path: str, length: Optional[int] = None) -> Iterator[int]:
+    """
+    Stream the packed codewords of a text file of DNA sequences written by write_dna_file or by
+    other tools: plain text with one sequence per line, or FASTA (detected by its '>' header lines),
+    where a sequence may span several lines. The file is read line by line, so only one
+    sequence is held in memory at a time. Blank lines are skipped.
+
+    :param path: The input file
+    :param length: Expected codeword length in bits (twice the number of bases); None accepts any
+    :return: Iterator over the packed codewords, in file order
+    :raise ValueError: If a sequence contains other characters than the four bases
+                       or does not have length / 2 bases
+    """
+
+    def convert(sequence: str) -> int:
+        _check_dna(sequence)
+        if length is not None and 2 * len(sequence) != length:
+            raise ValueError(f"Sequence of {len(sequence)} bases does not encode a codeword of length {length}")
+        return _word_from_dna(sequence)
+
+    with open(path) as file:
+        record = None
+        for line in file:
+            line = line.strip()
+            if line.startswith('>'):
+                if record is not None:
+                    yield convert(''.join(record))
+                record = []
+            elif not line:
+                continue
+            elif record is not None:
+                record.append(line)
+            else:
+                yield convert(line)
+
+        if record is not None:
+            yield convert(''.join(record))
+
+_BITS_FROM_CHARS = bytes.maketrans(b"01", b"\x00\x01")
+_CHARS_FROM_BITS = bytes.maketrans(b"\x00\x01", b"01")
+
+def _validate_binary_matrix(matrix: List[List[int]], name: str) -> None:
+    # Check that matrix is a 2D list of integers before collecting its (then hashable) values
+    elem_types = set()
+    for row in matrix:
+        if not isinstance(row, list):
+            raise TypeError(f"{name} must be a 2D list of integers")
+        elem_types.update(map(type, row))
+
+    if not all(issubclass(elem_type, int) for elem_type in elem_types):
+        raise TypeError(f"{name} must be a 2D list of integers")
+
+    elems = set()
+    for row in matrix:
+        elems.update(row)
+    if not elems <= {0, 1}:
+        raise ValueError(f"{name} must be binary (contain only 0s and 1s)")
+
+def _validate_binary_vector(codeword: List[int], even: bool = False) -> None:
+    # Check that codeword is a 1D list of binary integers (of even length if required)
+    if not isinstance(codeword, list):
+        raise TypeError("Input must be a 1D list")
+
+    if not all(issubclass(elem_type, int) for elem_type in set(map(type, codeword))):
+        raise TypeError("All elements in the codeword must be integers")
+
+    if not set(codeword) <= {0, 1}:
+        raise ValueError("Codeword must be binary (contain only 0s and 1s)")
+
+    if even and len(codeword) % 2 != 0:
+        raise ValueError("The length of the codeword must be even")
+
+def _validate_binary_code(code: List[List[int]], type_message: str, name: str, even: bool = False) -> None:
+    # Check that code is a 2D list of binary codewords of one (even) length; the element types
+    # are checked before the (then hashable) values are collected
+    elem_types = set()
+    for row in code:
+        if not isinstance(row, list):
+            raise TypeError(type_message)
+        elem_types.update(map(type, row))
+
+    if not all(issubclass(elem_type, int) for elem_type in elem_types):
+        raise TypeError("All elements in the codewords must be integers")
+
+    elems = set()
+    for row in code:
+        elems.update(row)
+    if not elems <= {0, 1}:
+        raise ValueError(f"{name} must be binary (contain only 0s and 1s)")
+
+    # Validate that all rows have the same length
+    num_cols = len(code[0])
+    if not all(len(row) == num_cols for row in code):
+        raise ValueError("All codewords must have the same length")
+
+    # Ensure that the length of each codeword is even
+    if even and num_cols % 2 != 0:
+        raise ValueError("The length of each codeword must be even")
+
+def _resolve_backend(backend: str) -> str:
+    # Map 'auto' to the fastest available backend and reject unknown names
+    if backend not in ('auto', 'python', 'numpy'):
+        raise ValueError("Backend must be one of 'auto', 'python' or 'numpy'")
+    if backend == 'numpy' and np is None:
+        raise ImportError("The 'numpy' backend requires NumPy to be installed")
+    if backend == 'auto':
+        return 'python' if np is None else 'numpy'
+    return backend
+
+def _check_generator(generator_matrix: List[List[int]]):
+    # Validate a generator matrix and return its packed rows and codeword length
+    _validate_binary_matrix(generator_matrix, "Generator matrix")
+
+    length = len(generator_matrix[0])
+    if not all(len(row) == length for row in generator_matrix):
+        raise ValueError("All rows in generator matrix must have the same number of columns")
+
+    return _pack_rows(generator_matrix), length
+
+def _integral_gc_weight(gc_weight) -> Optional[int]:
+    # GC weights are compared by value, as in weight_gc_codeword(c) == gc_weight, so integral values
+    # of any numeric type (such as NumPy integers or 2.0) are accepted; None for a non-integral value,
+    # which no codeword has
+    try:
+        return operator.index(gc_weight)
+    except TypeError:
+        if not isinstance(gc_weight, numbers.Real):
+            raise TypeError("Argument 'gc_weight' must be a number") from None
+    return int(gc_weight) if float(gc_weight).is_integer() else None
+
+def _pack_rows(matrix: List[List[int]]) -> List[int]:
+    # Pack every row of an already validated binary matrix
+    return [_pack_bits(row) for row in matrix]
+
+def _pack_bits(row: List[int]) -> int:
+    # Pack an already validated binary row, most significant bit first
+    return int(bytes(row).translate(_CHARS_FROM_BITS) or b"0", 2)
+
+def _unpack_bits(word: int, length: int) -> List[int]:
+    # Unpack a word without validation, going through a byte translation table
+    return list(format(word, f"0{length}b").encode().translate(_BITS_FROM_CHARS)) if length else []
+
+def _chunked(rows: Iterable, size: int) -> Iterator[list]:
+    # Split an iterable into lists of at most size elements
+    iterator = iter(rows)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+def _encoder_tables(rows: List[int]) -> List[List[int]]:
+    """
+    Build byte lookup tables for encoding with packed generator rows.
+    Table g holds, for every byte value b, the XOR of the generator rows selected by
+    bits 8g..8g+7 of the message index (bit 0 being the last generator row),
+    so a codeword costs one lookup and one XOR per message byte.
+    """
+
+    num_rows = len(rows)
+    tables = []
+    for group in range(0, num_rows, 8):
+        table = [0]
+        for bit in range(min(8, num_rows - group)):
+            row = rows[num_rows - 1 - group - bit]
+            table += [word ^ row for word in table]
+        tables.append(table)
+    return tables
+
+def _encode_index(index: int, tables: List[List[int]]) -> int:
+    # Encode the message with the given index (message bits read most significant first)
+    codeword = 0
+    for table in tables:
+        codeword ^= table[index & 255]
+        index >>= 8
+    return codeword
+
+def _row_reduce(rows: List[int], length: int, columns: Iterable[int]):
+    """
+    Gauss-Jordan elimination over GF(2) on packed rows.
+    Pivots are searched in the given column order (column 0 is the leftmost bit).
+
+    :return: The reduced rows, their pivot columns (every pivot column has a single 1,
+             in the row it belongs to) and the remaining rows, which are zero on all given columns
+    """
+
+    rows = list(rows)
+    reduced = []
+    pivots = []
+    for column in columns:
+        bit = 1 << (length - 1 - column)
+        for i, row in enumerate(rows):
+            if row & bit:
+                pivot_row = rows.pop(i)
+                break
+        else:
+            continue
+
+        rows = [row ^ pivot_row if row & bit else row for row in rows]
+        reduced = [row ^ pivot_row if row & bit else row for row in reduced]
+        reduced.append(pivot_row)
+        pivots.append(column)
+        if not rows:
+            break
+
+    return reduced, pivots, rows
+
+def _min_combination_weight(rows: List[int], size: int, bound: int) -> int:
+    # Minimum weight of the XOR of any size distinct rows (bound if none is lighter)
+    best = bound
+    last = len(rows) - 1
+
+    def extend(start: int, remaining: int, acc: int) -> None:
+        nonlocal best
+        if remaining == 1:
+            weight = min(((acc ^ row).bit_count() for row in rows[start:]), default=best)
+            if weight < best:
+                best = weight
+            return
+        for i in range(start, last - remaining + 2):
+            extend(i + 1, remaining - 1, acc ^ rows[i])
+
+    extend(0, size, 0)
+    return best
+
+_TILE_WORDS: List[int] = []
+
+def _tile_source(code: Iterable[int]):
+    # Mapped codes are read in place, anything else is collected into a list of packed words
+    return code if isinstance(code, MappedCode) else list(code)
+
+def _init_tile_worker(words) -> None:
+    # Process pool initializer: every worker receives the packed code once, or maps the
+    # code file itself when the code is a MappedCode
+    global _TILE_WORDS
+    _TILE_WORDS = open_code(words) if isinstance(words, str) else words
+
+def _pool_distance_tile(bounds, mode: str, threshold: Optional[int]):
+    return _distance_tile(_TILE_WORDS, bounds, mode, threshold)
+
+class _DnaTileWords:
+    # Tile source of the DNA distance modes: the packed words, their reverses and the length
+    __slots__ = ('words', 'reverse_words', 'length')
+
+    def __init__(self, words: List[int], reverse_words: List[int], length: int):
+        self.words = words
+        self.reverse_words = reverse_words
+        self.length = length
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+def _dna_distance_tile(source: _DnaTileWords, bounds, thresholds):
+    # DNA modes of _distance_tile: the row words are compared with the column words (i < j)
+    # and with the reversed column words (i <= j); the reverse-complement distance is
+    # length minus the reverse distance, so it needs the largest reverse distance
+    i0, i1, j0, j1 = bounds
+    words, length = source.words, source.length
+    columns = words[j0:j1]
+    reverse_columns = source.reverse_words[j0:j1]
+    inf = float('inf')
+    best_hamming = best_reverse = best_reverse_complement = inf
+
+    for i in range(i0, i1):
+        x = words[i]
+        offset = i - j0 if i >= j0 else 0
+        block = columns[offset + 1:] if i >= j0 else columns
+        hamming = min(((x ^ y).bit_count() for y in block), default=inf)
+        reverse_distances = [(x ^ y).bit_count() for y in reverse_columns[offset:]]
+        if not reverse_distances:
+            continue
+        reverse = min(reverse_distances)
+        reverse_complement = length - max(reverse_distances)
+
+        if thresholds is not None:
+            if (hamming < thresholds[0] or reverse < thresholds[1]
+                    or reverse_complement < thresholds[2]):
+                return True
+            continue
+        best_hamming = min(best_hamming, hamming)
+        best_reverse = min(best_reverse, reverse)
+        best_reverse_complement = min(best_reverse_complement, reverse_complement)
+
+    if thresholds is not None:
+        return False
+    return best_hamming, best_reverse, best_reverse_complement
+
+def _distance_tile(words: List[int], bounds, mode: str, threshold: Optional[int]):
+    """
+    Compare the codewords of rows i0..i1-1 with those of columns j0..j1-1 (pairs i < j only).
+
+    :param mode: 'min' returns the minimum distance in the tile, 'below' whether some pair is
+                 closer than threshold, 'histogram' a dictionary of distance counts, and 'dna' and
+                 'dna_below' the same as 'min' and 'below' for the three DNA distances, with words
+                 a _DnaTileWords and threshold a tuple of three thresholds
+    """
+
+    if mode == 'dna' or mode == 'dna_below':
+        return _dna_distance_tile(words, bounds, threshold if mode == 'dna_below' else None)
+
+    i0, i1, j0, j1 = bounds
+    columns = words[j0:j1]
+    best = float('inf')
+    counts: Dict[int, int] = {}
+
+    for i in range(i0, i1):
+        x = words[i]
+        # On diagonal tiles only the columns after row i are compared
+        block = columns[i - j0 + 1:] if i >= j0 else columns
+
+        if mode == 'below':
+            if any((x ^ y).bit_count() < threshold for y in block):
+                return True
+        elif mode == 'min':
+            best = min(best, min(((x ^ y).bit_count() for y in block), default=best))
+        else:
+            for y in block:
+                distance = (x ^ y).bit_count()
+                counts[distance] = counts.get(distance, 0) + 1
+
+    if mode == 'below':
+        return False
+    return best if mode == 'min' else counts
+
+def _run_distance_tiles(words: List[int], mode: str, threshold: Optional[int],
+                        workers: Optional[int], tile_size: int) -> list:
+    # Run _distance_tile over the upper triangle of the pair matrix, serially or on a process pool
+    if tile_size < 1:
+        raise ValueError("Argument 'tile_size' must be positive")
+
+    num_words = len(words)
+    tiles = [(i, min(i + tile_size, num_words), j, min(j + tile_size, num_words))
+             for i in range(0, num_words, tile_size) for j in range(i, num_words, tile_size)]
+
+    results = []
+    if workers is None or workers <= 1 or len(tiles) <= 1:
+        for bounds in tiles:
+            results.append(_distance_tile(words, bounds, mode, threshold))
+            # Early exit at the first tile with a violating pair
+            if mode.endswith('below') and results[-1]:
+                break
+        return results
+
+    source = words.path if isinstance(words, MappedCode) else words
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_tile_worker,
+                             initargs=(source,)) as executor:
+        futures = [executor.submit(_pool_distance_tile, bounds, mode, threshold) for bounds in tiles]
+        for future in as_completed(futures):
+            results.append(future.result())
+            if mode.endswith('below') and results[-1]:
+                for pending in futures:
+                    pending.cancel()
+                break
+
+    return results
+
+def _gc_indicator(word: int, length: int) -> int:
+    # Compress the pair XORs of a packed codeword into a length/2-bit GC indicator word
+    pairs = (word ^ (word >> 1)) & _pair_mask(length)
+    indicator = 0
+    for i in range(length // 2):
+        indicator |= ((pairs >> (2 * i)) & 1) << i
+    return indicator
+
+def _gc_domain(rows: List[int], length: int):
+    """
+    Transform packed generator rows into the GC-indicator domain.
+    Each row becomes the augmented word (GC indicator, codeword, message bit) and the rows are
+    reduced on the GC-indicator columns, so the code splits into a basis part whose GC patterns
+    are independent and a kernel part whose codewords all have GC weight 0 (and that does not
+    change the GC pattern of anything it is added to).
+
+    :return: (basis, kernel_span, shift) where basis holds the reduced augmented rows, kernel_span
+             the XOR of every subset of the kernel rows, and shift the position of the GC indicator;
+             the codeword is (word >> k) & (2^length - 1) and the message index word & (2^k - 1)
+    """
+
+    num_rows = len(rows)
+    shift = length + num_rows
+    augmented = [(_gc_indicator(row, length) << shift) | (row << num_rows) | (1 << (num_rows - 1 - i))
+                 for i, row in enumerate(rows)]
+
+    basis, pivots, kernel = _row_reduce(augmented, shift + length // 2, range(length // 2))
+
+    kernel_span = [0]
+    for row in kernel:
+        kernel_span += [word ^ row for word in kernel_span]
+
+    return basis, kernel_span, shift
+
+def _gc_weight_search(basis: List[int], shift: int, num_columns: int, gc_weight: int,
+                      visit: Callable[[int], None]) -> None:
+    """
+    Call visit for every XOR of a subset of the basis rows whose GC weight is gc_weight.
+    The basis is in reduced form on the GC indicator, so choosing a row sets its pivot column and
+    the GC weight lies between the number of chosen rows and that number plus the columns still
+    free; branches where gc_weight is out of those bounds are pruned. The last rows are combined
+    through a lookup table to keep the recursion shallow.
+    """
+
+    num_basis = len(basis)
+    num_table = min(num_basis, 8)
+    table = [0]
+    for row in basis[num_basis - num_table:]:
+        table += [word ^ row for word in table]
+
+    depth = num_basis - num_table
+    free_columns = num_columns - num_basis
+
+    def extend(i: int, chosen: int, acc: int) -> None:
+        # Bounds on the GC weight of everything below this branch
+        if chosen > gc_weight or chosen + (num_basis - i) + free_columns < gc_weight:
+            return
+        if i == depth:
+            for word in table:
+                word ^= acc
+                if (word >> shift).bit_count() == gc_weight:
+                    visit(word)
+            return
+        extend(i + 1, chosen, acc)
+        extend(i + 1, chosen + 1, acc ^ basis[i])
+
+    extend(0, 0, 0)
+
+def _span_weights(rows: List[int], length: int) -> List[int]:
+    """
+    Count the weights of all 2^len(rows) XORs of subsets of rows.
+    The high rows are walked in Gray-code order (one XOR per step) and each step is combined
+    with a lookup table holding the span of the last 8 rows.
+
+    :return: List where entry w is the number of subsets whose XOR has weight w
+    """
+
+    num_table = min(len(rows), 8)
+    table = [0]
+    for row in rows[len(rows) - num_table:]:
+        table += [word ^ row for word in table]
+
+    steps = rows[:len(rows) - num_table]
+    counts = [0] * (length + 1)
+    acc = 0
+    for t in range(1 << len(steps)):
+        if t:
+            acc ^= steps[(t & -t).bit_length() - 1]
+        for word in table:
+            counts[(acc ^ word).bit_count()] += 1
+
+    return counts
+
+def _dual_basis(basis: List[int], pivots: List[int], length: int) -> List[int]:
+    # Basis of the dual of a code given in reduced form: one row per non-pivot column
+    dual = []
+    for column in range(length):
+        if column in pivots:
+            continue
+        bit = 1 << (length - 1 - column)
+        row = bit
+        for word, pivot in zip(basis, pivots):
+            if word & bit:
+                row |= 1 << (length - 1 - pivot)
+        dual.append(row)
+    return dual
+
+def _macwilliams(dual_counts: List[int], length: int, dual_dimension: int) -> List[int]:
+    # Weight distribution of a code from the weight distribution of its dual (Krawtchouk transform)
+    counts = []
+    for j in range(length + 1):
+        total = 0
+        for i, count in enumerate(dual_counts):
+            if count:
+                krawtchouk = sum((-1) ** s * comb(i, s) * comb(length - i, j - s)
+                                 for s in range(max(0, j - (length - i)), min(i, j) + 1))
+                total += count * krawtchouk
+        counts.append(total >> dual_dimension)
+    return counts
+
+def _numpy_span_weights(rows: List[int], length: int, chunk_size: int = 65536) -> List[int]:
+    # NumPy version of _span_weights: encode chunks of the span as word arrays and
+    # histogram their popcounts (taken byte by byte through a lookup table)
+    popcount = np.array([byte.bit_count() for byte in range(256)], dtype=np.intp)
+    counts = np.zeros(length + 1, dtype=np.int64)
+    for chunk in _numpy_encode_chunks(rows, length, 0, 1 << len(rows), chunk_size):
+        weights = popcount[chunk.view(np.uint8)].sum(axis=1)
+        counts += np.bincount(weights, minlength=length + 1)
+    return counts.tolist()
+
+def _weight_distribution(basis: List[int], pivots: List[int], length: int,
+                         backend: str = 'python') -> Dict[int, int]:
+    # Weight distribution of the span of a reduced basis, through whichever of the code
+    # and its dual has the smaller dimension
+    span_weights = _numpy_span_weights if backend == 'numpy' else _span_weights
+    if len(basis) <= length - len(basis):
+        counts = span_weights(basis, length)
+    else:
+        dual = _dual_basis(basis, pivots, length)
+        counts = _macwilliams(span_weights(dual, length), length, len(dual))
+
+    return {weight: count for weight, count in enumerate(counts) if count}
+
+def _words_to_ints(array, length: int) -> List[int]:
+    # Convert rows of a big-endian uint64 word array into packed integers
+    array = np.ascontiguousarray(array, dtype=">u8")
+    num_words = array.shape[1]
+    pad = num_words * 64 - length
+    row_bytes = num_words * 8
+    data = array.tobytes()
+    return [int.from_bytes(data[i:i + row_bytes], "big") >> pad for i in range(0, len(data), row_bytes)]
+
+def _ints_to_words(words: Iterable[int], length: int):
+    # Convert packed integers into a uint64 word array, zero-padded on the right
+    words = list(words)
+    num_words = max(1, (length + 63) // 64)
+    pad = num_words * 64 - length
+    data = b"".join((word << pad).to_bytes(num_words * 8, "big") for word in words)
+    return np.frombuffer(data, dtype=">u8").astype(np.uint64).reshape(len(words), num_words)
+
+def encode_range(generator_matrix: List[List[int]], start: int = 0, stop: Optional[int] = None,
+                 backend: str = 'auto', chunk_size: int = 65536) -> Iterator[List[int]]:
+    """
+    Encode the messages with indices start..stop-1 into packed codewords, chunk by chunk.
+    Message index i is the message whose bits are the binary digits of i, which is the
+    order used by message(); no message list is ever built.
+
+    :param generator_matrix: 2D list (generator matrix) where elements are binary (0 or 1)
+    :param start: First message index
+    :param stop: One past the last message index, defaults to 2^k
+    :param backend: 'python', 'numpy' or 'auto' (see codewords)
+    :param chunk_size: Number of codewords per yielded chunk
+    :return: Iterator over lists of packed codewords, in message index order
+    :raises TypeError: If the generator matrix is not a 2D list of integers
+    :raises ValueError: If the generator matrix is not binary or rectangular, or the range is invalid
+    """
+
+    rows, length = _check_generator(generator_matrix)
+    num_rows = len(rows)
+
+    if stop is None:
+        stop = 1 << num_rows
+    if not 0 <= start <= stop <= 1 << num_rows:
+        raise ValueError("Message indices must satisfy 0 <= start <= stop <= 2^k")
+    if chunk_size < 1:
+        raise ValueError("Argument 'chunk_size' must be positive")
+
+    yield from _encode_rows(rows, length, start, stop, backend, chunk_size)
+
+def _numpy_encode_chunks(rows: List[int], length: int, start: int, stop: int, chunk_size: int):
+    # Encode message index ranges into uint64 word arrays (see PackedCode.to_array)
+    num_rows = len(rows)
+    row_words = _ints_to_words(rows, length)
+    for i in range(start, stop, chunk_size):
+        index = np.arange(i, min(i + chunk_size, stop), dtype=np.uint64)
+        chunk = np.zeros((len(index), row_words.shape[1]), dtype=np.uint64)
+        for j in range(num_rows):
+            # All-ones mask for messages whose bit j is set, zero otherwise
+            mask = np.uint64(0) - ((index >> np.uint64(num_rows - 1 - j)) & np.uint64(1))
+            chunk ^= row_words[j] & mask[:, None]
+        yield chunk
+
+def _encode_rows(rows: List[int], length: int, start: int, stop: int,
+                 backend: str = 'auto', chunk_size: int = 65536) -> Iterator[List[int]]:
+    # Encoding core of encode_range, on packed generator rows that are already validated
+    backend = _resolve_backend(backend)
+    num_rows = len(rows)
+
+    # NumPy message indices are uint64, so larger dimensions use the Python encoder
+    if backend == 'numpy' and num_rows <= 64:
+        for chunk in _numpy_encode_chunks(rows, length, start, stop, chunk_size):
+            yield _words_to_ints(chunk, length)
+        return
+
+    tables = _encoder_tables(rows)
+    for i in range(start, stop, chunk_size):
+        yield [_encode_index(index, tables) for index in range(i, min(i + chunk_size, stop))]
+
+class PackedCode:
+    """
+    A binary code stored as packed integer codewords of a common length.
+    Each codeword is a Python integer (see pack_codeword), which needs a few machine
+    words per codeword instead of one list element per bit. With NumPy installed the
+    code can also be exported to a uint64 word array of shape (codewords, ceil(length / 64)).
+    """
+
+    def __init__(self, words: Iterable[int], length: int):
+        """
+        :param words: The packed codewords
+        :param length: The length of every codeword in bits
+        :raise TypeError: If length or any word is not an integer
+        :raise ValueError: If any word does not fit in length bits
+        """
+
+        if not isinstance(length, int):
+            raise TypeError("Argument 'length' must be of type 'int'")
+
+        self.length = length
+        self.words = list(words)
+
+        # Validate all packed codewords once
+        for word in self.words:
+            _check_packed(word, length)
+
+    @classmethod
+    def _from_trusted(cls, words: List[int], length: int) -> "PackedCode":
+        # Wrap words that are known to be valid without checking them again
+        code = cls.__new__(cls)
+        code.words = words
+        code.length = length
+        return code
+
+    @classmethod
+    def from_code(cls, code: List[List[int]], length: Optional[int] = None) -> "PackedCode":
+        """
+        Build a packed code from a 2D list of binary codewords.
+
+        :param code: 2D list where each row is a binary codeword
+        :param length: Codeword length, only needed when the code is empty
+        :return: The packed code
+        :raise TypeError: If the code is not a 2D list or contains non-integer elements
+        :raise ValueError: If elements are not binary or rows have different lengths
+        """
+
+        if not code and length is None:
+            raise ValueError("The length is required to pack an empty code")
+
+        if not all(isinstance(row, list) for row in code):
+            raise TypeError("Code must be a 2D list of integers")
+
+        num_cols = len(code[0]) if code else length
+        if not all(len(row) == num_cols for row in code):
+            raise ValueError("All codewords must have the same length")
+
+        # pack_codeword validates every row
+        return cls._from_trusted([pack_codeword(row) for row in code], num_cols)
+
+    @classmethod
+    def from_generator(cls, generator_matrix: List[List[int]], backend: str = 'auto') -> "PackedCode":
+        """
+        Encode every message of a generator matrix straight into a packed code,
+        in the same order as codewords(message(k), generator_matrix).
+
+        :param generator_matrix: 2D list (generator matrix) where elements are binary (0 or 1)
+        :param backend: 'python', 'numpy' or 'auto' (see codewords)
+        :return: The packed code
+        """
+
+        words = []
+        for chunk in encode_range(generator_matrix, backend=backend):
+            words.extend(chunk)
+        return cls(words, len(generator_matrix[0]))
+
+    def to_code(self) -> List[List[int]]:
+        """
+        Convert the packed code back into a 2D list of binary codewords.
+
+        :return: 2D list where each row is a binary codeword
+        """
+
+        return [unpack_codeword(word, self.length) for word in self.words]
+
+    def to_array(self):
+        """
+        Export the code as a NumPy uint64 word array.
+        Word j of a row holds bits 64j to 64j+63 of the codeword, most significant bit first;
+        the last word is zero-padded on the right.
+
+        :return: numpy.ndarray of dtype uint64 with shape (len(self), ceil(length / 64))
+        :raise ImportError: If NumPy is not installed
+        """
+
+        if np is None:
+            raise ImportError("NumPy is required for the uint64 word array representation")
+
+        return _ints_to_words(self.words, self.length)
+
+    @classmethod
+    def from_array(cls, array, length: int) -> "PackedCode":
+        """
+        Build a packed code from a uint64 word array produced by to_array.
+
+        :param array: 2D array of uint64 words, one row per codeword
+        :param length: The length of every codeword in bits
+        :return: The packed code
+        :raise ImportError: If NumPy is not installed
+        """
+
+        if np is None:
+            raise ImportError("NumPy is required for the uint64 word array representation")
+
+        return cls(_words_to_ints(array, length), length)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __iter__(self):
+        return iter(self.words)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return PackedCode._from_trusted(self.words[index], self.length)
+        return self.words[index]
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, PackedCode):
+            return NotImplemented
+        return self.length == other.length and self.words == other.words
+
+    def __repr__(self) -> str:
+        return f"PackedCode(length={self.length}, codewords={len(self.words)})"
+
+    def weights(self) -> List[int]:
+        """
+        :return: The weight of each codeword, in code order
+        """
+
+        return [word.bit_count() for word in self.words]
+
+    def gc_weights(self) -> List[int]:
+        """
+        :return: The GC-content weight of each codeword, in code order
+        :raise ValueError: If the codeword length is not even
+        """
+
+        if self.length % 2 != 0:
+            raise ValueError("The length of each codeword must be even")
+
+        mask = _pair_mask(self.length)
+        return [((word ^ (word >> 1)) & mask).bit_count() for word in self.words]
+
+    def complement(self) -> "PackedCode":
+        """
+        :return: A new packed code where each codeword is complemented
+        :raise ValueError: If the codeword length is not even
+        """
+
+        if self.length % 2 != 0:
+            raise ValueError("The length of each codeword must be even")
+
+        mask = (1 << self.length) - 1
+        return PackedCode([word ^ mask for word in self.words], self.length)
+
+    def reverse(self) -> "PackedCode":
+        """
+        :return: A new packed code where each codeword is reversed (see reverse_codeword)
+        :raise ValueError: If the codeword length is not even
+        """
+
+        if self.length % 2 != 0:
+            raise ValueError("The length of each codeword must be even")
+
+        return PackedCode(_reverse_words(self.words, self.length), self.length)
+
+class GeneratorAnalysis:
+    """
+    Encoded code and derived indexes of one generator matrix, computed lazily on first use.
+    Instances are shared through the generator_analysis cache, so dna_code queries with different
+    constraints or GC weights on the same generator matrix encode the code only once, and
+    screen_generators computes the linear minimum distance and GC distribution only once.
+    Once the code is encoded (use_cache), an instance holds the 2^k packed codewords, a
+    codeword -> index dictionary and up to two partner lists of 2^k entries.
+    """
+
+    def __init__(self, rows: List[int], length: int, key: str):
+        """
+        :param rows: Packed generator rows (already validated)
+        :param length: Codeword length
+        :param key: The generator hash this analysis is cached under
+        """
+
+        self.rows = rows
+        self.length = length
+        self.key = key
+        self.dimension = len(rows)
+        self.rank = len(_row_reduce(rows, length, range(length))[0])
+        self._code = None
+        self._index = None
+        self._gc_buckets = None
+        self._maps: Dict[str, List[int]] = {}
+        self._minimum_distance = None
+        self._gc_distribution = None
+
+    @property
+    def full_rank(self) -> bool:
+        # Without dependent rows every codeword appears exactly once
+        return self.rank == self.dimension
+
+    @property
+    def code(self) -> PackedCode:
+        """
+        :return: All 2^k codewords as a packed code, in message order
+        """
+
+        if self._code is None:
+            words = []
+            for chunk in _encode_rows(self.rows, self.length, 0, 1 << self.dimension):
+                words.extend(chunk)
+            self._code = PackedCode._from_trusted(words, self.length)
+        return self._code
+
+    def gc_bucket(self, gc_weight: int) -> List[int]:
+        """
+        :param gc_weight: GC-content weight
+        :return: Message indices (ascending) of the codewords with that GC-content weight
+        """
+
+        if self._gc_buckets is None:
+            buckets: Dict[int, List[int]] = {}
+            for index, weight in enumerate(self.code.gc_weights()):
+                buckets.setdefault(weight, []).append(index)
+            self._gc_buckets = buckets
+        return self._gc_buckets.get(gc_weight, [])
+
+    def partner_map(self, name: str) -> List[int]:
+        """
+        Message index of the reverse ('reverse') or reverse complement ('reverse_complement')
+        of every codeword, or -1 if it is not a codeword.
+
+        :param name: 'reverse' or 'reverse_complement'
+        :return: List of message indices, parallel to the code
+        """
+
+        if name not in self._maps:
+            words = self.code.words
+            if self._index is None:
+                self._index = {word: index for index, word in enumerate(words)}
+            if name == 'reverse_complement':
+                mask = (1 << self.length) - 1
+                words = [word ^ mask for word in words]
+            self._maps[name] = [self._index.get(word, -1) for word in _reverse_words(words, self.length)]
+        return self._maps[name]
+
+    def dna_code_indices(self, constraints: Iterable[str], gc_weight: Optional[int] = None) -> List[int]:
+        """
+        Message indices of the codewords dna_code keeps for the built-in constraints.
+        For a full-rank generator the reverse filter keeps a codeword exactly when it is not its
+        own reverse and its reverse comes later in the code (or is not a codeword), and the
+        reverse-complement filter does the same on what the reverse filter kept, so both become
+        lookups in the partner maps.
+
+        :param constraints: Subset of 'reverse', 'reverse_complement' and 'gc_content'
+        :param gc_weight: GC-content weight, required with 'gc_content'
+        :return: Ascending list of message indices
+        :raises ValueError: If the generator is not full rank or a constraint is not built in
+        """
+
+        constraints = set(constraints)
+        if not constraints <= {'reverse', 'reverse_complement', 'gc_content'}:
+            raise ValueError("Only the built-in constraints can be resolved on indices")
+        if not self.full_rank:
+            raise ValueError("Index-based filtering requires linearly independent generator rows")
+
+        candidates = self.gc_bucket(gc_weight) if 'gc_content' in constraints else range(1 << self.dimension)
+        reverse_of = self.partner_map('reverse') if 'reverse' in constraints else None
+        reverse_complement_of = (self.partner_map('reverse_complement')
+                                 if 'reverse_complement' in constraints else None)
+
+        def kept_by_reverse(index: int) -> bool:
+            partner = reverse_of[index]
+            return partner != index and (partner < 0 or partner > index)
+
+        indices = []
+        for index in candidates:
+            if reverse_of is not None and not kept_by_reverse(index):
+                continue
+            if reverse_complement_of is not None:
+                partner = reverse_complement_of[index]
+                if partner == index:
+                    continue
+                # An earlier reverse complement that passed the reverse filter was kept first
+                if 0 <= partner < index and (reverse_of is None or kept_by_reverse(partner)):
+                    continue
+            indices.append(index)
+
+        return indices
+
+    def minimum_distance(self) -> int:
+        """
+        :return: The minimum distance of the spanned code, memoized (see minimum_distance)
+        """
+
+        if self._minimum_distance is None:
+            self._minimum_distance = minimum_distance([_unpack_bits(row, self.length) for row in self.rows])
+        return self._minimum_distance
+
+    def gc_weight_distribution(self) -> Dict[int, int]:
+        """
+        :return: The GC-content weight distribution, memoized (see gc_weight_distribution)
+        """
+
+        if self._gc_distribution is None:
+            self._gc_distribution = gc_weight_distribution([_unpack_bits(row, self.length) for row in self.rows])
+        return dict(self._gc_distribution)
+
+    def __repr__(self) -> str:
+        return f"GeneratorAnalysis(length={self.length}, dimension={self.dimension}, key={self.key[:12]})"
+
+# LRU cache of generator analyses, keyed by generator_hash
+_GENERATOR_CACHE: "OrderedDict[str, GeneratorAnalysis]" = OrderedDict()
+_GENERATOR_CACHE_SIZE = 4
+
+def generator_hash(generator_matrix: List[List[int]]) -> str:
+    """
+    Compute a canonical hash of a generator matrix.
+    The hash covers the dimensions and every row in order (the row order fixes the message order).
+
+    :param generator_matrix: 2D list (generator matrix) where elements are binary (0 or 1)
+    :return: Hex SHA-256 digest
+    :raises TypeError: If the generator matrix is not a 2D list of integers
+    :raises ValueError: If the generator matrix is not binary or rectangular
+    """
+
+    rows, length = _check_generator(generator_matrix)
+    return _rows_hash(rows, length)
+
+def _rows_hash(rows: List[int], length: int) -> str:
+    # Hash of packed generator rows: dimensions, then every row as fixed-width big-endian bytes
+    num_bytes = (length + 7) // 8
+    digest = hashlib.sha256(f"{len(rows)}x{length}:".encode())
+    for row in rows:
+        digest.update(row.to_bytes(num_bytes, "big"))
+    return digest.hexdigest()
+
+def generator_analysis(generator_matrix: List[List[int]]) -> GeneratorAnalysis:
+    """
+    Return the cached analysis of a generator matrix, creating it if needed.
+    The cache keeps the most recently used analyses, up to set_generator_cache_size entries.
+    The bound is a number of entries, not of bytes: an entry whose code was encoded holds
+    several lists of 2^k items (see GeneratorAnalysis), so lower the size or call
+    clear_generator_cache when caching generators of large dimension.
+
+    :param generator_matrix: 2D list (generator matrix) where elements are binary (0 or 1)
+    :return: The GeneratorAnalysis of the matrix
+    :raises TypeError: If the generator matrix is not a 2D list of integers
+    :raises ValueError: If the generator matrix is not binary or rectangular
+    """
+
+    rows, length = _check_generator(generator_matrix)
+    key = _rows_hash(rows, length)
+
+    if key in _GENERATOR_CACHE:
+        _GENERATOR_CACHE.move_to_end(key)
+        return _GENERATOR_CACHE[key]
+
+    analysis = GeneratorAnalysis(rows, length, key)
+    if _GENERATOR_CACHE_SIZE > 0:
+        _GENERATOR_CACHE[key] = analysis
+        while len(_GENERATOR_CACHE) > _GENERATOR_CACHE_SIZE:
+            _GENERATOR_CACHE.popitem(last=False)
+
+    return analysis
+
+def set_generator_cache_size(size: int) -> None:
+    """
+    Set the maximum number of generator analyses kept by generator_analysis (0 disables caching).
+    The cache is bounded by this count only; the memory of an entry grows with 2^k once its code
+    is encoded.
+
+    :param size: The new cache size
+    :raise TypeError: If size is not an integer
+    :raise ValueError: If size is negative
+    """
+
+    global _GENERATOR_CACHE_SIZE
+
+    if not isinstance(size, int):
+        raise TypeError("Argument 'size' must be of type 'int'")
+    if size < 0:
+        raise ValueError("Argument 'size' must be non-negative")
+
+    _GENERATOR_CACHE_SIZE = size
+    while len(_GENERATOR_CACHE) > size:
+        _GENERATOR_CACHE.popitem(last=False)
+
+def clear_generator_cache() -> None:
+    """
+    Remove every cached generator analysis.
+    """
+
+    _GENERATOR_CACHE.clear()
+
+# Code file layout: header, JSON metadata, zero padding to a multiple of 8 bytes, then one
+# big-endian row of ceil(length / 8) bytes per codeword holding the packed codeword
+_CODE_FILE_MAGIC = b"PYDNACD1"
+_CODE_FILE_HEADER = struct.Struct("<8sIIQ32sI")
+
+def save_code(path: str, code, length: Optional[int] = None,
+              generator_matrix: Optional[List[List[int]]] = None,
+              constraints: Optional[List[str]] = None, gc_weight: Optional[int] = None) -> int:
+    """
+    Write a code to a compact binary file that open_code can memory-map.
+    The header stores the codeword length, the dimension and hash of the generator matrix and
+    the constraints the code was built with; the rows are the bit-packed codewords.
+    Codewords are written as they come, so an iterator such as iter_dna_code(..., packed=True)
+    is stored without holding the code in memory.
+
+    :param path: The file to write
+    :param code: PackedCode, 2D list of binary codewords, or iterable of packed codewords
+    :param length: Codeword length, required for an iterable of packed codewords
+    :param generator_matrix: The generator matrix the code comes from, if any
+    :param constraints: The dna_code constraints applied to the code, if any
+    :param gc_weight: The GC-content weight used with 'gc_content', if any
+    :return: The number of codewords written
+    :raise ValueError: If the codeword length is unknown, or a codeword does not fit in it
+    """
+
+    if isinstance(code, (PackedCode, MappedCode)):
+        length = code.length if length is None else length
+        words = iter(code)
+    elif isinstance(code, list) and code and isinstance(code[0], list):
+        packed = PackedCode.from_code(code)
+        length = packed.length if length is None else length
+        words = iter(packed)
+    else:
+        words = iter(code)
+
+    if length is None:
+        raise ValueError("The codeword length is required to save packed codewords")
+
+    if generator_matrix is not None:
+        rows, generator_length = _check_generator(generator_matrix)
+        dimension = len(rows)
+        digest = bytes.fromhex(_rows_hash(rows, generator_length))
+    else:
+        dimension = 0
+        digest = bytes(32)
+
+    metadata = json.dumps({"constraints": list(constraints or []), "gc_weight": gc_weight}).encode()
+    header_size = _CODE_FILE_HEADER.size + len(metadata)
+    padding = bytes(-header_size % 8)
+    row_bytes = (length + 7) // 8
+
+    # Write a temporary file and rename it, so an invalid codeword never leaves a partial code file
+    temporary = path + ".tmp"
+    count = 0
+    try:
+        with open(temporary, "wb") as file:
+            file.write(_CODE_FILE_HEADER.pack(_CODE_FILE_MAGIC, length, dimension, 0, digest, len(metadata)))
+            file.write(metadata + padding)
+
+            for chunk in _chunked(words, 65536):
+                for word in chunk:
+                    if word < 0 or word >> length:
+                        raise ValueError("Word must be a non-negative integer of at most 'length' bits")
+                file.write(b"".join(word.to_bytes(row_bytes, "big") for word in chunk))
+                count += len(chunk)
+
+            # The number of codewords is only known at the end
+            file.seek(0)
+            file.write(_CODE_FILE_HEADER.pack(_CODE_FILE_MAGIC, length, dimension, count, digest, len(metadata)))
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+    os.replace(temporary, path)
+    return count
+
+class MappedCode:
+    """
+    A code file written by save_code, memory-mapped read-only.
+    Rows are read in place: indexing and iterating decode packed codewords straight from the map,
+    rows gives a zero-copy memoryview and as_array a zero-copy NumPy view, so several processes can
+    analyse one code file without copying or re-encoding it. A MappedCode can be passed wherever a
+    packed code is accepted (packed_minimum_distance, has_minimum_distance, distance_distribution).
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: The code file
+        :raise ValueError: If the file is not a code file
+        """
+
+        self.path = path
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # Close the map if the file turns out not to be a valid code file
+        try:
+            if len(self._map) < _CODE_FILE_HEADER.size:
+                raise ValueError("Not a pydnacode code file")
+
+            magic, length, dimension, count, digest, metadata_size = _CODE_FILE_HEADER.unpack_from(self._map)
+            if magic != _CODE_FILE_MAGIC:
+                raise ValueError("Not a pydnacode code file")
+
+            offset = _CODE_FILE_HEADER.size
+            metadata = json.loads(self._map[offset:offset + metadata_size])
+            offset += metadata_size
+            offset += -offset % 8
+
+            self.length = length
+            self.dimension = dimension
+            self.generator_hash = digest.hex() if any(digest) else None
+            self.constraints = metadata["constraints"]
+            self.gc_weight = metadata["gc_weight"]
+            self._count = count
+            self._row_bytes = (length + 7) // 8
+            self._offset = offset
+
+            if len(self._map) < offset + count * self._row_bytes:
+                raise ValueError("The code file is truncated")
+        except BaseException:
+            self._map.close()
+            raise
+
+    @property
+    def rows(self) -> memoryview:
+        """
+        :return: Zero-copy view of the row data (len(self) rows of ceil(length / 8) bytes)
+        """
+
+        return memoryview(self._map)[self._offset:self._offset + self._count * self._row_bytes]
+
+    def as_array(self):
+        """
+        :return: Zero-copy numpy.ndarray of dtype uint8 with shape (len(self), ceil(length / 8))
+        :raise ImportError: If NumPy is not installed
+        """
+
+        if np is None:
+            raise ImportError("NumPy is required for the array view of a code file")
+
+        return np.frombuffer(self._map, dtype=np.uint8, count=self._count * self._row_bytes,
+                             offset=self._offset).reshape(self._count, self._row_bytes)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Codeword index out of range")
+
+        start = self._offset + index * self._row_bytes
+        return int.from_bytes(self._map[start:start + self._row_bytes], "big")
+
+    def __iter__(self) -> Iterator[int]:
+        row_bytes = self._row_bytes
+        rows = self.rows
+        for start in range(0, len(rows), row_bytes):
+            yield int.from_bytes(rows[start:start + row_bytes], "big")
+
+    def __enter__(self) -> "MappedCode":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __getstate__(self):
+        # Pickling only sends the path; the receiving process maps the file itself
+        return {"path": self.path}
+
+    def __setstate__(self, state) -> None:
+        self.__init__(state["path"])
+
+    def __repr__(self) -> str:
+        return f"MappedCode(path={self.path!r}, length={self.length}, codewords={self._count})"
+
+    def close(self) -> None:
+        self._map.close()
+
+    def to_packed(self) -> PackedCode:
+        """
+        :return: A PackedCode copy of the mapped code
+        """
+
+        return PackedCode._from_trusted(list(self), self.length)
+
+    def weights(self) -> List[int]:
+        """
+        :return: The weight of each codeword, in file order
+        """
+
+        return [word.bit_count() for word in self]
+
+    def gc_weights(self) -> List[int]:
+        """
+        :return: The GC-content weight of each codeword, in file order
+        :raise ValueError: If the codeword length is not even
+        """
+
+        if self.length % 2 != 0:
+            raise ValueError("The length of each codeword must be even")
+
+        mask = _pair_mask(self.length)
+        return [((word ^ (word >> 1)) & mask).bit_count() for word in self]
+
+def open_code(path: str) -> MappedCode:
+    """
+    Memory-map a code file written by save_code.
+
+    :param path: The code file
+    :return: The mapped code
+    :raise ValueError: If the file is not a code file
+    """
+
+    return MappedCode(path)
+
+def parity_check_matrix(generator_matrix: List[List[int]]) -> List[List[int]]:
+    """
+    Derive a parity-check matrix of the code of a generator matrix.
+    Every codeword c of codewords(message(k), generator_matrix) satisfies H c^T = 0, and the rows
+    of H span the dual code, so H has length - rank rows. It is read off the reduced row echelon
+    form of the generator matrix: one check per non-pivot column.
+
+    :param generator_matrix: A 2D list representing the generator matrix
+    :return: The parity-check matrix as a 2D list (no rows if the code is the whole space)
+    :raise TypeError: If the generator matrix is not a 2D list of integers
+    :raise ValueError: If the generator matrix is not binary or its rows have different lengths
+    """
+
+    rows, length = _check_generator(generator_matrix)
+    basis, pivots, _ = _row_reduce(rows, length, range(length))
+    return [_unpack_bits(row, length) for row in _dual_basis(basis, pivots, length)]
+
+class DecodedWord(NamedTuple):
+    """
+    Result of decoding one read with SyndromeDecoder or NearestCodewordIndex.
+    A read that cannot be decoded gives codeword None, message -1 and errors -1.
+    """
+
+    codeword: Optional[int]
+    message: int
+    errors: int
+
+_DECODE_FAILURE = DecodedWord(None, -1, -1)
+
+class SyndromeDecoder:
+    """
+    Syndrome decoder of the linear code of a generator matrix, on packed reads (see pack_codeword).
+    The syndrome of a read is computed with one lookup per byte in tables of the parity-check columns,
+    and the table of coset leaders maps it to the lightest error pattern with that syndrome, so a
+    decoded read is a closest codeword. The table is built breadth first over the error weight:
+    the leaders of weight w + 1 are the leaders of weight w with one more bit set, which reaches
+    every coset at its minimum weight. It has up to 2^(length - rank) entries; max_weight bounds it
+    for long codes, and reads whose syndrome is not in the table are decoding failures.
+    """
+
+    def __init__(self, generator_matrix: List[List[int]], max_weight: Optional[int] = None):
+        """
+        :param generator_matrix: A 2D list representing the generator matrix
+        :param max_weight: Largest error weight in the coset leader table; None fills the whole table
+        :raise TypeError: If the generator matrix is not a 2D list of integers
+        :raise ValueError: If the generator matrix is not binary or its rows have different lengths
+        """
+
+        rows, length = _check_generator(generator_matrix)
+        basis, pivots, _ = _row_reduce(rows, length, range(length))
+
+        self.length = length
+        self.rank = len(pivots)
+        self.parity_checks = _dual_basis(basis, pivots, length)
+
+        # Syndrome contribution of each bit position, column 0 being the leftmost bit
+        redundancy = len(self.parity_checks)
+        columns = [sum(((check >> (length - 1 - j)) & 1) << (redundancy - 1 - i)
+                       for i, check in enumerate(self.parity_checks))
+                   for j in range(length)]
+        self._syndrome_tables = _encoder_tables(columns)
+        self._membership = _CodeMembership(rows, length)
+        self.leaders = self._coset_leaders(columns, redundancy, max_weight)
+
+    @staticmethod
+    def _coset_leaders(columns: List[int], redundancy: int, max_weight: Optional[int]) -> Dict[int, int]:
+        # Breadth-first search over the error weight: syndrome -> lightest error pattern
+        length = len(columns)
+        bits = [1 << (length - 1 - j) for j in range(length)]
+        leaders = {0: 0}
+        frontier = [(0, 0)]
+        weight = 0
+        num_cosets = 1 << redundancy
+
+        while frontier and len(leaders) < num_cosets and (max_weight is None or weight < max_weight):
+            weight += 1
+            next_frontier = []
+            for error, syndrome in frontier:
+                for bit, column in zip(bits, columns):
+                    if error & bit:
+                        continue
+                    new_syndrome = syndrome ^ column
+                    if new_syndrome not in leaders:
+                        leaders[new_syndrome] = error | bit
+                        next_frontier.append((error | bit, new_syndrome))
+            frontier = next_frontier
+
+        return leaders
+
+    def syndrome(self, word: int) -> int:
+        """
+        :param word: A packed read of length bits
+        :return: The syndrome H word^T as a packed integer (0 for codewords)
+        """
+
+        _check_packed(word, self.length)
+        return _encode_index(word, self._syndrome_tables)
+
+    def decode(self, word: int) -> DecodedWord:
+        """
+        Decode one packed read.
+
+        :param word: A packed read of length bits
+        :return: DecodedWord(codeword, message, errors) with the corrected packed codeword, its first
+                 message index (see unpack_codeword to get the message bits) and the number of
+                 corrected bits
+        :raise TypeError: If word is not an integer
+        :raise ValueError: If word does not fit in length bits
+        """
+
+        return self.decode_batch([word])[0]
+
+    def decode_batch(self, words: Iterable[int], validate: bool = True) -> List[DecodedWord]:
+        """
+        Decode a batch of packed reads.
+
+        :param words: Packed reads of length bits
+        :param validate: Check the reads; pass False for reads that are already known to be valid
+        :return: One DecodedWord per read, in order
+        :raise TypeError: If a read is not an integer
+        :raise ValueError: If a read does not fit in length bits
+        """
+
+        words = list(words)
+        if validate:
+            for word in words:
+                _check_packed(word, self.length)
+
+        tables, leaders, index = self._syndrome_tables, self.leaders, self._membership.index
+        decoded = []
+        for word in words:
+            syndrome = 0
+            remaining = word
+            for table in tables:
+                syndrome ^= table[remaining & 255]
+                remaining >>= 8
+
+            leader = leaders.get(syndrome)
+            if leader is None:
+                decoded.append(_DECODE_FAILURE)
+                continue
+            codeword = word ^ leader
+            decoded.append(DecodedWord(codeword, index(codeword), leader.bit_count()))
+
+        return decoded
+
+class NearestCodewordIndex:
+    """
+    Nearest-codeword index of a packed code that need not be linear, such as the output of dna_code.
+    The bit positions are cut into segments, radius + 1 by default, and each segment has a hash table
+    from its value to the codewords having that value. A codeword within distance radius of a read
+    differs from it in at most radius segments, so by the pigeonhole principle it shares at least one
+    segment with the read, and only the codewords in the read's buckets need to be compared.
+    With fewer, wider segments some segment differs in at most radius // segments bits, and every
+    value within that distance of the read's segment is looked up (multi-index hashing).
+    Codewords can be added at any time.
+    """
+
+    def __init__(self, code: Iterable[int], radius: int, length: Optional[int] = None,
+                 segments: Optional[int] = None):
+        """
+        :param code: PackedCode, MappedCode or iterable of packed codewords
+        :param radius: Largest distance searched; (d - 1) // 2 for a code of minimum distance d
+                       decodes up to the guaranteed error-correction capability
+        :param length: The length of the codewords in bits; only needed for a plain iterable
+        :param segments: Number of segments; fewer segments give smaller buckets for large codes,
+                         but each query looks up more values
+        :raise TypeError: If radius, length or a codeword is not an integer
+        :raise ValueError: If radius is negative, segments is not positive, length is missing or
+                           a codeword does not fit in length bits
+        """
+
+        if isinstance(code, (PackedCode, MappedCode)):
+            length = code.length
+        elif length is None:
+            raise ValueError("Argument 'length' is required for a plain iterable of packed codewords")
+        if not isinstance(radius, int):
+            raise TypeError("Argument 'radius' must be of type 'int'")
+        if radius < 0:
+            raise ValueError("Argument 'radius' must be non-negative")
+        if segments is not None and segments < 1:
+            raise ValueError("Argument 'segments' must be positive")
+
+        self.length = length
+        self.radius = radius
+        self.words: List[int] = []
+
+        # (shift, mask, probes, bucket) of each segment, where probes are the XOR masks of the
+        # segment values within radius // segments of the query's; with more segments than bits
+        # a single empty segment puts every codeword in one bucket
+        num_segments = radius + 1 if segments is None else segments
+        if num_segments > length:
+            bounds = [(0, 0)]
+            sub_radius = 0
+        else:
+            width, extra = divmod(length, num_segments)
+            bounds = []
+            shift = 0
+            for s in range(num_segments):
+                size = width + (s < extra)
+                bounds.append((shift, size))
+                shift += size
+            sub_radius = radius // num_segments
+
+        self._lookups = []
+        for shift, size in bounds:
+            probes = [sum(1 << bit for bit in bits)
+                      for weight in range(min(sub_radius, size) + 1) for bits in combinations(range(size), weight)]
+            self._lookups.append((shift, (1 << size) - 1, probes, {}))
+
+        for word in code:
+            self.add(word)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def add(self, word: int) -> int:
+        """
+        Add a codeword to the index.
+
+        :param word: A packed codeword of length bits
+        :return: The index of the codeword in words
+        :raise TypeError: If word is not an integer
+        :raise ValueError: If word does not fit in length bits
+        """
+
+        _check_packed(word, self.length)
+        index = len(self.words)
+        self.words.append(word)
+        for shift, mask, probes, bucket in self._lookups:
+            bucket.setdefault((word >> shift) & mask, []).append(index)
+        return index
+
+    def _candidates(self, word: int) -> Iterator[int]:
+        # Indices of the codewords sharing a probed segment value with word, with repetitions
+        for shift, mask, probes, bucket in self._lookups:
+            value = (word >> shift) & mask
+            for probe in probes:
+                yield from bucket.get(value ^ probe, ())
+
+    def within(self, word: int, radius: Optional[int] = None) -> List[int]:
+        """
+        Find all codewords within a distance of a packed word.
+
+        :param word: A packed word of length bits
+        :param radius: Largest distance, at most the radius of the index (default)
+        :return: Ascending indices in words of the codewords within radius of word
+        :raise ValueError: If radius is larger than the radius of the index
+        """
+
+        radius = self._check_radius(radius)
+        words = self.words
+        return sorted({index for index in self._candidates(word) if (word ^ words[index]).bit_count() <= radius})
+
+    def any_within(self, word: int, radius: Optional[int] = None) -> bool:
+        """
+        Check whether some codeword is within a distance of a packed word, stopping at the first one.
+
+        :param word: A packed word of length bits
+        :param radius: Largest distance, at most the radius of the index (default)
+        :return: True if a codeword is within radius of word
+        :raise ValueError: If radius is larger than the radius of the index
+        """
+
+        radius = self._check_radius(radius)
+        words = self.words
+        return any((word ^ words[index]).bit_count() <= radius for index in self._candidates(word))
+
+    def _check_radius(self, radius: Optional[int]) -> int:
+        if radius is None:
+            return self.radius
+        if radius > self.radius:
+            raise ValueError(f"Radius must be at most the radius of the index ({self.radius})")
+        return radius
+
+    def decode(self, word: int) -> DecodedWord:
+        """
+        Decode one packed read to its nearest codeword within the radius of the index.
+
+        :param word: A packed read of length bits
+        :return: DecodedWord(codeword, message, errors) where message is the index of the codeword in
+                 words (the first one on ties) and errors its distance to the read
+        :raise TypeError: If word is not an integer
+        :raise ValueError: If word does not fit in length bits
+        """
+
+        return self.decode_batch([word])[0]
+
+    def decode_batch(self, words: Iterable[int], validate: bool = True) -> List[DecodedWord]:
+        """
+        Decode a batch of packed reads to their nearest codewords within the radius of the index.
+
+        :param words: Packed reads of length bits
+        :param validate: Check the reads; pass False for reads that are already known to be valid
+        :return: One DecodedWord per read, in order (see decode)
+        :raise TypeError: If a read is not an integer
+        :raise ValueError: If a read does not fit in length bits
+        """
+
+        words = list(words)
+        if validate:
+            for word in words:
+                _check_packed(word, self.length)
+
+        codewords_, radius, lookups = self.words, self.radius, self._lookups
+        decoded = []
+        for word in words:
+            best_distance = radius + 1
+            best_index = -1
+            for shift, mask, probes, bucket in lookups:
+                value = (word >> shift) & mask
+                for probe in probes:
+                    for index in bucket.get(value ^ probe, ()):
+                        distance = (word ^ codewords_[index]).bit_count()
+                        if distance < best_distance or (distance == best_distance and index < best_index):
+                            best_distance, best_index = distance, index
+                if best_distance == 0:
+                    break
+
+            if best_index < 0:
+                decoded.append(_DECODE_FAILURE)
+            else:
+                decoded.append(DecodedWord(codewords_[best_index], best_index, best_distance))
+
+        return decoded
+
+def greedy_dna_code(length: int, distance: int, gc_weight: Optional[int] = None, reverse: bool = True,
+                    reverse_complement: bool = True, seed: Optional[Iterable[int]] = None,
+                    candidates: Optional[Iterable[int]] = None, max_size: Optional[int] = None,
+                    segments: Optional[int] = None, checkpoint: Optional[str] = None,
+                    checkpoint_interval: int = 1 << 20) -> PackedCode:
+    """
+    Build a DNA code greedily: every candidate word is added when it satisfies the constraints against
+    itself and all words added so far, which with the default candidates (all words in increasing
+    order) gives the lexicode. The result satisfies has_dna_distance(code, distance, reverse,
+    reverse_complement): d(x, y) >= distance for x != y and, when enabled, d(x, R(y)) >= distance and
+    d(x, RC(y)) >= distance for all x and y, including x = y. Since d(x, R(y)) = d(R(x), y), the
+    reverse constraints are checked by looking up R(x) and RC(x) in the same index as x.
+    The words are held in NearestCodewordIndex instances of radius distance - 1, one per GC weight;
+    reversal and complement keep the GC weight and d(x, y) >= |gc(x) - gc(y)|, so only the GC weights
+    closer than distance are searched.
+
+    :param length: The length of the codewords in bits, which must be even
+    :param distance: The required minimum distance, at least 1
+    :param gc_weight: Only keep words of this GC-content weight; None keeps any
+    :param reverse: Enforce the reverse constraint
+    :param reverse_complement: Enforce the reverse-complement constraint
+    :param seed: Packed words tried before the candidates, such as iter_dna_code(..., packed=True)
+                 or a PackedCode; seed words that break the constraints are skipped like candidates
+    :param candidates: Packed words tried in order; by default all words of length bits in increasing order
+    :param max_size: Stop once the code has this many words
+    :param segments: Number of index segments (see NearestCodewordIndex)
+    :param checkpoint: JSON file storing the words and the number of tried words every
+                       checkpoint_interval words and at the end. If it exists, the run resumes from it;
+                       the seed and candidates must then be the same as in the interrupted run.
+    :param checkpoint_interval: Number of tried words between checkpoints
+    :return: The code, in the order the words were added
+    :raise TypeError: If length, distance or a word is not an integer
+    :raise ValueError: If length is odd, distance is not positive, a word does not fit in length bits,
+                       or the checkpoint was written with other parameters
+    """
+
+    if not isinstance(length, int) or not isinstance(distance, int):
+        raise TypeError("Length and distance must be of type 'int'")
+    if length % 2 != 0:
+        raise ValueError("The length of the codewords must be even")
+    if distance < 1:
+        raise ValueError("Argument 'distance' must be positive")
+
+    parameters = {'length': length, 'distance': distance, 'gc_weight': gc_weight,
+                  'reverse': reverse, 'reverse_complement': reverse_complement}
+    words: List[int] = []
+    position = 0
+
+    # Resume from the checkpoint of an interrupted run
+    if checkpoint is not None and os.path.exists(checkpoint):
+        with open(checkpoint) as file:
+            state = json.load(file)
+        if state['parameters'] != parameters:
+            raise ValueError("The checkpoint was written with other parameters")
+        words = state['words']
+        position = state['position']
+
+    def save_checkpoint() -> None:
+        # Write a temporary file and rename it, so an interruption never leaves a partial checkpoint
+        temporary = checkpoint + '.tmp'
+        with open(temporary, 'w') as file:
+            json.dump({'parameters': parameters, 'position': position, 'words': words}, file)
+        os.replace(temporary, checkpoint)
+
+    radius = distance - 1
+    indexes: Dict[int, NearestCodewordIndex] = {}
+    pair_mask = _pair_mask(length)
+    mask = (1 << length) - 1
+
+    def conflicts(word: int, gc: int) -> bool:
+        for weight in range(gc - radius, gc + radius + 1):
+            index = indexes.get(weight)
+            if index is not None and index.any_within(word):
+                return True
+        return False
+
+    def add(word: int, gc: int) -> None:
+        if gc not in indexes:
+            indexes[gc] = NearestCodewordIndex([], radius, length, segments)
+        indexes[gc].add(word)
+
+    for word in words:
+        add(word, ((word ^ (word >> 1)) & pair_mask).bit_count())
+
+    if candidates is None:
+        candidates = range(1 << length)
+    tried = chain(seed if seed is not None else (), candidates)
+
+    def accepted(word: int, gc: int) -> bool:
+        if gc_weight is not None and gc != gc_weight:
+            return False
+        if conflicts(word, gc):
+            return False
+        if reverse:
+            reverse_word = _reverse_word(word, length)
+            if (word ^ reverse_word).bit_count() < distance or conflicts(reverse_word, gc):
+                return False
+        if reverse_complement:
+            reverse_complement_word = _reverse_word(word ^ mask, length)
+            if (word ^ reverse_complement_word).bit_count() < distance or conflicts(reverse_complement_word, gc):
+                return False
+        return True
+
+    for word in islice(tried, position, None):
+        if max_size is not None and len(words) >= max_size:
+            break
+
+        _check_packed(word, length)
+        gc = ((word ^ (word >> 1)) & pair_mask).bit_count()
+        if accepted(word, gc):
+            add(word, gc)
+            words.append(word)
+
+        position += 1
+        if checkpoint is not None and position % checkpoint_interval == 0:
+            save_checkpoint()
+
+    if checkpoint is not None:
+        save_checkpoint()
+
+    return PackedCode._from_trusted(words, length)
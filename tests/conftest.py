@@ -0,0 +1,48 @@
+"""
+Shared fixtures of the test suite: the README generator matrix, random generator matrices
+(a third of them with linearly dependent rows) and a brute-force encoder written like the
+original list-based codewords.
+"""
+
+from itertools import product
+
+# Generator matrix of the usage example in the README
+README_8_4 = [[1, 0, 0, 0, 0, 1, 1, 1],
+              [0, 1, 0, 0, 1, 0, 1, 1],
+              [0, 0, 1, 0, 1, 1, 0, 1],
+              [0, 0, 0, 1, 1, 1, 1, 0]]
+
+# README generator with a fifth row equal to the sum of the first two
+README_8_4_DEPENDENT = README_8_4 + [[a ^ b for a, b in zip(README_8_4[0], README_8_4[1])]]
+
+
+def random_generator(rng, even=False, max_rows=5, max_length=10):
+    """
+    Random binary generator matrix; a third of them are rank deficient, with a row that is the
+    sum of two others or a copy of another.
+
+    :param rng: random.Random instance
+    :param even: Only even codeword lengths, as needed by the DNA functions
+    """
+
+    length = 2 * rng.randint(1, max_length // 2) if even else rng.randint(1, max_length)
+    rows = [[rng.randint(0, 1) for _ in range(length)] for _ in range(rng.randint(1, max_rows))]
+
+    kind = rng.randrange(6)
+    if kind == 0:
+        first, second = rng.sample(range(len(rows)), 2) if len(rows) > 1 else (0, 0)
+        rows.append([a ^ b for a, b in zip(rows[first], rows[second])])
+    elif kind == 1:
+        rows.insert(rng.randrange(len(rows) + 1), list(rng.choice(rows)))
+    rng.shuffle(rows)
+    return rows
+
+
+def reference_code(generator_matrix):
+    """
+    Encode every message with the triple loop of the original codewords, in message order.
+    """
+
+    length = len(generator_matrix[0])
+    return [[sum(bit * row[j] for bit, row in zip(message_, generator_matrix)) % 2 for j in range(length)]
+            for message_ in product([0, 1], repeat=len(generator_matrix))]
@@ -0,0 +1,45 @@
+import mmap
+import os
+
+import pytest
+
+import pydnacode
+
+
+def test_save_and_open_roundtrip(tmp_path):
+    path = str(tmp_path / "code.bin")
+    words = [0b0110, 0b1001, 0b1111]
+    assert pydnacode.save_code(path, words, length=4, constraints=['reverse']) == 3
+    with pydnacode.open_code(path) as code:
+        assert list(code) == words and code.length == 4 and code.constraints == ['reverse']
+
+
+def test_save_code_leaves_no_partial_file(tmp_path):
+    path = str(tmp_path / "code.bin")
+    pydnacode.save_code(path, [1, 2], length=4)
+
+    with pytest.raises(ValueError):
+        pydnacode.save_code(path, [1, 2, 1 << 4], length=4)
+
+    # The previous file is untouched and no temporary file is left behind
+    assert os.listdir(tmp_path) == ["code.bin"]
+    with pydnacode.open_code(path) as code:
+        assert list(code) == [1, 2]
+
+
+@pytest.mark.parametrize("content", [b"x" * 64, b"PYDNACD1" + b"\0" * 56])
+def test_open_code_closes_map_on_invalid_file(tmp_path, monkeypatch, content):
+    path = tmp_path / "invalid.bin"
+    path.write_bytes(content)
+    maps = []
+
+    class RecordingMap(mmap.mmap):
+        def __new__(cls, *args, **kwargs):
+            instance = super().__new__(cls, *args, **kwargs)
+            maps.append(instance)
+            return instance
+
+    monkeypatch.setattr(mmap, "mmap", RecordingMap)
+    with pytest.raises(ValueError):
+        pydnacode.open_code(str(path))
+    assert maps and all(m.closed for m in maps)
@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+import pydnacode
+from conftest import README_8_4, random_generator
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_parity_check_matrix_annihilates_code(seed):
+    generator_matrix = random_generator(random.Random(seed))
+    code = pydnacode.PackedCode.from_generator(generator_matrix)
+    checks = [pydnacode.pack_codeword(row) for row in pydnacode.parity_check_matrix(generator_matrix)]
+    rank = len(set(code.words)).bit_length() - 1
+    assert len(checks) == code.length - rank
+    assert all((word & check).bit_count() % 2 == 0 for word in code.words for check in checks)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_syndrome_decoder_returns_closest_codeword(seed):
+    rng = random.Random(seed)
+    generator_matrix = random_generator(rng)
+    code = pydnacode.PackedCode.from_generator(generator_matrix).words
+    decoder = pydnacode.SyndromeDecoder(generator_matrix)
+
+    reads = [rng.getrandbits(len(generator_matrix[0])) for _ in range(50)]
+    for read, decoded in zip(reads, decoder.decode_batch(reads)):
+        closest = min((read ^ word).bit_count() for word in code)
+        assert decoded.errors == closest == (read ^ decoded.codeword).bit_count()
+        # The message is the first index of the codeword in codewords(message(k), G)
+        assert decoded.message == code.index(decoded.codeword)
+        assert decoder.decode(read) == decoded
+
+
+def test_syndrome_decoder_max_weight_reports_failures():
+    decoder = pydnacode.SyndromeDecoder(README_8_4, max_weight=0)
+    codeword = pydnacode.pack_codeword(README_8_4[0])
+    assert decoder.decode(codeword) == pydnacode.DecodedWord(codeword, 8, 0)
+    assert decoder.decode(codeword ^ 1) == pydnacode.DecodedWord(None, -1, -1)
+
+
+@pytest.mark.parametrize("segments", [None, 1, 20])
+@pytest.mark.parametrize("seed", range(10))
+def test_nearest_codeword_index_matches_linear_scan(seed, segments):
+    rng = random.Random(seed)
+    length = rng.randint(2, 12)
+    words = [rng.getrandbits(length) for _ in range(rng.randint(1, 40))]
+    radius = rng.randint(0, length)
+    index = pydnacode.NearestCodewordIndex(words, radius, length, segments)
+
+    for _ in range(50):
+        read = rng.getrandbits(length)
+        distances = [((read ^ word).bit_count(), i) for i, word in enumerate(words)]
+        assert index.within(read) == [i for distance, i in distances if distance <= radius]
+        assert index.any_within(read) == any(distance <= radius for distance, i in distances)
+
+        distance, closest = min(distances)
+        expected = (pydnacode.DecodedWord(words[closest], closest, distance) if distance <= radius
+                    else pydnacode.DecodedWord(None, -1, -1))
+        assert index.decode(read) == expected
@@ -0,0 +1,24 @@
+import pytest
+
+import pydnacode
+from conftest import README_8_4
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+@pytest.mark.parametrize("generator_matrix, error", [
+    ([[1, 0, 0, 1], [0, 1, 1]], ValueError),
+    ([[1, 0, 2, 1], [0, 1, 1, 0]], ValueError),
+    ([['1', 0, 0, 1], [0, 1, 1, 0]], TypeError),
+])
+def test_dna_code_validates_generator(generator_matrix, error, workers):
+    with pytest.raises(error):
+        pydnacode.dna_code(generator_matrix, ['reverse'], workers=workers)
+
+
+@pytest.mark.parametrize("options", [{}, {'use_cache': True}, {'workers': 2}])
+def test_dna_code_accepts_integral_gc_weights(options):
+    expected = pydnacode.dna_code(README_8_4, ['gc_content'], 2)
+    assert len(expected) == 8
+    assert pydnacode.dna_code(README_8_4, ['gc_content'], 2.0, **options) == expected
+    assert pydnacode.dna_code(README_8_4, ['gc_content', 'reverse'], 2.5, **options) == []
+    assert pydnacode.count_dna_code(README_8_4, ['gc_content'], 2.0) == 8
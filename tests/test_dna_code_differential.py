@@ -0,0 +1,74 @@
+"""
+Differential tests of the DNA code pipeline against a brute-force reference written like the
+original list-based dna_code: encode every message, then apply the reverse, reverse-complement and
+GC-content filters one after the other. Random generators include linearly dependent rows.
+"""
+
+import random
+from itertools import combinations
+
+import pytest
+
+import pydnacode
+from conftest import random_generator, reference_code
+
+CONSTRAINT_SETS = [list(subset) for size in (1, 2, 3)
+                   for subset in combinations(['reverse', 'reverse_complement', 'gc_content'], size)]
+
+
+def reference_reverse(codeword):
+    pairs = [codeword[i:i + 2] for i in range(0, len(codeword), 2)]
+    return [bit for pair in reversed(pairs) for bit in pair]
+
+
+def reference_dna_code(generator_matrix, constraints, gc_weight):
+    code = reference_code(generator_matrix)
+
+    def pair_filter(code, partner):
+        kept = []
+        for codeword in code:
+            other = partner(codeword)
+            if codeword != other and other not in kept:
+                kept.append(codeword)
+        return kept
+
+    if 'reverse' in constraints:
+        code = pair_filter(code, reference_reverse)
+    if 'reverse_complement' in constraints:
+        code = pair_filter(code, lambda c: reference_reverse([1 - bit for bit in c]))
+    if 'gc_content' in constraints:
+        code = [c for c in code if sum(c[i] != c[i + 1] for i in range(0, len(c), 2)) == gc_weight]
+    return code
+
+
+def random_cases(seed, count):
+    rng = random.Random(seed)
+    for _ in range(count):
+        generator_matrix = random_generator(rng, even=True)
+        gc_weight = rng.randint(0, len(generator_matrix[0]) // 2)
+        yield generator_matrix, gc_weight
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_dna_code_matches_reference(seed):
+    for generator_matrix, gc_weight in random_cases(seed, 10):
+        for constraints in CONSTRAINT_SETS:
+            expected = reference_dna_code(generator_matrix, constraints, gc_weight)
+            assert pydnacode.dna_code(generator_matrix, constraints, gc_weight) == expected
+            assert pydnacode.dna_code(generator_matrix, constraints, gc_weight, use_cache=True) == expected
+            assert pydnacode.count_dna_code(generator_matrix, constraints, gc_weight) == len(expected)
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_gc_weight_codewords_matches_reference(seed):
+    for generator_matrix, gc_weight in random_cases(seed, 10):
+        expected = reference_dna_code(generator_matrix, ['gc_content'], gc_weight)
+        assert pydnacode.gc_weight_codewords(generator_matrix, gc_weight) == expected
+        assert pydnacode.count_gc_weight_codewords(generator_matrix, gc_weight) == len(expected)
+
+
+def test_sharded_dna_code_matches_reference():
+    for generator_matrix, gc_weight in random_cases(1000, 12):
+        for constraints in CONSTRAINT_SETS:
+            expected = reference_dna_code(generator_matrix, constraints, gc_weight)
+            assert pydnacode.dna_code(generator_matrix, constraints, gc_weight, workers=2) == expected
@@ -0,0 +1,78 @@
+import random
+
+import pytest
+
+import pydnacode
+
+INF = float('inf')
+
+
+def reverse(word, length):
+    bits = format(word, f"0{length}b")
+    return int(''.join(bits[i:i + 2] for i in range(length - 2, -1, -2)) or "0", 2)
+
+
+def reference_distances(words, length):
+    # d(x, y) over pairs of distinct positions, the reverse terms over all pairs including x = y
+    mask = (1 << length) - 1
+    hamming = min(((x ^ y).bit_count() for i, x in enumerate(words) for y in words[i + 1:]), default=INF)
+    reverse_distance = min(((x ^ reverse(y, length)).bit_count() for x in words for y in words), default=INF)
+    reverse_complement = min(((x ^ reverse(y ^ mask, length)).bit_count() for x in words for y in words),
+                             default=INF)
+    return pydnacode.DnaDistances(hamming, reverse_distance, reverse_complement)
+
+
+def random_words(rng):
+    length = 2 * rng.randint(1, 10)
+    words = [rng.getrandbits(length) for _ in range(rng.randint(0, 40))]
+    if words and rng.random() < 0.2:
+        words.append(rng.choice(words))
+    return words, length
+
+
+@pytest.mark.parametrize("seed", range(30))
+@pytest.mark.parametrize("tile_size", [1, 3, 7, 1024])
+def test_dna_distances_match_brute_force(seed, tile_size):
+    words, length = random_words(random.Random(seed))
+    expected = reference_distances(words, length)
+    assert pydnacode.dna_distances(words, length, tile_size=tile_size) == expected
+
+    for distance in range(length + 2):
+        for use_reverse, use_reverse_complement in [(True, True), (True, False), (False, True), (False, False)]:
+            holds = (expected.hamming >= distance and (not use_reverse or expected.reverse >= distance)
+                     and (not use_reverse_complement or expected.reverse_complement >= distance))
+            assert pydnacode.has_dna_distance(words, distance, use_reverse, use_reverse_complement,
+                                              length=length, tile_size=tile_size) == holds
+
+
+def test_reverse_terms_include_the_word_itself():
+    # 'GG' (0101) is its own reverse, and 'AT' (0011) is its own reverse complement
+    palindrome, self_complementary = 0b0101, 0b0011
+    assert pydnacode.dna_distances([palindrome], 4) == (INF, 0, 4)
+    assert pydnacode.dna_distances([self_complementary], 4) == (INF, 4, 0)
+    assert not pydnacode.has_dna_distance([palindrome], 1, length=4)
+    assert pydnacode.has_dna_distance([palindrome], 1, reverse=False, length=4)
+    assert not pydnacode.has_dna_distance([self_complementary], 1, length=4)
+    assert pydnacode.has_dna_distance([self_complementary], 1, reverse_complement=False, length=4)
+
+
+def test_packed_code_and_errors():
+    code = pydnacode.PackedCode([0b0001, 0b1110], 4)
+    assert pydnacode.dna_distances(code) == reference_distances(code.words, 4)
+    assert pydnacode.dna_distances([], 4) == (INF, INF, INF)
+    with pytest.raises(ValueError):
+        pydnacode.dna_distances([1, 2])
+    with pytest.raises(ValueError):
+        pydnacode.dna_distances([1, 2], 3)
+    with pytest.raises(ValueError):
+        pydnacode.dna_distances([1, 1 << 4], 4)
+
+
+def test_dna_distances_with_workers():
+    rng = random.Random(7)
+    words = [rng.getrandbits(16) for _ in range(300)]
+    expected = reference_distances(words, 16)
+    assert pydnacode.dna_distances(words, 16, workers=2, tile_size=64) == expected
+    assert pydnacode.has_dna_distance(words, expected.hamming, length=16, workers=2, tile_size=64) == \
+        (min(expected) >= expected.hamming)
+    assert not pydnacode.has_dna_distance(words, min(expected) + 1, length=16, workers=2, tile_size=64)
@@ -0,0 +1,121 @@
+import random
+
+import pytest
+
+import pydnacode
+
+BASES = {(0, 0): 'A', (0, 1): 'G', (1, 0): 'C', (1, 1): 'T'}
+COMPLEMENT = {'A': 'T', 'T': 'A', 'C': 'G', 'G': 'C'}
+
+
+def reference_dna(codeword):
+    return ''.join(BASES[tuple(codeword[i:i + 2])] for i in range(0, len(codeword), 2))
+
+
+def random_codewords(seed, count=50, max_bases=40):
+    rng = random.Random(seed)
+    return [[rng.randint(0, 1) for _ in range(2 * rng.randint(0, max_bases))] for _ in range(count)]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_conversions_roundtrip(seed):
+    for codeword in random_codewords(seed):
+        length = len(codeword)
+        word = pydnacode.pack_codeword(codeword)
+        sequence = pydnacode.codeword_to_dna(codeword)
+
+        assert sequence == reference_dna(codeword) == pydnacode.packed_to_dna(word, length)
+        assert pydnacode.dna_to_codeword(sequence) == codeword
+        assert pydnacode.dna_to_packed(sequence) == pydnacode.dna_to_packed(sequence.lower()) == word
+        assert pydnacode.weight_gc_packed(word, length) == sequence.count('G') + sequence.count('C')
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_reverse_and_complement_sequences(seed):
+    for codeword in random_codewords(seed):
+        length, word = len(codeword), pydnacode.pack_codeword(codeword)
+        sequence = pydnacode.codeword_to_dna(codeword)
+        complement = ''.join(COMPLEMENT[base] for base in sequence)
+        assert pydnacode.codeword_to_dna(pydnacode.reverse_codeword(codeword)) == sequence[::-1]
+        assert pydnacode.codeword_to_dna(pydnacode.complement_codeword(codeword)) == complement
+        assert pydnacode.packed_to_dna(pydnacode.reverse_packed(word, length), length) == sequence[::-1]
+        assert pydnacode.packed_to_dna(pydnacode.complement_packed(word, length), length) == complement
+
+
+@pytest.mark.parametrize("sequence", ["ACGU", "ACG T", "ACGN", "ACGTé"])
+def test_invalid_bases(sequence):
+    with pytest.raises(ValueError, match="bases"):
+        pydnacode.dna_to_packed(sequence)
+    with pytest.raises(ValueError, match="bases"):
+        pydnacode.dna_to_codeword(sequence)
+
+
+def test_conversion_errors():
+    with pytest.raises(TypeError):
+        pydnacode.dna_to_packed(b"ACGT")
+    with pytest.raises(ValueError):
+        pydnacode.codeword_to_dna([0, 1, 1])
+    with pytest.raises(ValueError):
+        pydnacode.packed_to_dna(0b111, 2)
+
+
+@pytest.mark.parametrize("fasta", [False, True])
+@pytest.mark.parametrize("chunk_size", [1, 3, 65536])
+def test_file_roundtrip(tmp_path, fasta, chunk_size):
+    path = str(tmp_path / "code.txt")
+    words = [random.Random(i).getrandbits(24) for i in range(10)]
+    assert pydnacode.write_dna_file(path, words, 24, fasta=fasta, chunk_size=chunk_size) == 10
+    assert list(pydnacode.read_dna_file(path, 24)) == words
+
+    with open(path) as file:
+        lines = file.read().splitlines()
+    sequences = [pydnacode.packed_to_dna(word, 24) for word in words]
+    if fasta:
+        assert lines[0::2] == [f">codeword_{i}" for i in range(10)] and lines[1::2] == sequences
+    else:
+        assert lines == sequences
+
+
+def test_write_packed_code_and_empty_iterable(tmp_path):
+    path = str(tmp_path / "code.txt")
+    code = pydnacode.PackedCode([0b0110, 0b1001], 4)
+    assert pydnacode.write_dna_file(path, code, fasta=True, name="seq") == 2
+    assert list(pydnacode.read_dna_file(path)) == [0b0110, 0b1001]
+
+    assert pydnacode.write_dna_file(path, iter([]), length=8) == 0
+    assert list(pydnacode.read_dna_file(path)) == []
+
+    with pytest.raises(ValueError, match="length"):
+        pydnacode.write_dna_file(path, [1, 2])
+    with pytest.raises(ValueError):
+        pydnacode.write_dna_file(path, [1, 2], length=3)
+
+
+def test_read_multiline_fasta(tmp_path):
+    path = tmp_path / "code.fasta"
+    path.write_text(">first record\nACGT\nacgt\n\nTT\n>second\n\nGGCC\nAATT\n>third\nCA\n")
+    words = list(pydnacode.read_dna_file(str(path)))
+    assert words == [pydnacode.dna_to_packed(sequence) for sequence in ("ACGTACGTTT", "GGCCAATT", "CA")]
+
+
+def test_read_plain_lines_skips_blank_lines(tmp_path):
+    path = tmp_path / "code.txt"
+    path.write_text("ACGT\n\n  TTGA  \nAAAA\n")
+    expected = [pydnacode.dna_to_packed(sequence) for sequence in ("ACGT", "TTGA", "AAAA")]
+    assert list(pydnacode.read_dna_file(str(path), 8)) == expected
+
+
+@pytest.mark.parametrize("content", ["ACGT\nACG\n", ">a\nACG\nT\n>b\nAC\n"])
+def test_read_checks_the_length(tmp_path, content):
+    path = tmp_path / "code.txt"
+    path.write_text(content)
+    with pytest.raises(ValueError, match="length 8"):
+        list(pydnacode.read_dna_file(str(path), 8))
+
+
+@pytest.mark.parametrize("content", ["ACGT\nACNT\n", ">a\nACGT\nAXGT\n"])
+def test_read_rejects_invalid_bases(tmp_path, content):
+    path = tmp_path / "code.txt"
+    path.write_text(content)
+    with pytest.raises(ValueError, match="bases"):
+        list(pydnacode.read_dna_file(str(path)))
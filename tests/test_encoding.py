@@ -0,0 +1,123 @@
+import random
+
+import pytest
+
+import pydnacode
+from conftest import README_8_4, random_generator, reference_code
+
+BACKENDS = ['python', pytest.param('numpy', marks=pytest.mark.skipif(pydnacode.np is None,
+                                                                     reason="NumPy is not installed"))]
+
+
+def wide_generator(rng, rows, length):
+    return [[rng.randint(0, 1) for _ in range(length)] for _ in range(rows)]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("chunk_size", [1, 3, 65536])
+@pytest.mark.parametrize("seed", range(20))
+def test_codewords_match_the_triple_loop(backend, chunk_size, seed):
+    generator_matrix = random_generator(random.Random(seed), max_rows=6)
+    messages = pydnacode.message(len(generator_matrix))
+    expected = reference_code(generator_matrix)
+    assert pydnacode.codewords(messages, generator_matrix, backend, chunk_size) == expected
+    assert pydnacode.codewords(iter(messages), generator_matrix, backend, chunk_size) == expected
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("length", [1, 63, 64, 65, 130])
+def test_codewords_of_long_codewords(backend, length):
+    generator_matrix = wide_generator(random.Random(length), 4, length)
+    messages = pydnacode.message(4)
+    assert pydnacode.codewords(messages, generator_matrix, backend, 5) == reference_code(generator_matrix)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("start, stop, chunk_size", [(0, None, 4), (3, 29, 5), (7, 8, 1), (10, 10, 3), (0, 32, 100)])
+def test_encode_range(backend, start, stop, chunk_size):
+    generator_matrix = wide_generator(random.Random(start), 5, 70)
+    expected = [pydnacode.pack_codeword(codeword) for codeword in reference_code(generator_matrix)][start:stop]
+
+    chunks = list(pydnacode.encode_range(generator_matrix, start, stop, backend, chunk_size))
+    assert [word for chunk in chunks for word in chunk] == expected
+    assert all(0 < len(chunk) <= chunk_size for chunk in chunks)
+
+
+@pytest.mark.parametrize("start, stop, chunk_size", [(-1, None, 4), (5, 4, 4), (0, 33, 4), (0, None, 0)])
+def test_encode_range_errors(start, stop, chunk_size):
+    with pytest.raises(ValueError):
+        list(pydnacode.encode_range(README_8_4 + [[1] * 8], start, stop, chunk_size=chunk_size))
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("seed", range(10))
+def test_packed_code_from_generator(backend, seed):
+    generator_matrix = random_generator(random.Random(seed))
+    code = pydnacode.PackedCode.from_generator(generator_matrix, backend)
+    assert code.length == len(generator_matrix[0])
+    assert code.to_code() == reference_code(generator_matrix)
+
+
+@pytest.mark.parametrize("length", [1, 8, 64, 65, 130])
+def test_array_roundtrip(length):
+    np = pytest.importorskip("numpy")
+    code = pydnacode.PackedCode.from_generator(wide_generator(random.Random(length), 4, length), 'python')
+    array = code.to_array()
+    assert array.dtype == np.uint64 and array.shape == (16, -(-length // 64))
+
+    # Word j holds bits 64j to 64j + 63, most significant bit first, the last word padded on the right
+    for word, row in zip(code.words, array):
+        padded = word << (64 * array.shape[1] - length)
+        assert [int(value) for value in row] == [(padded >> (64 * (array.shape[1] - 1 - j))) & (2 ** 64 - 1)
+                                                 for j in range(array.shape[1])]
+    assert pydnacode.PackedCode.from_array(array, length) == code
+
+
+def test_without_numpy(monkeypatch):
+    monkeypatch.setattr(pydnacode, 'np', None)
+    messages = pydnacode.message(4)
+    assert pydnacode.codewords(messages, README_8_4) == reference_code(README_8_4)
+    with pytest.raises(ImportError):
+        pydnacode.codewords(messages, README_8_4, backend='numpy')
+    with pytest.raises(ImportError):
+        pydnacode.PackedCode([1], 8).to_array()
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError, match="Backend"):
+        pydnacode.codewords(pydnacode.message(4), README_8_4, backend='gpu')
+
+
+@pytest.mark.parametrize("length", range(9))
+def test_iter_messages(length):
+    assert list(pydnacode.iter_messages(length, 'natural')) == pydnacode.message(length)
+
+    gray = list(pydnacode.iter_messages(length))
+    assert len(gray) == 1 << length and sorted(gray) == pydnacode.message(length)
+    assert all(sum(a != b for a, b in zip(previous, current)) == 1 for previous, current in zip(gray, gray[1:]))
+    # The t-th message has index t ^ (t >> 1)
+    assert [pydnacode.pack_codeword(vector) for vector in gray] == [t ^ (t >> 1) for t in range(1 << length)]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_iter_codewords(seed):
+    generator_matrix = random_generator(random.Random(seed), max_rows=6)
+    expected = reference_code(generator_matrix)
+    assert list(pydnacode.iter_codewords(generator_matrix, 'natural')) == expected
+    assert list(pydnacode.iter_codewords(generator_matrix, 'natural', packed=True)) == \
+        [pydnacode.pack_codeword(codeword) for codeword in expected]
+
+    # In Gray order codeword t is the codeword of message t ^ (t >> 1), one generator row from the last
+    gray = list(pydnacode.iter_codewords(generator_matrix))
+    assert gray == [expected[t ^ (t >> 1)] for t in range(len(expected))]
+    assert list(pydnacode.iter_codewords(generator_matrix, packed=True)) == \
+        [pydnacode.pack_codeword(codeword) for codeword in gray]
+
+
+def test_iteration_errors():
+    with pytest.raises(TypeError):
+        list(pydnacode.iter_messages(2.0))
+    with pytest.raises(ValueError):
+        list(pydnacode.iter_messages(2, 'lexicographic'))
+    with pytest.raises(ValueError):
+        list(pydnacode.iter_codewords(README_8_4, 'lexicographic'))
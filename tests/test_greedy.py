@@ -0,0 +1,140 @@
+"""
+Tests of greedy_dna_code against a brute-force lexicode over lists of bits, with the reverse and
+reverse complement built pair by pair like reverse_code and complement_code.
+"""
+
+import json
+
+import pytest
+
+import pydnacode
+
+
+def bits(word, length):
+    return [(word >> (length - 1 - i)) & 1 for i in range(length)]
+
+
+def distance(x, y):
+    return sum(a != b for a, b in zip(x, y))
+
+
+def reverse(codeword):
+    return [bit for i in range(len(codeword) - 2, -1, -2) for bit in codeword[i:i + 2]]
+
+
+def gc(codeword):
+    return sum(codeword[i] != codeword[i + 1] for i in range(0, len(codeword), 2))
+
+
+def reference_greedy(words, length, min_distance, gc_weight=None, use_reverse=True, use_reverse_complement=True):
+    # Try every word against itself and the code, checking all pairs in both directions
+    code = []
+    for word in words:
+        x = bits(word, length)
+        if gc_weight is not None and gc(x) != gc_weight:
+            continue
+        partners = [x]
+        if use_reverse:
+            partners.append(reverse(x))
+        if use_reverse_complement:
+            partners.append(reverse([1 - bit for bit in x]))
+        if any(distance(x, partner) < min_distance for partner in partners[1:]):
+            continue
+        if any(distance(partner, bits(y, length)) < min_distance for partner in partners for y in code):
+            continue
+        code.append(word)
+    return code
+
+
+@pytest.mark.parametrize("length", [2, 4, 6, 8])
+@pytest.mark.parametrize("min_distance", [1, 2, 3, 4])
+@pytest.mark.parametrize("use_reverse, use_reverse_complement", [(True, True), (True, False), (False, True),
+                                                                 (False, False)])
+def test_greedy_is_the_lexicode(length, min_distance, use_reverse, use_reverse_complement):
+    code = pydnacode.greedy_dna_code(length, min_distance, reverse=use_reverse,
+                                     reverse_complement=use_reverse_complement)
+    expected = reference_greedy(range(1 << length), length, min_distance, None, use_reverse, use_reverse_complement)
+    assert code.words == expected and code.length == length
+    assert pydnacode.has_dna_distance(code, min_distance, use_reverse, use_reverse_complement)
+
+
+@pytest.mark.parametrize("length, min_distance", [(6, 2), (8, 2), (8, 3), (10, 4)])
+@pytest.mark.parametrize("gc_weight", [1, 2, 3])
+def test_greedy_with_gc_weight(length, min_distance, gc_weight):
+    code = pydnacode.greedy_dna_code(length, min_distance, gc_weight)
+    assert code.words == reference_greedy(range(1 << length), length, min_distance, gc_weight)
+    assert all(gc(bits(word, length)) == gc_weight for word in code)
+
+
+@pytest.mark.parametrize("min_distance", [2, 3, 4])
+def test_gc_window_pruning_keeps_distances_across_weights(min_distance):
+    # Only the GC weights within distance - 1 of a word are searched; words of other weights are
+    # at least distance apart, so the code matches the brute force over all weights
+    code = pydnacode.greedy_dna_code(10, min_distance)
+    assert code.words == reference_greedy(range(1 << 10), 10, min_distance)
+    assert len({gc(bits(word, 10)) for word in code}) > 1
+    assert pydnacode.has_dna_distance(code, min_distance)
+
+
+@pytest.mark.parametrize("segments", [None, 1, 2, 3, 20])
+def test_segments_do_not_change_the_code(segments):
+    assert pydnacode.greedy_dna_code(10, 3, segments=segments) == pydnacode.greedy_dna_code(10, 3)
+
+
+def test_seed_words_come_first_and_invalid_seeds_are_skipped():
+    length, min_distance = 8, 3
+    lexicode = pydnacode.greedy_dna_code(length, min_distance)
+    # 0b00000000 is its own reverse, so it is skipped; the repeated word is too close to itself
+    seed = [0b01100011, 0, 0b01100011, 0b10000111]
+    code = pydnacode.greedy_dna_code(length, min_distance, seed=seed)
+
+    expected = reference_greedy(seed + list(range(1 << length)), length, min_distance)
+    assert code.words == expected and code.words[:2] == [0b01100011, 0b10000111]
+    assert code.words != lexicode.words
+    assert pydnacode.has_dna_distance(code, min_distance)
+
+
+def test_max_size_and_candidates():
+    candidates = list(range((1 << 8) - 1, -1, -1))
+    code = pydnacode.greedy_dna_code(8, 3, candidates=candidates, max_size=3)
+    assert code.words == reference_greedy(candidates, 8, 3)[:3]
+
+
+def test_checkpoint_resume_after_interruption(tmp_path):
+    path = str(tmp_path / "greedy.json")
+    expected = pydnacode.greedy_dna_code(10, 3)
+
+    def interrupted(stop):
+        for word in range(1 << 10):
+            if word == stop:
+                raise KeyboardInterrupt
+            yield word
+
+    with pytest.raises(KeyboardInterrupt):
+        pydnacode.greedy_dna_code(10, 3, candidates=interrupted(500), checkpoint=path, checkpoint_interval=64)
+    with open(path) as file:
+        state = json.load(file)
+    assert state['position'] == 448
+    assert state['words'] == [word for word in expected.words if word < 448]
+
+    resumed = pydnacode.greedy_dna_code(10, 3, checkpoint=path, checkpoint_interval=64)
+    assert resumed == expected
+    with open(path) as file:
+        assert json.load(file)['position'] == 1 << 10
+
+
+def test_checkpoint_with_other_parameters(tmp_path):
+    path = str(tmp_path / "greedy.json")
+    pydnacode.greedy_dna_code(6, 2, checkpoint=path)
+    with pytest.raises(ValueError, match="other parameters"):
+        pydnacode.greedy_dna_code(6, 3, checkpoint=path)
+
+
+@pytest.mark.parametrize("args, error", [
+    ((5, 2), ValueError),
+    ((6, 0), ValueError),
+    ((6.0, 2), TypeError),
+])
+def test_greedy_argument_errors(args, error):
+    with pytest.raises(error):
+        pydnacode.greedy_dna_code(*args)
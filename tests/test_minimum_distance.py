@@ -0,0 +1,40 @@
+import random
+
+import pytest
+
+import pydnacode
+from conftest import README_8_4, README_8_4_DEPENDENT, random_generator, reference_code
+
+
+def reference_minimum_distance(generator_matrix):
+    return min((sum(codeword) for codeword in reference_code(generator_matrix) if any(codeword)),
+               default=float('inf'))
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_minimum_distance_is_the_minimum_nonzero_weight(seed):
+    rng = random.Random(seed)
+    generator_matrix = random_generator(rng, max_rows=rng.choice([3, 6, 10]), max_length=rng.choice([6, 16, 24]))
+    assert pydnacode.minimum_distance(generator_matrix) == reference_minimum_distance(generator_matrix)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_minimum_distance_of_sparse_generators(seed):
+    # Low-weight rows give many light codewords and ties between the information sets
+    rng = random.Random(seed)
+    length = rng.randint(8, 20)
+    generator_matrix = [[int(rng.random() < 0.2) for _ in range(length)] for _ in range(rng.randint(2, 9))]
+    assert pydnacode.minimum_distance(generator_matrix) == reference_minimum_distance(generator_matrix)
+
+
+@pytest.mark.parametrize("generator_matrix", [[[0]], [[0, 0, 0, 0]], [[0, 0, 0], [0, 0, 0], [0, 0, 0]]])
+def test_rank_zero_generator(generator_matrix):
+    assert pydnacode.minimum_distance(generator_matrix) == float('inf')
+
+
+def test_known_distances():
+    assert pydnacode.minimum_distance(README_8_4) == pydnacode.minimum_distance(README_8_4_DEPENDENT) == 4
+    assert pydnacode.minimum_distance([[1] * 9]) == 9
+    assert pydnacode.minimum_distance([[1, 1, 0, 0], [0, 0, 1, 1], [1, 1, 1, 1]]) == 2
+    # The dependent rows repeat codewords, so the distance of the codeword list is 0
+    assert pydnacode.minimum_hamming_distance(reference_code(README_8_4_DEPENDENT)) == 0
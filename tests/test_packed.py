@@ -0,0 +1,37 @@
+import pytest
+
+import pydnacode
+
+
+def test_from_code_roundtrip():
+    code = [[0, 1, 1, 0], [1, 1, 1, 1], [0, 0, 0, 0]]
+    packed = pydnacode.PackedCode.from_code(code)
+    assert packed.words == [0b0110, 0b1111, 0] and packed.to_code() == code
+
+
+@pytest.mark.parametrize("code, error", [
+    ([[0, 1], (0, 1)], TypeError),
+    ([[0, 1], [0, '1']], TypeError),
+    ([[0, 1], [0, 2]], ValueError),
+    ([[0, 1], [0, 1, 1]], ValueError),
+])
+def test_from_code_errors(code, error):
+    with pytest.raises(error):
+        pydnacode.PackedCode.from_code(code)
+
+
+def test_slice_keeps_length_and_words():
+    packed = pydnacode.PackedCode([1, 2, 3, 4], 4)
+    assert packed[1:3] == pydnacode.PackedCode([2, 3], 4)
+    assert packed[-1] == 4
+
+
+def test_bools_pack_as_bits(tmp_path):
+    assert pydnacode.pack_codeword([True, False, True]) == 0b101
+    assert pydnacode.pack_codeword([]) == 0
+    assert pydnacode.PackedCode.from_code([[True, False], [False, True]]).words == [0b10, 0b01]
+
+    path = str(tmp_path / "code.bin")
+    assert pydnacode.save_code(path, [[True, False, False, True]]) == 1
+    with pydnacode.open_code(path) as code:
+        assert list(code) == [0b1001] and code.length == 4
@@ -0,0 +1,63 @@
+import pytest
+
+import pydnacode
+from conftest import README_8_4
+
+CONSTRAINTS = ['reverse', 'reverse_complement', 'gc_content']
+
+
+def profiled_run(progress_interval, **options):
+    calls = []
+    profiler = pydnacode.DnaCodeProfiler(progress=lambda done, total: calls.append((done, total)),
+                                         progress_interval=progress_interval)
+    code = pydnacode.dna_code(README_8_4, profiler=profiler, **options)
+    return code, profiler, calls
+
+
+@pytest.mark.parametrize("gc_weight", [2, 4])
+def test_sequential_stage_counts(gc_weight):
+    code, profiler, _ = profiled_run(4, constraints=CONSTRAINTS, gc_weight=gc_weight)
+    assert code == pydnacode.dna_code(README_8_4, CONSTRAINTS, gc_weight)
+    assert list(profiler.stages) == ['gc_content', 'reverse', 'reverse_complement', 'unpack']
+
+    stages = profiler.stages
+    enumerated = len(pydnacode.gc_weight_codewords(README_8_4, gc_weight))
+    assert stages['gc_content']['entered'] is None and stages['gc_content']['kept'] == enumerated
+    assert stages['reverse']['entered'] == enumerated
+    assert stages['reverse_complement']['entered'] == stages['reverse']['kept']
+    assert stages['unpack']['entered'] == stages['unpack']['kept'] == len(code)
+
+
+@pytest.mark.parametrize("interval, expected", [
+    (4, [(4, 16), (8, 16), (12, 16), (16, 16)]),
+    (5, [(5, 16), (10, 16), (15, 16), (16, 16)]),
+    (100, [(16, 16)]),
+])
+def test_sequential_progress_respects_the_interval(interval, expected):
+    _, profiler, calls = profiled_run(interval, constraints=['reverse'])
+    assert calls == expected
+    assert profiler.stages['encode']['kept'] == 16
+
+
+def test_use_cache_stage_counts():
+    code, profiler, calls = profiled_run(4, constraints=CONSTRAINTS, gc_weight=2, use_cache=True)
+    assert code == pydnacode.dna_code(README_8_4, CONSTRAINTS, 2)
+    assert list(profiler.stages) == ['dna_code_indices', 'unpack']
+    assert profiler.stages['dna_code_indices']['entered'] == 16
+    assert profiler.stages['dna_code_indices']['kept'] == len(code)
+    assert calls == [(16, 16)]
+
+
+@pytest.mark.parametrize("interval, expected", [
+    (4, [(4, 16), (8, 16), (12, 16), (16, 16)]),
+    (6, [(6, 16), (12, 16), (16, 16)]),
+    (100, [(16, 16)]),
+])
+def test_sharded_stage_counts_and_progress(interval, expected):
+    code, profiler, calls = profiled_run(interval, constraints=CONSTRAINTS, gc_weight=2, workers=2)
+    assert code == pydnacode.dna_code(README_8_4, CONSTRAINTS, 2)
+    assert list(profiler.stages) == ['encode', 'merge', 'unpack']
+    assert profiler.stages['encode']['kept'] == profiler.stages['merge']['entered'] \
+        == len(pydnacode.gc_weight_codewords(README_8_4, 2))
+    assert profiler.stages['merge']['kept'] == len(code)
+    assert calls == expected
@@ -0,0 +1,52 @@
+import pydnacode
+from conftest import README_8_4, README_8_4_DEPENDENT
+
+
+def test_screening_full_rank_distance_shortcut():
+    fast, = pydnacode.screen_generators([README_8_4], ['reverse'], target_distance=3, metrics=())
+    exact, = pydnacode.screen_generators([README_8_4], ['reverse'], target_distance=3,
+                                         metrics=('minimum_distance',))
+    assert fast.pruned is None
+    assert exact.minimum_distance >= 3 and exact.pruned is None
+
+
+def test_screening_dependent_rows_are_not_shortcut():
+    # Dependent rows repeat codewords, so the DNA code has distance 0 whatever the linear code has
+    fast, = pydnacode.screen_generators([README_8_4_DEPENDENT], ['reverse'], target_distance=3, metrics=())
+    exact, = pydnacode.screen_generators([README_8_4_DEPENDENT], ['reverse'], target_distance=3,
+                                         metrics=('minimum_distance',))
+    assert exact.minimum_distance == 0 and exact.pruned == 'distance'
+    assert fast.pruned == 'distance'
+
+
+def test_screening_memoizes_linear_metrics_in_generator_cache():
+    pydnacode.clear_generator_cache()
+    result, = pydnacode.screen_generators([README_8_4], ['reverse'], target_distance=3,
+                                          metrics=('gc_distribution',))
+    analysis = pydnacode.generator_analysis(README_8_4)
+    assert analysis._minimum_distance == pydnacode.minimum_distance(README_8_4) == 4
+    assert result.gc_distribution == analysis.gc_weight_distribution()
+    # The linear metrics do not encode the code
+    assert analysis._code is None
+    pydnacode.clear_generator_cache()
+
+
+def test_screening_dedup_is_bounded(monkeypatch):
+    evaluated = []
+    screen_generator = pydnacode._screen_generator
+
+    def counting(index, generator_matrix, *options):
+        evaluated.append(index)
+        return screen_generator(index, generator_matrix, *options)
+
+    monkeypatch.setattr(pydnacode, '_screen_generator', counting)
+    matrices = [README_8_4, README_8_4, README_8_4_DEPENDENT, README_8_4]
+
+    results = list(pydnacode.screen_generators(matrices, ['reverse'], metrics=('size',)))
+    assert [result.index for result in results] == [0, 1, 2, 3] and evaluated == [0, 2]
+
+    # With room for one matrix, the last README matrix was evicted by the dependent one
+    evaluated.clear()
+    monkeypatch.setattr(pydnacode, '_SCREEN_DEDUP_SIZE', 1)
+    bounded = list(pydnacode.screen_generators(matrices, ['reverse'], metrics=('size',)))
+    assert bounded == results and evaluated == [0, 2, 3]
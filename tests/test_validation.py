@@ -0,0 +1,36 @@
+import pytest
+
+import pydnacode
+
+
+@pytest.mark.parametrize("codeword1, codeword2", [([[0]], [[1]]), ([0, 1], [0, [1]]), ([0, '1'], [0, 1])])
+def test_hamming_distance_rejects_non_binary_elements(codeword1, codeword2):
+    with pytest.raises(ValueError, match="binary"):
+        pydnacode.hamming_distance(codeword1, codeword2)
+
+
+def test_hamming_distance_accepts_binary_numbers():
+    assert pydnacode.hamming_distance([0, 1, 1.0], [1, 1, 0]) == 2
+
+
+@pytest.mark.parametrize("function", [
+    lambda matrix: pydnacode.codewords([[1, 0]], matrix),
+    pydnacode.minimum_distance,
+    pydnacode.minimum_hamming_distance,
+    pydnacode.reverse_code,
+])
+@pytest.mark.parametrize("matrix", [[[[0], [1]], [[1], [0]]], [[0, 1], [1, [0]]]])
+def test_nested_matrices_raise_type_error(function, matrix):
+    with pytest.raises(TypeError):
+        function(matrix)
+
+
+@pytest.mark.parametrize("function", [
+    pydnacode.weight_gc_codeword,
+    lambda codeword: pydnacode.weight_gc_code([codeword]),
+    lambda codeword: pydnacode.weight_gc_enumerator([codeword]),
+])
+@pytest.mark.parametrize("codeword", [[[0], [1]], [0, 1, 1, [0]], [0, '1']])
+def test_gc_weight_of_nested_codewords_raises_value_error(function, codeword):
+    with pytest.raises(ValueError, match="binary"):
+        function(codeword)
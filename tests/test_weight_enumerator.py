@@ -0,0 +1,44 @@
+import random
+from collections import Counter
+
+import pytest
+
+import pydnacode
+from conftest import README_8_4, README_8_4_DEPENDENT, random_generator, reference_code
+
+BACKENDS = ['python', pytest.param('numpy', marks=pytest.mark.skipif(pydnacode.np is None,
+                                                                     reason="NumPy is not installed"))]
+
+
+def reference_distribution(generator_matrix):
+    return dict(sorted(Counter(sum(codeword) for codeword in reference_code(generator_matrix)).items()))
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("seed", range(40))
+def test_weight_enumerator_matches_brute_force(backend, seed):
+    generator_matrix = random_generator(random.Random(seed), max_rows=8, max_length=12)
+    distribution = pydnacode.weight_enumerator(generator_matrix, backend)
+    assert distribution == reference_distribution(generator_matrix)
+    assert list(distribution) == sorted(distribution)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("rows, length", [(2, 12), (5, 12), (6, 12), (7, 12), (10, 12), (11, 12), (12, 12)])
+def test_weight_enumerator_on_both_sides_of_half_the_length(backend, rows, length):
+    # With more than length / 2 independent rows the dual code is enumerated (MacWilliams)
+    rng = random.Random(rows)
+    generator_matrix = [[int(i == j) for j in range(rows)] + [rng.randint(0, 1) for _ in range(length - rows)]
+                        for i in range(rows)]
+    dependent = generator_matrix + [[a ^ b for a, b in zip(generator_matrix[0], generator_matrix[-1])]]
+    for matrix in (generator_matrix, dependent):
+        distribution = pydnacode.weight_enumerator(matrix, backend)
+        assert distribution == reference_distribution(matrix)
+        assert sum(distribution.values()) == 1 << len(matrix)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_weight_enumerator_of_the_readme_code(backend):
+    assert pydnacode.weight_enumerator(README_8_4, backend) == {0: 1, 4: 14, 8: 1}
+    assert pydnacode.weight_enumerator(README_8_4_DEPENDENT, backend) == {0: 2, 4: 28, 8: 2}
+    assert pydnacode.format_weight_enumerator({0: 1, 4: 14, 8: 1}, 8) == "x^0 y^8 + 14x^4 y^4 + x^8 y^0"